@@ -1,4 +1,5 @@
 import multiprocessing
+from typing import Any
 
 # Server Socket
 bind = "0.0.0.0:8080"
@@ -17,3 +18,11 @@ errorlog = "-"
 # Timeout
 timeout = 30
 keepalive = 2
+
+
+# Server Hooks
+def post_fork(server: Any, worker: Any) -> None:
+    # Imported lazily so that the master process never creates a database client that workers would inherit
+    from modules.application.repository import ApplicationRepositoryClient
+
+    ApplicationRepositoryClient.reset_client()
@@ -1,3 +1,5 @@
+from dataclasses import asdict, replace
+
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
@@ -11,8 +13,12 @@ from modules.account.types import (
     ResetPasswordParams,
     UpdateAccountProfileParams,
 )
+from modules.account.workers.account_deletion_cleanup_worker import AccountDeletionCleanupWorker
+from modules.application.application_service import ApplicationService
+from modules.application.errors import WorkerClientConnectionError, WorkerStartError
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.types import CreateOTPParams
+from modules.logger.logger import Logger
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import (
     AccountNotificationPreferences,
@@ -100,4 +106,17 @@ class AccountService:
 
     @staticmethod
     def delete_account(*, account_id: str) -> AccountDeletionResult:
-        return AccountWriter.delete_account(account_id=account_id)
+        account = AccountReader.get_account_by_id(params=AccountSearchByIdParams(id=account_id))
+        deletion_result = AccountWriter.delete_account(account_id=account_id)
+
+        phone_number_data = asdict(account.phone_number) if account.phone_number else None
+        try:
+            cleanup_worker_id = ApplicationService.run_worker_immediately(
+                cls=AccountDeletionCleanupWorker, arguments=(account_id, phone_number_data)
+            )
+        except (WorkerClientConnectionError, WorkerStartError) as err:
+            # The account is deleted either way; its dependent documents are only reclaimed once a cleanup runs
+            Logger.error(message=f"Could not start the cleanup of deleted account {account_id}: {err.message}")
+            return deletion_result
+
+        return replace(deletion_result, cleanup_worker_id=cleanup_worker_id)
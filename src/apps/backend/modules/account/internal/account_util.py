@@ -1,19 +1,18 @@
 from typing import Any
 
-import bcrypt
-
 from modules.account.internal.store.account_model import AccountModel
 from modules.account.types import Account
+from modules.password_hashing.password_hashing_service import PasswordHashingService
 
 
 class AccountUtil:
     @staticmethod
     def hash_password(*, password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        return PasswordHashingService.hash_password(password=password)
 
     @staticmethod
     def compare_password(*, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        return PasswordHashingService.compare_password(password=password, hashed_password=hashed_password)
 
     @staticmethod
     def convert_account_bson_to_account(account_bson: dict[str, Any]) -> Account:
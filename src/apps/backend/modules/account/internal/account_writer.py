@@ -36,8 +36,7 @@ class AccountWriter:
             phone_number=None,
             username=params.username,
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        account_bson = AccountRepository.insert_one_and_return(account_bson)
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
@@ -54,8 +53,7 @@ class AccountWriter:
         account_bson = AccountModel(
             first_name="", hashed_password="", id=None, last_name="", phone_number=phone_number, username=""
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        account_bson = AccountRepository.insert_one_and_return(account_bson)
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
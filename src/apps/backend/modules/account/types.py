@@ -67,6 +67,17 @@ class AccountDeletionResult:
     account_id: str
     deleted_at: datetime
     success: bool
+    cleanup_worker_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class AccountDeletionCleanupProgress:
+    account_id: str
+    tasks_deactivated: int = 0
+    comments_deleted: int = 0
+    otps_expired: int = 0
+    password_reset_tokens_expired: int = 0
+    notification_preferences_deactivated: int = 0
 
 
 @dataclass(frozen=True)
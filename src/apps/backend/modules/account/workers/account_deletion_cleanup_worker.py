@@ -0,0 +1,88 @@
+import asyncio
+from dataclasses import asdict, replace
+from typing import Any, Callable, Dict, Optional
+
+from modules.account.types import AccountDeletionCleanupProgress, PhoneNumber
+from modules.application.types import BaseWorker
+
+# Internal writers rather than the authentication and notification services, which start workers themselves and
+# would import temporal_config while it is still loading this worker
+from modules.authentication.internals.otp.otp_writer import OTPWriter
+from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.comment.comment_service import CommentService
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.internals.account_notification_preferences_writer import AccountNotificationPreferenceWriter
+from modules.task.task_service import TaskService
+
+ACCOUNT_DELETION_CLEANUP_BATCH_SIZE = ConfigService[int].bind(key="accounts.deletion_cleanup.batch_size")
+ACCOUNT_DELETION_CLEANUP_BATCH_INTERVAL_IN_SECONDS = ConfigService[float].bind(
+    key="accounts.deletion_cleanup.batch_interval_in_seconds"
+)
+
+
+class AccountDeletionCleanupWorker(BaseWorker):
+    max_execution_time_in_seconds = 3600
+    # Every step only picks up documents that are still live, so a retried run resumes where the last one stopped
+    max_retries = 3
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        account_id: str = args[0]
+        phone_number_data: Optional[Dict[str, str]] = args[1] if len(args) > 1 else None
+        batch_size = ACCOUNT_DELETION_CLEANUP_BATCH_SIZE.get()
+        progress = AccountDeletionCleanupProgress(account_id=account_id)
+
+        progress = await AccountDeletionCleanupWorker._clean_up_in_batches(
+            progress,
+            "tasks_deactivated",
+            lambda: TaskService.deactivate_tasks_for_account(account_id=account_id, batch_size=batch_size),
+        )
+        progress = await AccountDeletionCleanupWorker._clean_up_in_batches(
+            progress,
+            "comments_deleted",
+            lambda: CommentService.delete_comments_for_account(account_id=account_id, batch_size=batch_size),
+        )
+        if phone_number_data is not None:
+            phone_number = PhoneNumber(**phone_number_data)
+            progress = await AccountDeletionCleanupWorker._clean_up_in_batches(
+                progress,
+                "otps_expired",
+                lambda: OTPWriter.expire_otps_for_phone_number(phone_number=phone_number, batch_size=batch_size),
+            )
+        progress = await AccountDeletionCleanupWorker._clean_up_in_batches(
+            progress,
+            "password_reset_tokens_expired",
+            lambda: PasswordResetTokenWriter.expire_password_reset_tokens_for_account(
+                account_id=account_id, batch_size=batch_size
+            ),
+        )
+        progress = await AccountDeletionCleanupWorker._clean_up_in_batches(
+            progress,
+            "notification_preferences_deactivated",
+            lambda: AccountNotificationPreferenceWriter.deactivate_account_notification_preferences(account_id),
+        )
+
+        Logger.info(message=f"Cleanup of deleted account {account_id} finished: {asdict(progress)}")
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
+
+    @staticmethod
+    async def _clean_up_in_batches(
+        progress: AccountDeletionCleanupProgress, field: str, clean_up_batch: Callable[[], int]
+    ) -> AccountDeletionCleanupProgress:
+        batch_interval_in_seconds = ACCOUNT_DELETION_CLEANUP_BATCH_INTERVAL_IN_SECONDS.get()
+
+        while True:
+            cleaned_up_count, progress = await AccountDeletionCleanupWorker.run_batch(
+                clean_up_batch,
+                progress,
+                lambda progress, cleaned_up_count: replace(
+                    progress, **{field: getattr(progress, field) + cleaned_up_count}
+                ),
+            )
+            if cleaned_up_count == 0:
+                return progress
+
+            await asyncio.sleep(batch_interval_in_seconds)
@@ -1,7 +1,8 @@
-from typing import Any, Tuple, Type
+from typing import Any, List, Optional, Tuple, Type
 
 from modules.application.internal.worker_manager import WorkerManager
-from modules.application.types import BaseWorker, Worker
+from modules.application.repository import ApplicationRepositoryClient
+from modules.application.types import BaseWorker, BulkWorkerResult, DatabaseConnectionPoolStats, Worker
 
 
 class ApplicationService:
@@ -17,6 +18,15 @@ class ApplicationService:
     def run_worker_immediately(*, cls: Type[BaseWorker], arguments: Tuple[Any, ...] = ()) -> str:
         return WorkerManager.run_worker_immediately(cls=cls, arguments=arguments)
 
+    @staticmethod
+    def run_workers_in_bulk(
+        *, cls: Type[BaseWorker], list_of_arguments: List[Tuple[Any, ...]], max_concurrency: Optional[int] = None
+    ) -> List[BulkWorkerResult]:
+        """Start one worker per arguments tuple concurrently; results are returned in the order of the arguments"""
+        return WorkerManager.run_workers_in_bulk(
+            cls=cls, list_of_arguments=list_of_arguments, max_concurrency=max_concurrency
+        )
+
     @staticmethod
     def schedule_worker_as_cron(*, cls: Type[BaseWorker], cron_schedule: str) -> str:
         return WorkerManager.schedule_worker_as_cron(cls=cls, cron_schedule=cron_schedule)
@@ -28,3 +38,7 @@ class ApplicationService:
     @staticmethod
     def terminate_worker(*, worker_id: str) -> None:
         return WorkerManager.terminate_worker(worker_id=worker_id)
+
+    @staticmethod
+    def get_database_connection_pool_stats() -> DatabaseConnectionPoolStats:
+        return ApplicationRepositoryClient.get_pool_stats()
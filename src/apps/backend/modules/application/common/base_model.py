@@ -1,9 +1,14 @@
+import base64
 from dataclasses import asdict, dataclass
+from datetime import datetime
 from typing import Any, Optional, Tuple
 
+from bson import json_util
+from bson.errors import BSONError
+from bson.objectid import ObjectId
 from pymongo.cursor import Cursor
 
-from modules.application.common.types import PaginationParams, SortParams
+from modules.application.common.types import PaginationParams, SortDirection, SortParams
 
 
 @dataclass
@@ -18,14 +23,17 @@ class BaseModel:
 
     @staticmethod
     def calculate_pagination_values(
-        pagination_params: PaginationParams, total_count: int
-    ) -> Tuple[PaginationParams, int, int]:
+        pagination_params: PaginationParams, total_count: Optional[int]
+    ) -> Tuple[PaginationParams, int, Optional[int]]:
         page = pagination_params.page
         size = pagination_params.size
         offset = pagination_params.offset
 
         skip = (page - 1) * size + offset
 
+        if total_count is None:
+            return pagination_params, skip, None
+
         total_pages = (total_count + size - 1) // size if size > 0 else 0
 
         return pagination_params, skip, total_pages
@@ -40,3 +48,45 @@ class BaseModel:
                 ]
             )
         return cursor
+
+    @staticmethod
+    def encode_pagination_cursor(document: dict[str, Any], sort_params: SortParams) -> str:
+        payload = json_util.dumps(
+            {"sort_by": sort_params.sort_by, "value": document.get(sort_params.sort_by), "id": document["_id"]}
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("utf-8")
+
+    @staticmethod
+    def apply_pagination_cursor(filter_query: dict[str, Any], cursor: str, sort_params: SortParams) -> dict[str, Any]:
+        # Seeks past the last document of the previous page on (sort_by, _id), matching apply_sort_params
+        try:
+            payload = json_util.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")))
+        except (BSONError, LookupError, TypeError, ValueError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+        if not isinstance(payload, dict) or payload.get("sort_by") != sort_params.sort_by:
+            raise ValueError("Invalid pagination cursor")
+
+        # The cursor comes from the client, so its values must not carry query operators into the filter
+        value = payload.get("value")
+        if not isinstance(payload.get("id"), ObjectId) or not BaseModel._is_valid_pagination_cursor_value(
+            sort_params.sort_by, value
+        ):
+            raise ValueError("Invalid pagination cursor")
+
+        operator = "$lt" if sort_params.sort_direction == SortDirection.DESC else "$gt"
+
+        return {
+            **filter_query,
+            "$or": [
+                {sort_params.sort_by: {operator: value}},
+                {sort_params.sort_by: value, "_id": {operator: payload["id"]}},
+            ],
+        }
+
+    @staticmethod
+    def _is_valid_pagination_cursor_value(sort_by: str, value: Any) -> bool:
+        # Lists are sorted by timestamps; any other field is still limited to plain scalars
+        if sort_by.endswith("_at"):
+            return isinstance(value, datetime)
+        return isinstance(value, (datetime, float, int, str)) and not isinstance(value, bool)
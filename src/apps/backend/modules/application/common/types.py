@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -10,6 +10,7 @@ class PaginationParams:
     page: int
     size: int
     offset: int = 0
+    cursor: Optional[str] = None
 
 
 class SortDirection(Enum):
@@ -28,6 +29,19 @@ class SortDirection(Enum):
         raise ValueError(f"Invalid sort direction: {value}")
 
 
+class TotalCountMode(Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "false"
+
+    @classmethod
+    def from_string(cls, value: str) -> "TotalCountMode":
+        for member in cls:
+            if member.value == value:
+                return member
+        raise ValueError(f"Invalid total count mode: {value}")
+
+
 @dataclass(frozen=True)
 class SortParams:
     sort_by: str
@@ -38,8 +52,9 @@ class SortParams:
 class PaginationResult(Generic[T]):
     items: List[T]
     pagination_params: PaginationParams
-    total_count: int
-    total_pages: int
+    total_count: Optional[int]
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 UNSET = object()
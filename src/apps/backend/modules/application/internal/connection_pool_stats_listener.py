@@ -0,0 +1,62 @@
+import threading
+
+from pymongo import monitoring
+
+from modules.application.types import DatabaseConnectionPoolStats
+
+
+class ConnectionPoolStatsListener(monitoring.ConnectionPoolListener):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._connections_created = 0
+        self._connections_closed = 0
+        self._connections_checked_out = 0
+        self._check_out_failures = 0
+        self._pools_cleared = 0
+
+    def get_stats(self) -> DatabaseConnectionPoolStats:
+        with self._lock:
+            return DatabaseConnectionPoolStats(
+                check_out_failures=self._check_out_failures,
+                connections_checked_out=self._connections_checked_out,
+                connections_closed=self._connections_closed,
+                connections_created=self._connections_created,
+                open_connections=self._connections_created - self._connections_closed,
+                pools_cleared=self._pools_cleared,
+            )
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self._pools_cleared += 1
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._connections_created += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._connections_closed += 1
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self._check_out_failures += 1
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            self._connections_checked_out += 1
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._connections_checked_out -= 1
@@ -0,0 +1,55 @@
+import asyncio
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """A long-lived asyncio event loop running in a daemon thread, to which sync code submits coroutines"""
+
+    def __init__(self, *, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pid: Optional[int] = None
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run the coroutine on the loop thread and block the calling thread until it completes"""
+        loop = self.get_loop()
+        if self._is_loop_thread(loop):
+            coroutine.close()
+            raise RuntimeError(f"{self.name} cannot wait on its own event loop thread")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        # Threads do not survive fork, so a forked process starts its own loop thread
+        if self._loop is not None and self._pid == os.getpid():
+            return self._loop
+
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = self._start_loop()
+                self._pid = os.getpid()
+            return self._loop
+
+    def _start_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run_loop() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+
+        threading.Thread(target=run_loop, name=self.name, daemon=True).start()
+        started.wait()
+        return loop
+
+    @staticmethod
+    def _is_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
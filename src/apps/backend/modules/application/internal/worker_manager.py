@@ -1,6 +1,7 @@
 import asyncio
+import os
 import uuid
-from typing import Any, Optional, Tuple, Type, cast
+from typing import Any, List, Optional, Tuple, Type, cast
 
 from temporalio.client import Client, WorkflowExecutionStatus, WorkflowHandle
 from temporalio.exceptions import WorkflowAlreadyStartedError
@@ -15,7 +16,8 @@ from modules.application.errors import (
     WorkerNotRegisteredError,
     WorkerStartError,
 )
-from modules.application.types import BaseWorker, Worker
+from modules.application.internal.event_loop_thread import EventLoopThread
+from modules.application.types import BaseWorker, BulkWorkerResult, Worker
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from temporal_config import TemporalConfig
@@ -23,12 +25,18 @@ from temporal_config import TemporalConfig
 
 class WorkerManager:
     CLIENT: Optional[Client] = None
+    # The Temporal client is bound to the loop it connected on, so every call goes through one long-lived loop
+    EVENT_LOOP: EventLoopThread = EventLoopThread(name="temporal-client-event-loop")
+    _client_pid: Optional[int] = None
+    _client_lock: Optional[asyncio.Lock] = None
+    _client_lock_loop: Optional[asyncio.AbstractEventLoop] = None
 
     @staticmethod
     async def _connect_temporal_server() -> None:
         server_address = ConfigService[str].get_value(key="temporal.server_address")
         try:
             WorkerManager.CLIENT = await Client.connect(server_address, retry_config=RetryConfig(max_retries=3))
+            WorkerManager._client_pid = os.getpid()
 
             Logger.info(message=f"Connected to temporal server at {server_address}")
 
@@ -37,8 +45,16 @@ class WorkerManager:
 
     @staticmethod
     async def _get_client() -> Client:
-        if WorkerManager.CLIENT is None:
-            await WorkerManager._connect_temporal_server()
+        if WorkerManager.CLIENT is None or WorkerManager._client_pid != os.getpid():
+            loop = asyncio.get_running_loop()
+            if WorkerManager._client_lock is None or WorkerManager._client_lock_loop is not loop:
+                # Created on the loop thread, which is the only thread that ever awaits it
+                WorkerManager._client_lock = asyncio.Lock()
+                WorkerManager._client_lock_loop = loop
+            async with WorkerManager._client_lock:
+                # Concurrent requests share the connection made by whichever of them got the lock first
+                if WorkerManager.CLIENT is None or WorkerManager._client_pid != os.getpid():
+                    await WorkerManager._connect_temporal_server()
         return cast(
             Client, WorkerManager.CLIENT
         )  # Safe to cast since _connect_temporal_server will throw if connection fails
@@ -76,8 +92,15 @@ class WorkerManager:
         handle = client.get_workflow_handle(worker_id)
         info = await handle.describe()
 
+        progress = None
+        for pending_activity in info.raw_description.pending_activities:
+            if pending_activity.heartbeat_details.payloads:
+                heartbeat_details = await info.data_converter.decode(pending_activity.heartbeat_details.payloads)
+                progress = heartbeat_details[-1]
+
         return Worker(
             id=info.id,
+            progress=progress,
             status=info.status,
             start_time=info.start_time,
             close_time=info.close_time,
@@ -89,6 +112,26 @@ class WorkerManager:
     async def _run_worker_immediately(cls: Type[BaseWorker], arguments: Tuple[Any, ...]) -> str:
         return await WorkerManager._start_worker(cls, arguments)
 
+    @staticmethod
+    async def _run_workers_in_bulk(
+        cls: Type[BaseWorker], list_of_arguments: List[Tuple[Any, ...]], max_concurrency: int
+    ) -> List[BulkWorkerResult]:
+        if not cls in TemporalConfig.WORKERS:
+            raise WorkerNotRegisteredError(worker_name=cls.__name__)
+
+        # Bounds the number of start_workflow RPCs in flight on the shared client
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def start_worker(arguments: Tuple[Any, ...]) -> BulkWorkerResult:
+            async with semaphore:
+                try:
+                    worker_id = await WorkerManager._start_worker(cls, arguments)
+                except RPCError:
+                    return BulkWorkerResult(arguments=arguments, error=WorkerStartError(worker_name=cls.__name__))
+            return BulkWorkerResult(arguments=arguments, worker_id=worker_id)
+
+        return list(await asyncio.gather(*[start_worker(arguments) for arguments in list_of_arguments]))
+
     @staticmethod
     async def _schedule_worker_as_cron(cls: Type[BaseWorker], cron_schedule: str) -> str:
         return await WorkerManager._start_worker(cls, (), cron_schedule)
@@ -128,12 +171,12 @@ class WorkerManager:
 
     @staticmethod
     def connect_temporal_server() -> None:
-        asyncio.run(WorkerManager._connect_temporal_server())
+        WorkerManager.EVENT_LOOP.run(WorkerManager._connect_temporal_server())
 
     @staticmethod
     def get_worker_by_id(*, worker_id: str) -> Worker:
         try:
-            res = asyncio.run(WorkerManager._get_worker_by_id(worker_id=worker_id))
+            res = WorkerManager.EVENT_LOOP.run(WorkerManager._get_worker_by_id(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
@@ -143,17 +186,34 @@ class WorkerManager:
     @staticmethod
     def run_worker_immediately(*, cls: Type[BaseWorker], arguments: Tuple[Any, ...]) -> str:
         try:
-            worker_id = asyncio.run(WorkerManager._run_worker_immediately(cls=cls, arguments=arguments))
+            worker_id = WorkerManager.EVENT_LOOP.run(
+                WorkerManager._run_worker_immediately(cls=cls, arguments=arguments)
+            )
 
         except RPCError:
             raise WorkerStartError(worker_name=cls.__name__)
 
         return worker_id
 
+    @staticmethod
+    def run_workers_in_bulk(
+        *, cls: Type[BaseWorker], list_of_arguments: List[Tuple[Any, ...]], max_concurrency: Optional[int] = None
+    ) -> List[BulkWorkerResult]:
+        if max_concurrency is None:
+            max_concurrency = ConfigService[int].get_value(key="temporal.bulk_dispatch_max_concurrency")
+
+        return WorkerManager.EVENT_LOOP.run(
+            WorkerManager._run_workers_in_bulk(
+                cls=cls, list_of_arguments=list_of_arguments, max_concurrency=max_concurrency
+            )
+        )
+
     @staticmethod
     def schedule_worker_as_cron(*, cls: Type[BaseWorker], cron_schedule: str) -> str:
         try:
-            worker_id = asyncio.run(WorkerManager._schedule_worker_as_cron(cls=cls, cron_schedule=cron_schedule))
+            worker_id = WorkerManager.EVENT_LOOP.run(
+                WorkerManager._schedule_worker_as_cron(cls=cls, cron_schedule=cron_schedule)
+            )
 
         except RPCError:
             raise WorkerStartError(worker_name=cls.__name__)
@@ -163,7 +223,7 @@ class WorkerManager:
     @staticmethod
     def cancel_worker(*, worker_id: str) -> None:
         try:
-            asyncio.run(WorkerManager._cancel_worker(worker_id=worker_id))
+            WorkerManager.EVENT_LOOP.run(WorkerManager._cancel_worker(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
@@ -171,7 +231,7 @@ class WorkerManager:
     @staticmethod
     def terminate_worker(*, worker_id: str) -> None:
         try:
-            asyncio.run(WorkerManager._terminate_worker(worker_id=worker_id))
+            WorkerManager.EVENT_LOOP.run(WorkerManager._terminate_worker(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
@@ -1,35 +1,65 @@
+import os
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
+import bson
 from pymongo import MongoClient
 from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
 from pymongo.server_api import ServerApi
 
+from modules.application.internal.connection_pool_stats_listener import ConnectionPoolStatsListener
+from modules.application.types import DatabaseConnectionPoolStats
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
 
 class ApplicationRepositoryClient:
     _client: Optional[MongoClient] = None
+    _client_pid: Optional[int] = None
+    _pool_stats_listener: ConnectionPoolStatsListener = ConnectionPoolStatsListener()
 
     @classmethod
     def get_client(cls) -> MongoClient:
         connection_caching = ConfigService[bool].get_value(key="mongodb.connection_caching")
 
         if connection_caching:
-            if cls._client is None:
+            # MongoClient is not fork-safe, so a client inherited from a parent process (e.g. the gunicorn master)
+            # is never reused and each worker process lazily creates its own
+            if cls._client is None or cls._client_pid != os.getpid():
                 cls._client = cls._create_client()
+                cls._client_pid = os.getpid()
 
             return cls._client
 
         else:
             return cls._create_client()
 
-    @staticmethod
-    def _create_client() -> MongoClient:
+    @classmethod
+    def reset_client(cls) -> None:
+        """Drop the cached client without closing it, e.g. right after a fork, so the next call creates a new one"""
+        cls._client = None
+        cls._client_pid = None
+        cls._pool_stats_listener = ConnectionPoolStatsListener()
+
+    @classmethod
+    def get_pool_stats(cls) -> DatabaseConnectionPoolStats:
+        return cls._pool_stats_listener.get_stats()
+
+    @classmethod
+    def _create_client(cls) -> MongoClient:
         connection_uri = ConfigService[str].get_value(key="mongodb.uri")
         Logger.info(message=f"connecting to database - {connection_uri}")
-        client = MongoClient(connection_uri, server_api=ServerApi("1"))
+        client = MongoClient(
+            connection_uri,
+            server_api=ServerApi("1"),
+            maxPoolSize=ConfigService[int].get_value(key="mongodb.pool.max_pool_size"),
+            minPoolSize=ConfigService[int].get_value(key="mongodb.pool.min_pool_size"),
+            maxIdleTimeMS=ConfigService[int].get_value(key="mongodb.pool.max_idle_time_ms"),
+            waitQueueTimeoutMS=ConfigService[int].get_value(key="mongodb.pool.wait_queue_timeout_ms"),
+            compressors=ConfigService[list].get_value(key="mongodb.pool.compressors", default=[]),
+            event_listeners=[cls._pool_stats_listener],
+        )
         Logger.info(message=f"connected to database - {connection_uri}")
 
         return client
@@ -37,6 +67,7 @@ class ApplicationRepositoryClient:
 
 class ApplicationRepository(ABC):
     _collection: Optional[Collection] = None
+    _collection_pid: Optional[int] = None
 
     @property
     @abstractmethod
@@ -51,13 +82,54 @@ class ApplicationRepository(ABC):
             database = client.get_database()
             collection = database[cls.collection_name]
 
-            # init hook
-            cls.on_init_collection(collection)
+            # init hook, normally applied once per deploy by scripts/sync_collections.py instead
+            if ConfigService[bool].get_value(key="mongodb.init_collections_on_first_use"):
+                cls.on_init_collection(collection)
 
             cls._collection = collection
+            cls._collection_pid = os.getpid()
+
+        elif cls._collection_pid != os.getpid():
+            # Rebind to this process's client; indexes and validators were already set up by the parent
+            cls._collection = ApplicationRepositoryClient.get_client().get_database()[cls.collection_name]
+            cls._collection_pid = os.getpid()
 
         return cls._collection
 
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
         return False
+
+    @classmethod
+    def sync_collection(cls) -> bool:
+        """Apply the indexes and validator of this repository; safe to run repeatedly"""
+        collection = ApplicationRepositoryClient.get_client().get_database()[cls.collection_name]
+        return cls.on_init_collection(collection)
+
+    @staticmethod
+    def create_ttl_index(collection: Collection, field: str, *, expire_after_seconds: int, name: str) -> None:
+        """Create a TTL index, updating its expiry in place when the index already exists with another one"""
+        try:
+            collection.create_index(field, name=name, expireAfterSeconds=expire_after_seconds)
+        except OperationFailure as e:
+            if e.code != 85:  # IndexOptionsConflict MongoDB error code
+                raise
+            collection.database.command(
+                {"collMod": collection.name, "index": {"name": name, "expireAfterSeconds": expire_after_seconds}}
+            )
+
+    @staticmethod
+    def drop_index_if_exists(collection: Collection, name: str) -> None:
+        try:
+            collection.drop_index(name)
+        except OperationFailure as e:
+            if e.code not in (26, 27):  # NamespaceNotFound and IndexNotFound MongoDB error codes
+                raise
+
+    @classmethod
+    def insert_one_and_return(cls, document: dict[str, Any]) -> dict[str, Any]:
+        """Insert a document and return it as stored, without reading it back from the database"""
+        query = cls.collection().insert_one(document)
+        # Round-trip through BSON so the result matches a find_one (e.g. datetimes truncated to milliseconds)
+        inserted_document: dict[str, Any] = bson.decode(bson.encode({**document, "_id": query.inserted_id}))
+        return inserted_document
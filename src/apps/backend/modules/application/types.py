@@ -1,13 +1,19 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Optional, Type
+from typing import Any, Callable, Optional, Tuple, Type, TypeVar
 
-from temporalio import workflow
+from temporalio import activity, workflow
 from temporalio.client import WorkflowExecutionStatus
 from temporalio.common import RetryPolicy
 
+from modules.application.errors import AppError
+
+BatchResult = TypeVar("BatchResult")
+BatchProgress = TypeVar("BatchProgress")
+
 
 class WorkerPriority(Enum):
     DEFAULT = "DEFAULT"
@@ -42,6 +48,23 @@ class BaseWorker(ABC):
             retry_policy=RetryPolicy(maximum_attempts=self.max_retries),
         )
 
+    @staticmethod
+    async def run_batch(
+        run_batch: Callable[[], BatchResult],
+        progress: BatchProgress,
+        add_to_progress: Callable[[BatchProgress, BatchResult], BatchProgress],
+    ) -> Tuple[BatchResult, BatchProgress]:
+        """
+        Run one batch of blocking work, such as Mongo calls or provider SDKs, off the worker's event loop, add its
+        result to progress and heartbeat the new progress, which get_worker_by_id returns as Worker.progress
+        """
+        result = await asyncio.to_thread(run_batch)
+        progress = add_to_progress(progress, result)
+        if activity.in_activity():
+            activity.heartbeat(progress)
+
+        return result, progress
+
 
 @dataclass(frozen=True)
 class RegisteredWorker:
@@ -57,3 +80,22 @@ class Worker:
     close_time: Optional[datetime]
     task_queue: str
     worker_type: str
+    # Details of the latest heartbeat of the worker's running activity, for workers that report progress
+    progress: Optional[Any] = None
+
+
+@dataclass(frozen=True)
+class BulkWorkerResult:
+    arguments: Tuple[Any, ...]
+    worker_id: Optional[str] = None
+    error: Optional[AppError] = None
+
+
+@dataclass(frozen=True)
+class DatabaseConnectionPoolStats:
+    check_out_failures: int
+    connections_checked_out: int
+    connections_closed: int
+    connections_created: int
+    open_connections: int
+    pools_cleared: int
@@ -11,6 +11,7 @@ from modules.authentication.internals.password_reset_token.password_reset_token_
 from modules.authentication.types import (
     OTP,
     AccessToken,
+    AccessTokenCacheStats,
     AccessTokenPayload,
     CreateOTPParams,
     OTPBasedAuthAccessTokenRequestParams,
@@ -43,6 +44,10 @@ class AuthenticationService:
     def verify_access_token(*, token: str) -> AccessTokenPayload:
         return AccessTokenUtil.verify_access_token(token=token)
 
+    @staticmethod
+    def get_verified_access_token_cache_stats() -> AccessTokenCacheStats:
+        return AccessTokenUtil.get_verified_token_cache_stats()
+
     @staticmethod
     def create_password_reset_token(params: Account) -> PasswordResetToken:
         token = PasswordResetTokenUtil.generate_password_reset_token()
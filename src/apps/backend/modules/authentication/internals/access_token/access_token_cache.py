@@ -0,0 +1,53 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from modules.authentication.types import AccessTokenCacheStats, AccessTokenPayload
+
+
+class AccessTokenCache:
+    def __init__(self, *, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[AccessTokenPayload, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, token: str) -> Optional[AccessTokenPayload]:
+        """Return the payload of a previously verified token, or None if it is unknown or past its expiry"""
+        key = AccessTokenCache._get_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.time():
+                self._entries.pop(key, None)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, token: str, payload: AccessTokenPayload, expires_at: float) -> None:
+        key = AccessTokenCache._get_key(token)
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> AccessTokenCacheStats:
+        with self._lock:
+            return AccessTokenCacheStats(hits=self._hits, misses=self._misses, size=len(self._entries))
+
+    @staticmethod
+    def _get_key(token: str) -> str:
+        # Keying by digest keeps raw bearer tokens out of process memory dumps and bounds the key size
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
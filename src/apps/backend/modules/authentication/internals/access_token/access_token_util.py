@@ -1,18 +1,25 @@
 from datetime import datetime, timedelta
+from typing import Optional
 
 import jwt
 
 from modules.account.types import Account
 from modules.authentication.errors import AccessTokenExpiredError, AccessTokenInvalidError, OTPIncorrectError
-from modules.authentication.types import OTP, AccessToken, AccessTokenPayload, OTPStatus
+from modules.authentication.internals.access_token.access_token_cache import AccessTokenCache
+from modules.authentication.types import OTP, AccessToken, AccessTokenCacheStats, AccessTokenPayload, OTPStatus
 from modules.config.config_service import ConfigService
 
+TOKEN_SIGNING_KEY = ConfigService[str].bind(key="accounts.token_signing_key")
+TOKEN_EXPIRY_DAYS = ConfigService[int].bind(key="accounts.token_expiry_days")
+
 
 class AccessTokenUtil:
+    _verified_token_cache: Optional[AccessTokenCache] = None
+
     @staticmethod
     def generate_access_token(*, account: Account) -> AccessToken:
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
-        jwt_expiry = timedelta(days=ConfigService[int].get_value(key="accounts.token_expiry_days"))
+        jwt_signing_key = TOKEN_SIGNING_KEY.get()
+        jwt_expiry = timedelta(days=TOKEN_EXPIRY_DAYS.get())
         expiry_time = datetime.now() + jwt_expiry
 
         payload = {"account_id": account.id, "exp": expiry_time.timestamp()}
@@ -22,7 +29,12 @@ class AccessTokenUtil:
 
     @staticmethod
     def verify_access_token(*, token: str) -> AccessTokenPayload:
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
+        verified_token_cache = AccessTokenUtil._get_verified_token_cache()
+        cached_payload = verified_token_cache.get(token)
+        if cached_payload is not None:
+            return cached_payload
+
+        jwt_signing_key = TOKEN_SIGNING_KEY.get()
 
         try:
             verified_token = jwt.decode(token, jwt_signing_key, algorithms=["HS256"])
@@ -31,7 +43,23 @@ class AccessTokenUtil:
         except jwt.ExpiredSignatureError:
             raise AccessTokenExpiredError(message="Access token has expired. Please login again.")
 
-        return AccessTokenPayload(account_id=verified_token.get("account_id"))
+        payload = AccessTokenPayload(account_id=verified_token.get("account_id"))
+        if "exp" in verified_token:
+            verified_token_cache.set(token, payload, expires_at=float(verified_token["exp"]))
+
+        return payload
+
+    @staticmethod
+    def get_verified_token_cache_stats() -> AccessTokenCacheStats:
+        return AccessTokenUtil._get_verified_token_cache().get_stats()
+
+    @staticmethod
+    def _get_verified_token_cache() -> AccessTokenCache:
+        if AccessTokenUtil._verified_token_cache is None:
+            AccessTokenUtil._verified_token_cache = AccessTokenCache(
+                max_size=ConfigService[int].get_value(key="accounts.verified_token_cache_size")
+            )
+        return AccessTokenUtil._verified_token_cache
 
     @staticmethod
     def validate_otp_for_access_token(*, otp: OTP) -> None:
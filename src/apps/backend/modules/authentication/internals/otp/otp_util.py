@@ -6,13 +6,19 @@ from modules.authentication.internals.otp.store.otp_model import OTPModel
 from modules.authentication.types import OTP
 from modules.config.config_service import ConfigService
 
+DEFAULT_OTP_CODE = ConfigService[str].bind(key="public.default_otp.code")
+DEFAULT_OTP_ENABLED = ConfigService[bool].bind(key="public.default_otp.enabled", default=False)
+DEFAULT_OTP_WHITELISTED_PHONE_NUMBER = ConfigService[str].bind(
+    key="public.default_otp.whitelisted_phone_number", default=""
+)
+
 
 class OTPUtil:
 
     @staticmethod
     def generate_otp(length: int, phone_number: str) -> str:
         if OTPUtil.should_use_default_otp_for_phone_number(phone_number):
-            default_otp = ConfigService[str].get_value(key="public.default_otp.code")
+            default_otp = DEFAULT_OTP_CODE.get()
             return default_otp
         return "".join(secrets.choice(string.digits) for _ in range(length))
 
@@ -28,19 +34,17 @@ class OTPUtil:
 
     @staticmethod
     def should_use_default_otp_for_phone_number(phone_number: str) -> bool:
-        default_otp_enabled = ConfigService[bool].get_value(key="public.default_otp.enabled", default=False)
+        default_otp_enabled = DEFAULT_OTP_ENABLED.get()
 
         if not default_otp_enabled:
             return False
 
-        has_whitelist_config = ConfigService.has_value(key="public.default_otp.whitelisted_phone_number")
+        has_whitelist_config = DEFAULT_OTP_WHITELISTED_PHONE_NUMBER.has()
 
         if not has_whitelist_config:
             return True
 
-        whitelisted_phone_number = ConfigService[str].get_value(
-            key="public.default_otp.whitelisted_phone_number", default=""
-        )
+        whitelisted_phone_number = DEFAULT_OTP_WHITELISTED_PHONE_NUMBER.get()
 
         if not whitelisted_phone_number:
             return True
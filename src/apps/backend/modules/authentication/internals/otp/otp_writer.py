@@ -1,6 +1,7 @@
 from dataclasses import asdict
+from datetime import datetime
 
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateOne
 
 from modules.account.types import PhoneNumber
 from modules.authentication.errors import OTPExpiredError, OTPIncorrectError
@@ -14,22 +15,53 @@ class OTPWriter:
     @staticmethod
     def expire_previous_otps(phone_number: PhoneNumber) -> None:
         phone_number_dict = asdict(phone_number)
-        previous_otps = OTPRepository.collection().find({"active": True, "phone_number": phone_number_dict})
-        for otp in previous_otps:
-            OTPRepository.collection().update_one(
-                {"_id": otp["_id"]}, {"$set": {"active": False, "status": OTPStatus.EXPIRED}}
+        OTPRepository.collection().update_many(
+            {"phone_number": phone_number_dict, "active": True},
+            {"$set": {"active": False, "status": OTPStatus.EXPIRED}},
+        )
+
+    @staticmethod
+    def expire_otps_for_phone_number(*, phone_number: PhoneNumber, batch_size: int) -> int:
+        """Expire up to batch_size of the phone number's active OTPs and return how many were expired"""
+        otp_ids = [
+            otp_bson["_id"]
+            for otp_bson in OTPRepository.collection()
+            .find({"phone_number": asdict(phone_number), "active": True}, {"_id": 1})
+            .limit(batch_size)
+        ]
+        if not otp_ids:
+            return 0
+
+        expired_count: int = (
+            OTPRepository.collection()
+            .bulk_write(
+                [
+                    UpdateOne({"_id": otp_id, "active": True}, {"$set": {"active": False, "status": OTPStatus.EXPIRED}})
+                    for otp_id in otp_ids
+                ],
+                ordered=False,
             )
+            .modified_count
+        )
+
+        return expired_count
 
     @staticmethod
     def create_new_otp(*, params: CreateOTPParams) -> OTP:
         OTPWriter.expire_previous_otps(phone_number=params.phone_number)
         phone_number = PhoneNumber(**asdict(params)["phone_number"])
         otp_code = OTPUtil.generate_otp(length=4, phone_number=phone_number.phone_number)
+        now = datetime.now()
         otp_bson = OTPModel(
-            active=True, id=None, phone_number=phone_number, otp_code=otp_code, status=str(OTPStatus.PENDING)
+            active=True,
+            id=None,
+            phone_number=phone_number,
+            otp_code=otp_code,
+            status=str(OTPStatus.PENDING),
+            created_at=now,
+            updated_at=now,
         ).to_bson()
-        query = OTPRepository.collection().insert_one(otp_bson)
-        otp_bson = OTPRepository.collection().find_one({"_id": query.inserted_id})
+        otp_bson = OTPRepository.insert_one_and_return(otp_bson)
         return OTPUtil.convert_otp_bson_to_otp(otp_bson)
 
     @staticmethod
@@ -3,6 +3,7 @@ from pymongo.errors import OperationFailure
 
 from modules.application.repository import ApplicationRepository
 from modules.authentication.internals.otp.store.otp_model import OTPModel
+from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
 OTP_VALIDATION_SCHEMA = {
@@ -36,7 +37,18 @@ class OTPRepository(ApplicationRepository):
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
 
-        collection.create_index("phone_number")
+        # The (phone_number, active) index covers every lookup the single field phone_number index served
+        cls.drop_index_if_exists(collection, "phone_number_1")
+        collection.create_index([("phone_number", 1), ("active", 1)], name="phone_number_active_index")
+        collection.create_index(
+            [("phone_number", 1), ("otp_code", 1), ("_id", -1)], name="phone_number_otp_code_id_index"
+        )
+        cls.create_ttl_index(
+            collection,
+            "created_at",
+            expire_after_seconds=ConfigService[int].get_value(key="accounts.otp_ttl_in_seconds"),
+            name="created_at_ttl_index",
+        )
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": OTP_VALIDATION_SCHEMA,
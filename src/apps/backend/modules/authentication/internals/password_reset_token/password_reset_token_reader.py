@@ -1,3 +1,5 @@
+from typing import Any
+
 from bson.objectid import ObjectId
 
 from modules.account.errors import AccountBadRequestError
@@ -21,18 +23,20 @@ class PasswordResetTokenReader:
         except StopIteration:
             raise PasswordResetTokenNotFoundError()
 
-        return PasswordResetToken(
-            id=str(token_data.get("_id")),
-            is_expired=PasswordResetTokenUtil.is_token_expired(token_data.get("expires_at")),
-            account=token_data.get("account"),
-            token=token_data.get("token"),
-            expires_at=token_data.get("expires_at"),
-            is_used=token_data.get("is_used"),
-        )
+        return PasswordResetTokenReader._to_password_reset_token(token_data)
 
     @staticmethod
     def verify_password_reset_token(account_id: str, token: str) -> PasswordResetToken:
-        password_reset_token = PasswordResetTokenReader.get_password_reset_token_by_account_id(account_id)
+        token_data = PasswordResetTokenRepository.collection().find_one(
+            {"account": ObjectId(account_id), "token": PasswordResetTokenUtil.hash_password_reset_token(token)}
+        )
+
+        if token_data is not None:
+            password_reset_token = PasswordResetTokenReader._to_password_reset_token(token_data)
+        else:
+            # Fall back to the latest token so expired/used links are still reported as such and tokens
+            # hashed with bcrypt before the switch to HMAC digests keep working until they expire
+            password_reset_token = PasswordResetTokenReader.get_password_reset_token_by_account_id(account_id)
 
         if password_reset_token.is_expired:
             raise AccountBadRequestError(
@@ -43,8 +47,8 @@ class PasswordResetTokenReader:
                 f"Password reset is already used for accountId {account_id}. Please retry with new link"
             )
 
-        is_token_valid = PasswordResetTokenUtil.compare_password(
-            password=token, hashed_password=password_reset_token.token
+        is_token_valid = token_data is not None or PasswordResetTokenUtil.compare_legacy_password_reset_token(
+            reset_token=token, token_hash=password_reset_token.token
         )
         if not is_token_valid:
             raise AccountBadRequestError(
@@ -52,3 +56,14 @@ class PasswordResetTokenReader:
             )
 
         return password_reset_token
+
+    @staticmethod
+    def _to_password_reset_token(token_data: dict[str, Any]) -> PasswordResetToken:
+        return PasswordResetToken(
+            id=str(token_data["_id"]),
+            is_expired=PasswordResetTokenUtil.is_token_expired(token_data["expires_at"]),
+            account=token_data["account"],
+            token=token_data["token"],
+            expires_at=token_data["expires_at"],
+            is_used=token_data["is_used"],
+        )
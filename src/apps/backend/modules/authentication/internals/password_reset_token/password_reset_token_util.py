@@ -1,26 +1,26 @@
 import hashlib
+import hmac
 import os
 from datetime import datetime, timedelta
 from typing import Any
 
-import bcrypt
-
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
 from modules.authentication.types import PasswordResetToken
 from modules.config.config_service import ConfigService
+from modules.password_hashing.password_hashing_service import PasswordHashingService
 
 
 class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password(password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        return PasswordHashingService.hash_password(password=password)
 
     @staticmethod
     def compare_password(*, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        return PasswordHashingService.compare_password(password=password, hashed_password=hashed_password)
 
     @staticmethod
     def generate_password_reset_token() -> str:
@@ -28,7 +28,18 @@ class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password_reset_token(reset_token: str) -> str:
-        return bcrypt.hashpw(reset_token.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        signing_key = ConfigService[str].get_value(key="accounts.password_reset_token_signing_key")
+        return hmac.new(signing_key.encode("utf-8"), reset_token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def is_legacy_password_reset_token_hash(token_hash: str) -> bool:
+        return token_hash.startswith("$2")
+
+    @staticmethod
+    def compare_legacy_password_reset_token(*, reset_token: str, token_hash: str) -> bool:
+        if not PasswordResetTokenUtil.is_legacy_password_reset_token_hash(token_hash):
+            return False
+        return PasswordResetTokenUtil.compare_password(password=reset_token, hashed_password=token_hash)
 
     @staticmethod
     def get_token_expires_at() -> datetime:
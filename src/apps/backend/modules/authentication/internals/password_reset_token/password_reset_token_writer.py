@@ -1,5 +1,5 @@
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateOne
 
 from modules.authentication.errors import PasswordResetTokenNotFoundError
 from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
@@ -15,16 +15,18 @@ class PasswordResetTokenWriter:
         token_hash = PasswordResetTokenUtil.hash_password_reset_token(token)
         expires_at = PasswordResetTokenUtil.get_token_expires_at()
 
+        # Tokens are looked up by their digest, so earlier links would keep working unless they are used up here
+        PasswordResetTokenRepository.collection().update_many(
+            {"account": ObjectId(account_id), "is_used": False}, {"$set": {"is_used": True}}
+        )
+
         new_token_data = {
             "account": ObjectId(account_id),
             "expires_at": expires_at,
             "token": token_hash,
             "is_used": False,
         }
-        created_token = PasswordResetTokenRepository.collection().insert_one(new_token_data)
-        password_reset_token_bson = PasswordResetTokenRepository.collection().find_one(
-            {"_id": created_token.inserted_id}
-        )
+        password_reset_token_bson = PasswordResetTokenRepository.insert_one_and_return(new_token_data)
 
         return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(
             password_reset_token_bson
@@ -41,3 +43,26 @@ class PasswordResetTokenWriter:
             raise PasswordResetTokenNotFoundError()
 
         return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(updated_token)
+
+    @staticmethod
+    def expire_password_reset_tokens_for_account(*, account_id: str, batch_size: int) -> int:
+        """Mark up to batch_size of the account's unused tokens as used and return how many were marked"""
+        token_ids = [
+            token_bson["_id"]
+            for token_bson in PasswordResetTokenRepository.collection()
+            .find({"account": ObjectId(account_id), "is_used": False}, {"_id": 1})
+            .limit(batch_size)
+        ]
+        if not token_ids:
+            return 0
+
+        expired_count: int = (
+            PasswordResetTokenRepository.collection()
+            .bulk_write(
+                [UpdateOne({"_id": token_id, "is_used": False}, {"$set": {"is_used": True}}) for token_id in token_ids],
+                ordered=False,
+            )
+            .modified_count
+        )
+
+        return expired_count
@@ -5,6 +5,7 @@ from modules.application.repository import ApplicationRepository
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
+from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
 PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA = {
@@ -28,6 +29,16 @@ class PasswordResetTokenRepository(ApplicationRepository):
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
         collection.create_index("token")
+        collection.create_index([("account", 1), ("expires_at", -1)], name="account_expires_at_index")
+        # Expired tokens are kept for a while so that old links still report "expired" instead of "not found"
+        cls.create_ttl_index(
+            collection,
+            "expires_at",
+            expire_after_seconds=ConfigService[int].get_value(
+                key="accounts.password_reset_token_retention_after_expiry_in_seconds"
+            ),
+            name="expires_at_ttl_index",
+        )
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA,
@@ -17,6 +17,13 @@ class AccessTokenPayload:
     account_id: str
 
 
+@dataclass(frozen=True)
+class AccessTokenCacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
 @dataclass(frozen=True)
 class EmailBasedAuthAccessTokenRequestParams:
     password: str
@@ -1,3 +1,4 @@
+from modules.application.common.types import PaginationResult
 from modules.comment.internal.comment_reader import CommentReader
 from modules.comment.internal.comment_writer import CommentWriter
 from modules.comment.types import (
@@ -6,6 +7,7 @@ from modules.comment.types import (
     CreateCommentParams,
     DeleteCommentParams,
     GetCommentParams,
+    GetPaginatedCommentsParams,
     UpdateCommentParams,
 )
 
@@ -19,6 +21,10 @@ class CommentService:
     def get_comment(*, params: GetCommentParams) -> Comment:
         return CommentReader.get_comment(params=params)
 
+    @staticmethod
+    def get_paginated_comments(*, params: GetPaginatedCommentsParams) -> PaginationResult[Comment]:
+        return CommentReader.get_paginated_comments(params=params)
+
     @staticmethod
     def update_comment(*, params: UpdateCommentParams) -> Comment:
         return CommentWriter.update_comment(params=params)
@@ -26,3 +32,7 @@ class CommentService:
     @staticmethod
     def delete_comment(*, params: DeleteCommentParams) -> CommentDeletionResult:
         return CommentWriter.delete_comment(params=params)
+
+    @staticmethod
+    def delete_comments_for_account(*, account_id: str, batch_size: int) -> int:
+        return CommentWriter.delete_comments_for_account(account_id=account_id, batch_size=batch_size)
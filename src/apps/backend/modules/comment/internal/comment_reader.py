@@ -1,9 +1,16 @@
+from typing import Optional
+
 from bson.objectid import ObjectId
 
-from modules.comment.errors import CommentNotFoundError
+from modules.application.common.base_model import BaseModel
+from modules.application.common.types import PaginationResult, SortDirection, SortParams, TotalCountMode
+from modules.comment.errors import CommentBadRequestError, CommentNotFoundError
 from modules.comment.internal.comment_util import CommentUtil
 from modules.comment.internal.store.comment_repository import CommentRepository
-from modules.comment.types import Comment, GetCommentParams
+from modules.comment.types import Comment, GetCommentParams, GetPaginatedCommentsParams
+from modules.task.internal.store.task_repository import TaskRepository
+
+DEFAULT_COMMENT_SORT_PARAMS = SortParams(sort_by="created_at", sort_direction=SortDirection.ASC)
 
 
 class CommentReader:
@@ -15,3 +22,55 @@ class CommentReader:
         if comment_bson is None:
             raise CommentNotFoundError(comment_id=params.comment_id)
         return CommentUtil.convert_comment_bson_to_comment(comment_bson)
+
+    @staticmethod
+    def get_paginated_comments(*, params: GetPaginatedCommentsParams) -> PaginationResult[Comment]:
+        # Comments are only filtered by task, so the task has to be checked to belong to the account
+        task_bson = TaskRepository.collection().find_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True}, {"_id": 1}
+        )
+        if task_bson is None:
+            raise CommentNotFoundError(comment_id=params.task_id)
+
+        filter_query = {"task_id": str(params.task_id)}
+        sort_params = DEFAULT_COMMENT_SORT_PARAMS
+        total_count = CommentReader._get_total_count(task_id=params.task_id, mode=params.total_count_mode)
+        pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
+            params.pagination_params, total_count
+        )
+
+        if pagination_params.cursor:
+            try:
+                filter_query = BaseModel.apply_pagination_cursor(filter_query, pagination_params.cursor, sort_params)
+            except ValueError:
+                raise CommentBadRequestError("Invalid pagination cursor")
+            skip = 0
+
+        cursor = CommentRepository.collection().find(filter_query)
+        cursor = BaseModel.apply_sort_params(cursor, sort_params)
+
+        # Only the page plus one look-ahead document is read, in a single batch, to know whether a next page exists
+        page_size = pagination_params.size + 1
+        comments_bson = list(cursor.skip(skip).limit(page_size).batch_size(page_size))
+        next_cursor = None
+        if len(comments_bson) > pagination_params.size > 0:
+            comments_bson = comments_bson[: pagination_params.size]
+            next_cursor = BaseModel.encode_pagination_cursor(comments_bson[-1], sort_params)
+
+        comments = [CommentUtil.convert_comment_bson_to_comment(comment_bson) for comment_bson in comments_bson]
+        return PaginationResult(
+            items=comments,
+            pagination_params=pagination_params,
+            total_count=total_count,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _get_total_count(*, task_id: str, mode: TotalCountMode) -> Optional[int]:
+        if mode == TotalCountMode.NONE:
+            return None
+
+        # Comments have no maintained counter, so an estimated count is the exact one, counted on the task_id index
+        total_count: int = CommentRepository.collection().count_documents({"task_id": str(task_id)})
+        return total_count
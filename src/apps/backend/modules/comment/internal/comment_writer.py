@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
+from pymongo import DeleteOne, ReturnDocument, UpdateOne
 
 from modules.comment.errors import CommentNotFoundError
 from modules.comment.internal.comment_util import CommentUtil
@@ -20,18 +20,25 @@ from modules.task.internal.store.task_repository import TaskRepository
 class CommentWriter:
     @staticmethod
     def create_comment(*, params: CreateCommentParams) -> Comment:
-        if TaskRepository.collection().find_one({"_id": ObjectId(params.task_id)}) is None:
-            raise CommentNotFoundError(comment_id=params.task_id)
+        now = datetime.now()
         comment_bson = CommentModel(
             account_id=str(params.account_id),
             task_id=str(params.task_id),
             text=params.text,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         ).to_bson()
 
-        query = CommentRepository.collection().insert_one(comment_bson)
-        created_comment_bson = CommentRepository.collection().find_one({"_id": query.inserted_id})
+        created_comment_bson = CommentRepository.insert_one_and_return(comment_bson)
+
+        # Counted only once the comment is stored; the update doubles as the task existence check, so a comment
+        # costs one task round trip
+        task_update_result = TaskRepository.collection().update_one(
+            {"_id": ObjectId(params.task_id)}, {"$inc": {"comment_count": 1}, "$max": {"last_commented_at": now}}
+        )
+        if task_update_result.matched_count == 0:
+            CommentRepository.collection().delete_one({"_id": created_comment_bson["_id"]})
+            raise CommentNotFoundError(comment_id=params.task_id)
 
         return CommentUtil.convert_comment_bson_to_comment(created_comment_bson)
 
@@ -55,4 +62,51 @@ class CommentWriter:
         )
         if result.deleted_count == 0:
             raise CommentNotFoundError(comment_id=params.comment_id)
+        # last_commented_at records the latest comment activity and is not moved back; the repair worker resets it
+        TaskRepository.collection().update_one({"_id": ObjectId(params.task_id)}, {"$inc": {"comment_count": -1}})
         return CommentDeletionResult(comment_id=params.comment_id, deleted_at=datetime.now(), success=True)
+
+    @staticmethod
+    def delete_comments_for_account(*, account_id: str, batch_size: int) -> int:
+        """
+        Delete up to batch_size of the account's comments, take them off their tasks' comment_count, and return how
+        many were deleted
+        """
+        comment_batches = list(
+            CommentRepository.collection().aggregate(
+                [
+                    {"$match": {"account_id": account_id}},
+                    {"$limit": batch_size},
+                    {"$group": {"_id": "$task_id", "comment_ids": {"$push": "$_id"}, "comment_count": {"$sum": 1}}},
+                ]
+            )
+        )
+        if not comment_batches:
+            return 0
+
+        deleted_count: int = (
+            CommentRepository.collection()
+            .bulk_write(
+                [
+                    DeleteOne({"_id": comment_id})
+                    for comment_batch in comment_batches
+                    for comment_id in comment_batch["comment_ids"]
+                ],
+                ordered=False,
+            )
+            .deleted_count
+        )
+
+        task_requests = [
+            UpdateOne(
+                {"_id": ObjectId(comment_batch["_id"])}, {"$inc": {"comment_count": -comment_batch["comment_count"]}}
+            )
+            for comment_batch in comment_batches
+            if ObjectId.is_valid(comment_batch["_id"])
+        ]
+        if task_requests:
+            # A comment deleted by delete_comment in between is decremented twice; TaskCommentCounterRepairWorker
+            # corrects that drift
+            TaskRepository.collection().bulk_write(task_requests, ordered=False)
+
+        return deleted_count
@@ -11,7 +11,11 @@ class CommentRepository(ApplicationRepository):
 
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index([("task_id", 1)], name="task_id_index")
+        # Serves both the task_id lookups and the keyset-paginated comment list of a task without an in-memory sort
+        collection.create_index([("task_id", 1), ("created_at", 1), ("_id", 1)], name="task_id_created_at_id_index")
+        cls.drop_index_if_exists(collection, "task_id_index")
+        # Lets the cleanup of a deleted account find its comments without a collection scan
+        collection.create_index("account_id", name="account_id_index")
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": {
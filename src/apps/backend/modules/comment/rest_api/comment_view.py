@@ -1,24 +1,69 @@
+from dataclasses import asdict
+from typing import Optional
+
 from flask import jsonify, request
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
+from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
+from modules.application.common.types import PaginationParams, TotalCountMode
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
 from modules.comment.comment_service import CommentService
 from modules.comment.errors import CommentBadRequestError
 from modules.comment.internal.comment_util import CommentUtil
-from modules.comment.types import CreateCommentParams, DeleteCommentParams, GetCommentParams, UpdateCommentParams
+from modules.comment.types import (
+    CreateCommentParams,
+    DeleteCommentParams,
+    GetCommentParams,
+    GetPaginatedCommentsParams,
+    UpdateCommentParams,
+)
 
 
 class CommentView(MethodView):
     @access_auth_middleware
-    def get(self, account_id: str, task_id: str, comment_id: str) -> ResponseReturnValue:
+    def get(self, account_id: str, task_id: str, comment_id: Optional[str] = None) -> ResponseReturnValue:
         if comment_id:
             comment_params = GetCommentParams(account_id=account_id, task_id=task_id, comment_id=comment_id)
             comment = CommentService.get_comment(params=comment_params)
             comment_dict = CommentUtil.comment_to_dict(comment)
             return jsonify(comment_dict), 200
         else:
-            raise CommentBadRequestError("Comment ID is required for fetching a specific comment")
+            page = request.args.get("page", type=int)
+            size = request.args.get("size", type=int)
+            cursor = request.args.get("cursor")
+            include_total = request.args.get("include_total", TotalCountMode.EXACT.value)
+
+            if page is not None and page < 1:
+                raise CommentBadRequestError("Page must be greater than 0")
+
+            if size is not None and size < 1:
+                raise CommentBadRequestError("Size must be greater than 0")
+
+            try:
+                total_count_mode = TotalCountMode.from_string(include_total.lower())
+            except ValueError:
+                raise CommentBadRequestError("include_total must be one of: exact, estimated, false")
+
+            if page is None:
+                page = DEFAULT_PAGINATION_PARAMS.page
+            if size is None:
+                size = DEFAULT_PAGINATION_PARAMS.size
+
+            pagination_params = PaginationParams(page=page, size=size, offset=0, cursor=cursor or None)
+            comments_params = GetPaginatedCommentsParams(
+                account_id=account_id,
+                task_id=task_id,
+                pagination_params=pagination_params,
+                total_count_mode=total_count_mode,
+            )
+
+            pagination_result = CommentService.get_paginated_comments(params=comments_params)
+
+            response_data = asdict(pagination_result)
+            response_data["items"] = [CommentUtil.comment_to_dict(comment) for comment in pagination_result.items]
+
+            return jsonify(response_data), 200
 
     @access_auth_middleware
     def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
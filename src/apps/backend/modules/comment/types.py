@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from modules.application.common.types import PaginationParams, TotalCountMode
+
 
 @dataclass(frozen=True)
 class Comment:
@@ -41,6 +43,14 @@ class GetCommentParams:
     comment_id: str
 
 
+@dataclass(frozen=True)
+class GetPaginatedCommentsParams:
+    account_id: str
+    task_id: str
+    pagination_params: PaginationParams
+    total_count_mode: TotalCountMode = TotalCountMode.EXACT
+
+
 @dataclass(frozen=True)
 class CommentErrorCode:
     NOT_FOUND: str = "COMMENT_ERR_01"
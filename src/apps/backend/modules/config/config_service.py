@@ -1,4 +1,4 @@
-from typing import Generic, Optional, cast
+from typing import Generic, Optional, Tuple, cast
 
 from modules.config.errors import MissingKeyError
 from modules.config.internals.config_manager import ConfigManager
@@ -18,3 +18,35 @@ class ConfigService(Generic[ConfigType]):
     @classmethod
     def has_value(cls, key: str) -> bool:
         return cls.config_manager.has(key)
+
+    @classmethod
+    def bind(cls, key: str, default: Optional[ConfigType] = None) -> "ConfigValue[ConfigType]":
+        return ConfigValue[ConfigType](key=key, default=default)
+
+
+class ConfigValue(Generic[ConfigType]):
+    """A config key bound once, whose value is only looked up again if the config manager is replaced"""
+
+    def __init__(self, *, key: str, default: Optional[ConfigType] = None) -> None:
+        self.key = key
+        self.default = default
+        self._resolved: Optional[Tuple[ConfigManager, Optional[ConfigType]]] = None
+
+    def get(self) -> ConfigType:
+        value = self._resolve()
+        if value is None:
+            value = self.default
+        if value is None:
+            raise MissingKeyError(missing_key=self.key, error_code=ErrorCode.MISSING_KEY)
+        return value
+
+    def has(self) -> bool:
+        return self._resolve() is not None
+
+    def _resolve(self) -> Optional[ConfigType]:
+        config_manager = ConfigService.config_manager
+        resolved = self._resolved
+        if resolved is None or resolved[0] is not config_manager:
+            resolved = (config_manager, config_manager.get(self.key))
+            self._resolved = resolved
+        return resolved[1]
@@ -1,10 +1,11 @@
-from typing import Optional, cast
+from types import MappingProxyType
+from typing import Mapping, Optional, cast
 
 from modules.config.internals.config_files.app_env_config_file import AppEnvConfig
 from modules.config.internals.config_files.custom_env_config_file import CustomEnvConfig
 from modules.config.internals.config_files.default_config_file import DefaultConfig
 from modules.config.internals.config_utils import ConfigUtil
-from modules.config.internals.types import Config
+from modules.config.internals.types import AllowedConfigValueTypes, Config
 from modules.config.types import ConfigType
 
 
@@ -20,25 +21,14 @@ class ConfigManager:
         merged_content = ConfigUtil.deep_merge(default_content, app_env_content, os_env_content)
 
         self.config_store: Config = merged_content
+        # Dotted key -> value index built once at load time, so reads never split keys or walk nested dicts
+        self.config_index: Mapping[str, AllowedConfigValueTypes] = MappingProxyType(
+            ConfigUtil.flatten_config(merged_content, self.CONFIG_KEY_SEPARATOR)
+        )
 
     def get(self, key: str, default: Optional[ConfigType] = None) -> Optional[ConfigType]:
-        value = self._traverse_config(key)
-        return value if value is not None else default
+        value = self.config_index.get(key)
+        return cast(ConfigType, value) if value is not None else default
 
     def has(self, key: str) -> bool:
-        return self._traverse_config(key) is not None
-
-    def _traverse_config(self, key: str) -> Optional[ConfigType]:
-        values = self.config_store
-        for k in key.split(self.CONFIG_KEY_SEPARATOR):
-            if not isinstance(values, dict) or k not in values:
-                return None
-
-            next_values = values[k]
-
-            if not isinstance(next_values, dict):
-                return cast(ConfigType, next_values)
-
-            values = next_values
-
-        return cast(ConfigType, values)
+        return self.config_index.get(key) is not None
@@ -4,7 +4,7 @@ from typing import Any, cast
 
 import yaml
 
-from modules.config.internals.types import Config
+from modules.config.internals.types import AllowedConfigValueTypes, Config
 
 
 class ConfigUtil:
@@ -24,6 +24,19 @@ class ConfigUtil:
 
         return merged_config
 
+    @staticmethod
+    def flatten_config(config: Config, separator: str, prefix: str = "") -> dict[str, AllowedConfigValueTypes]:
+        # Every intermediate path is indexed too, so that lookups of nested sections keep returning the whole dict
+        flattened_config: dict[str, AllowedConfigValueTypes] = {}
+
+        for key, value in config.items():
+            flattened_key = f"{prefix}{separator}{key}" if prefix else str(key)
+            flattened_config[flattened_key] = value
+            if isinstance(value, dict):
+                flattened_config.update(ConfigUtil.flatten_config(cast(Config, value), separator, flattened_key))
+
+        return flattened_config
+
     @staticmethod
     def read_yml_from_config_dir(filename: str) -> dict[str, Any]:
         config_path = ConfigUtil._get_base_config_directory(ConfigUtil.CURRENT_FILE)
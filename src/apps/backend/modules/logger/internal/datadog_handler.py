@@ -1,18 +1,27 @@
 import logging
 import os
 from logging import LogRecord, StreamHandler
+from typing import Optional
 
-from datadog_api_client import ApiClient, Configuration
-from datadog_api_client.v2.api.logs_api import LogsApi
-from datadog_api_client.v2.models import HTTPLog, HTTPLogItem
+from datadog_api_client.v2.models import HTTPLogItem
 
 from modules.config.config_service import ConfigService
+from modules.logger.internal.datadog_log_shipper import DatadogLogShipper
+from modules.logger.internal.types import DatadogLogShipperStats
+
+DATADOG_API_KEY = ConfigService[str].bind(key="datadog.api_key")
+DATADOG_SITE_NAME = ConfigService[str].bind(key="datadog.site_name")
+DATADOG_APP_NAME = ConfigService[str].bind(key="datadog.app_name")
+DATADOG_SHIPPER_MAX_QUEUE_SIZE = ConfigService[int].bind(key="datadog.shipper.max_queue_size")
+DATADOG_SHIPPER_MAX_BATCH_SIZE = ConfigService[int].bind(key="datadog.shipper.max_batch_size")
+DATADOG_SHIPPER_FLUSH_INTERVAL = ConfigService[float].bind(key="datadog.shipper.flush_interval_in_seconds")
 
 
 class DatadogHandler(StreamHandler):
     def __init__(self, ddsource: str) -> None:
         StreamHandler.__init__(self)
         self.ddsource = ddsource
+        self.shipper: Optional[DatadogLogShipper] = None
 
     def __get_status(self, record: LogRecord) -> str:
         if record.levelno in [logging.NOTSET, logging.DEBUG, logging.INFO]:
@@ -24,26 +33,32 @@ class DatadogHandler(StreamHandler):
 
     def emit(self, record: LogRecord) -> None:
         msg = self.format(record)
-        datadog_api_key = ConfigService[str].get_value(key="datadog.api_key")
-        datadog_host = ConfigService[str].get_value(key="datadog.site_name")
-        data_app_name = ConfigService[str].get_value(key="datadog.app_name")
-        config = Configuration()
-        config.api_key["apiKeyAuth"] = datadog_api_key
-        config.server_variables["site"] = datadog_host
-        config.debug = True
-        with ApiClient(config) as api_client:
-            api_instance = LogsApi(api_client)
-            body = HTTPLog(
-                [
-                    HTTPLogItem(
-                        ddsource=self.ddsource,
-                        ddtags=f"env : {os.environ.get('APP_NAME')}",
-                        hostname="",
-                        message=msg,
-                        service=data_app_name,
-                        status=self.__get_status(record=record),
-                    )
-                ]
+        item = HTTPLogItem(
+            ddsource=self.ddsource,
+            ddtags=f"env : {os.environ.get('APP_NAME')}",
+            hostname="",
+            message=msg,
+            service=DATADOG_APP_NAME.get(),
+            status=self.__get_status(record=record),
+        )
+        self.get_shipper().enqueue(item)
+
+    def close(self) -> None:
+        # logging.shutdown closes every handler at interpreter exit, which flushes the queued records
+        if self.shipper is not None:
+            self.shipper.shutdown()
+        StreamHandler.close(self)
+
+    def get_shipper(self) -> DatadogLogShipper:
+        if self.shipper is None:
+            self.shipper = DatadogLogShipper(
+                api_key=DATADOG_API_KEY.get(),
+                site_name=DATADOG_SITE_NAME.get(),
+                max_queue_size=DATADOG_SHIPPER_MAX_QUEUE_SIZE.get(),
+                max_batch_size=DATADOG_SHIPPER_MAX_BATCH_SIZE.get(),
+                flush_interval_in_seconds=DATADOG_SHIPPER_FLUSH_INTERVAL.get(),
             )
+        return self.shipper
 
-            api_instance.submit_log(body)
+    def get_stats(self) -> DatadogLogShipperStats:
+        return self.get_shipper().get_stats()
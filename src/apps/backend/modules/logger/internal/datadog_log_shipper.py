@@ -0,0 +1,135 @@
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Optional
+
+from datadog_api_client import ApiClient, Configuration
+from datadog_api_client.v2.api.logs_api import LogsApi
+from datadog_api_client.v2.models import HTTPLog, HTTPLogItem
+
+from modules.logger.internal.types import DatadogLogShipperStats
+
+STOP_POLL_INTERVAL_IN_SECONDS = 0.1
+
+
+class DatadogLogShipper:
+    """Ships log items to Datadog in batches from a background thread, so that emitting a log never blocks"""
+
+    def __init__(
+        self,
+        *,
+        api_key: str,
+        site_name: str,
+        max_queue_size: int,
+        max_batch_size: int,
+        flush_interval_in_seconds: float,
+    ) -> None:
+        self.api_key = api_key
+        self.site_name = site_name
+        self.max_batch_size = max_batch_size
+        self.flush_interval_in_seconds = flush_interval_in_seconds
+        self._queue: "queue.Queue[HTTPLogItem]" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._shipped_items = 0
+        self._dropped_items = 0
+        self._failed_items = 0
+
+    def enqueue(self, item: HTTPLogItem) -> bool:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # Drop the newest item rather than making the caller wait for the shipper to catch up
+            with self._lock:
+                self._dropped_items += 1
+            return False
+        return True
+
+    def shutdown(self, timeout_in_seconds: float = 5.0) -> None:
+        """Flush everything queued so far and stop the background thread"""
+        thread = self._thread
+        if thread is None or self._pid != os.getpid():
+            return
+        self._stop_event.set()
+        thread.join(timeout=timeout_in_seconds)
+        self._thread = None
+
+    def get_stats(self) -> DatadogLogShipperStats:
+        with self._lock:
+            return DatadogLogShipperStats(
+                dropped_items=self._dropped_items,
+                failed_items=self._failed_items,
+                queued_items=self._queue.qsize(),
+                shipped_items=self._shipped_items,
+            )
+
+    def _ensure_started(self) -> None:
+        # Threads do not survive fork, so a forked worker process starts its own shipper thread
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            if self._pid is not None and self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+            self._pid = os.getpid()
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="datadog-log-shipper", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        configuration = Configuration()
+        configuration.api_key["apiKeyAuth"] = self.api_key
+        configuration.server_variables["site"] = self.site_name
+
+        with ApiClient(configuration) as api_client:
+            logs_api = LogsApi(api_client)
+            while not self._stop_event.is_set():
+                batch = self._collect_batch()
+                if batch:
+                    self._submit_batch(logs_api, batch)
+
+            # Flush every record accepted before shutdown
+            batch = self._drain_batch()
+            while batch:
+                self._submit_batch(logs_api, batch)
+                batch = self._drain_batch()
+
+    def _collect_batch(self) -> list[HTTPLogItem]:
+        batch: list[HTTPLogItem] = []
+        deadline = time.monotonic() + self.flush_interval_in_seconds
+        while len(batch) < self.max_batch_size and not self._stop_event.is_set():
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=min(remaining_time, STOP_POLL_INTERVAL_IN_SECONDS)))
+            except queue.Empty:
+                continue
+        return batch
+
+    def _drain_batch(self) -> list[HTTPLogItem]:
+        batch: list[HTTPLogItem] = []
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _submit_batch(self, logs_api: LogsApi, batch: list[HTTPLogItem]) -> None:
+        try:
+            logs_api.submit_log(HTTPLog(batch))
+        except Exception as e:
+            # Reporting through the logger would feed the failure back into this shipper
+            print(f"Failed to ship {len(batch)} log items to Datadog: {e}", file=sys.stderr)
+            with self._lock:
+                self._failed_items += len(batch)
+            return
+        with self._lock:
+            self._shipped_items += len(batch)
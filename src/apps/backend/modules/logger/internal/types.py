@@ -5,3 +5,11 @@ from dataclasses import dataclass
 class LoggerTransports:
     CONSOLE: str = "console"
     DATADOG: str = "datadog"
+
+
+@dataclass(frozen=True)
+class DatadogLogShipperStats:
+    dropped_items: int
+    failed_items: int
+    queued_items: int
+    shipped_items: int
@@ -1,14 +1,22 @@
+from dataclasses import replace
+from typing import List
+
+from modules.application.application_service import ApplicationService
+from modules.application.types import BulkWorkerResult
 from modules.logger.logger import Logger
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.internals.sendgrid_service import SendGridService
-from modules.notification.types import SendEmailParams
+from modules.notification.internals.notification_dispatch_util import NotificationDispatchUtil
+from modules.notification.internals.notification_dispatcher import NotificationDispatcher
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.types import NotificationChannel, SendBulkEmailParams, SendEmailParams
+from modules.notification.workers.bulk_notification_worker import BulkNotificationWorker
 
 
 class EmailService:
     @staticmethod
     def send_email_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendEmailParams) -> None:
         if not bypass_preferences:
-            preferences = AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(
+            preferences = AccountNotificationPreferenceReader.get_cached_account_notification_preferences_by_account_id(
                 account_id
             )
             if not preferences.email_enabled:
@@ -19,4 +27,27 @@ class EmailService:
                 )
                 return
 
-        return SendGridService.send_email(params)
+        # Invalid params are rejected here, since the worker would only fail and retry on them
+        EmailParams.validate(params)
+
+        NotificationDispatcher.dispatch(
+            channel=NotificationChannel.EMAIL.value,
+            payload=NotificationDispatchUtil.convert_send_email_params_to_payload(params),
+        )
+
+    @staticmethod
+    def send_bulk_email(*, params: SendBulkEmailParams) -> List[BulkWorkerResult]:
+        EmailParams.validate_bulk(params)
+
+        return ApplicationService.run_workers_in_bulk(
+            cls=BulkNotificationWorker,
+            list_of_arguments=[
+                (
+                    NotificationChannel.EMAIL.value,
+                    NotificationDispatchUtil.convert_send_bulk_email_params_to_payload(
+                        replace(params, recipients=list(recipients))
+                    ),
+                )
+                for recipients in NotificationDispatchUtil.split_recipients_per_worker(params.recipients)
+            ],
+        )
@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from modules.notification.types import AccountNotificationPreferences, AccountNotificationPreferencesCacheStats
+
+
+class AccountNotificationPreferencesCache:
+    """
+    In-memory LRU cache local to one process. Invalidations do not reach other processes, so the TTL bounds how long
+    they can serve stale preferences
+    """
+
+    def __init__(self, *, max_size: int, ttl_in_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_in_seconds = ttl_in_seconds
+        self._entries: "OrderedDict[str, Tuple[AccountNotificationPreferences, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, account_id: str) -> Optional[AccountNotificationPreferences]:
+        """Return the cached preferences of an account, or None if they are unknown or older than the TTL"""
+        with self._lock:
+            return self._get(account_id, time.monotonic())
+
+    def get_many(self, account_ids: List[str]) -> Dict[str, AccountNotificationPreferences]:
+        """Return the cached preferences of the given accounts, omitting the ones that are not cached"""
+        now = time.monotonic()
+        preferences_by_account_id: Dict[str, AccountNotificationPreferences] = {}
+        with self._lock:
+            for account_id in account_ids:
+                preferences = self._get(account_id, now)
+                if preferences is not None:
+                    preferences_by_account_id[account_id] = preferences
+        return preferences_by_account_id
+
+    def set(self, preferences: AccountNotificationPreferences) -> None:
+        with self._lock:
+            self._set(preferences, time.monotonic() + self.ttl_in_seconds)
+
+    def set_many(self, list_of_preferences: List[AccountNotificationPreferences]) -> None:
+        expires_at = time.monotonic() + self.ttl_in_seconds
+        with self._lock:
+            for preferences in list_of_preferences:
+                self._set(preferences, expires_at)
+
+    def invalidate(self, account_id: str) -> None:
+        with self._lock:
+            self._entries.pop(account_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> AccountNotificationPreferencesCacheStats:
+        with self._lock:
+            return AccountNotificationPreferencesCacheStats(
+                hits=self._hits, misses=self._misses, size=len(self._entries)
+            )
+
+    def _get(self, account_id: str, now: float) -> Optional[AccountNotificationPreferences]:
+        entry = self._entries.get(account_id)
+        if entry is None or entry[1] <= now:
+            self._entries.pop(account_id, None)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(account_id)
+        self._hits += 1
+        return entry[0]
+
+    def _set(self, preferences: AccountNotificationPreferences, expires_at: float) -> None:
+        self._entries[preferences.account_id] = (preferences, expires_at)
+        self._entries.move_to_end(preferences.account_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
 from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
 from modules.notification.internals.store.account_notification_preferences_repository import (
@@ -19,3 +21,47 @@ class AccountNotificationPreferenceReader:
         return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
             notification_preferences
         )
+
+    @staticmethod
+    def get_cached_account_notification_preferences_by_account_id(account_id: str) -> AccountNotificationPreferences:
+        """
+        Serve from this process's preferences cache. AccountNotificationPreferenceWriter only invalidates the copy in
+        the process that made the update, so other processes can serve the old preferences for up to
+        notification.preferences_cache.ttl_in_seconds after an opt-in or opt-out
+        """
+        preferences_cache = AccountNotificationPreferenceUtil.get_preferences_cache()
+        preferences = preferences_cache.get(account_id)
+        if preferences is None:
+            preferences = AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(
+                account_id
+            )
+            preferences_cache.set(preferences)
+
+        return preferences
+
+    @staticmethod
+    def get_account_notification_preferences_by_account_ids(
+        account_ids: List[str],
+    ) -> Dict[str, AccountNotificationPreferences]:
+        """Resolve preferences for a batch of accounts with at most one query; accounts without preferences are omitted"""
+        preferences_cache = AccountNotificationPreferenceUtil.get_preferences_cache()
+        preferences_by_account_id = preferences_cache.get_many(account_ids)
+
+        missing_account_ids = list(set(account_ids) - preferences_by_account_id.keys())
+        if not missing_account_ids:
+            return preferences_by_account_id
+
+        list_of_preferences = [
+            AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+                notification_preferences
+            )
+            for notification_preferences in AccountNotificationPreferencesRepository.collection().find(
+                {"account_id": {"$in": missing_account_ids}, "active": True}
+            )
+        ]
+        preferences_cache.set_many(list_of_preferences)
+
+        for preferences in list_of_preferences:
+            preferences_by_account_id[preferences.account_id] = preferences
+
+        return preferences_by_account_id
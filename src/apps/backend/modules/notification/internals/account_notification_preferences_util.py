@@ -1,5 +1,7 @@
-from typing import Any
+from typing import Any, Optional
 
+from modules.config.config_service import ConfigService
+from modules.notification.internals.account_notification_preferences_cache import AccountNotificationPreferencesCache
 from modules.notification.internals.store.account_notification_preferences_model import (
     AccountNotificationPreferencesModel,
 )
@@ -7,6 +9,17 @@ from modules.notification.types import AccountNotificationPreferences
 
 
 class AccountNotificationPreferenceUtil:
+    _preferences_cache: Optional[AccountNotificationPreferencesCache] = None
+
+    @staticmethod
+    def get_preferences_cache() -> AccountNotificationPreferencesCache:
+        if AccountNotificationPreferenceUtil._preferences_cache is None:
+            AccountNotificationPreferenceUtil._preferences_cache = AccountNotificationPreferencesCache(
+                max_size=ConfigService[int].get_value(key="notification.preferences_cache.max_size"),
+                ttl_in_seconds=ConfigService[int].get_value(key="notification.preferences_cache.ttl_in_seconds"),
+            )
+        return AccountNotificationPreferenceUtil._preferences_cache
+
     @staticmethod
     def convert_account_notification_preferences_bson_to_account_notification_preferences(
         notification_preferences_bson: dict[str, Any]
@@ -2,13 +2,9 @@ from datetime import datetime
 from typing import Any
 
 from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from modules.notification.errors import AccountNotificationPreferencesNotFoundError
-from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
 from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
-from modules.notification.internals.store.account_notification_preferences_model import (
-    AccountNotificationPreferencesModel,
-)
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
@@ -17,56 +13,55 @@ from modules.notification.types import (
     CreateOrUpdateAccountNotificationPreferencesParams,
 )
 
+NOTIFICATION_CHANNEL_FIELDS = ["email_enabled", "push_enabled", "sms_enabled"]
 
-class AccountNotificationPreferenceWriter:
-    @staticmethod
-    def _create_account_notification_preferences(
-        account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
-    ) -> AccountNotificationPreferences:
-        preferences_model = AccountNotificationPreferencesModel(
-            account_id=account_id,
-            id=None,
-            email_enabled=preferences.email_enabled if preferences.email_enabled is not None else True,
-            push_enabled=preferences.push_enabled if preferences.push_enabled is not None else True,
-            sms_enabled=preferences.sms_enabled if preferences.sms_enabled is not None else True,
-        ).to_bson()
-
-        query = AccountNotificationPreferencesRepository.collection().insert_one(preferences_model)
-        created_preferences = AccountNotificationPreferencesRepository.collection().find_one({"_id": query.inserted_id})
-
-        return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
-            created_preferences
-        )
 
+class AccountNotificationPreferenceWriter:
     @staticmethod
-    def _update_account_notification_preferences(
+    def create_or_update_account_notification_preferences(
         account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
     ) -> AccountNotificationPreferences:
-        update_data: dict[str, Any] = {"updated_at": datetime.now()}
+        now = datetime.now()
+        set_data: dict[str, Any] = {"updated_at": now}
+        # Channels missing from the request keep their stored value, or are enabled when the preferences are created
+        set_on_insert_data: dict[str, Any] = {"created_at": now}
 
-        if preferences.email_enabled is not None:
-            update_data["email_enabled"] = preferences.email_enabled
+        for field in NOTIFICATION_CHANNEL_FIELDS:
+            value = getattr(preferences, field)
+            if value is not None:
+                set_data[field] = value
+            else:
+                set_on_insert_data[field] = True
 
-        if preferences.push_enabled is not None:
-            update_data["push_enabled"] = preferences.push_enabled
+        update = {"$set": set_data, "$setOnInsert": set_on_insert_data}
+        query = {"account_id": account_id, "active": True}
 
-        if preferences.sms_enabled is not None:
-            update_data["sms_enabled"] = preferences.sms_enabled
+        try:
+            updated_preferences = AccountNotificationPreferencesRepository.collection().find_one_and_update(
+                query, update, upsert=True, return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # A concurrent upsert inserted the document first, so this attempt now matches it and updates it
+            updated_preferences = AccountNotificationPreferencesRepository.collection().find_one_and_update(
+                query, update, upsert=True, return_document=ReturnDocument.AFTER
+            )
 
-        updated_preferences = AccountNotificationPreferencesRepository.collection().find_one_and_update(
-            {"account_id": account_id, "active": True}, {"$set": update_data}, return_document=ReturnDocument.AFTER
-        )
+        AccountNotificationPreferenceUtil.get_preferences_cache().invalidate(account_id)
 
         return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
             updated_preferences
         )
 
     @staticmethod
-    def create_or_update_account_notification_preferences(
-        account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
-    ) -> AccountNotificationPreferences:
-        try:
-            AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(account_id)
-            return AccountNotificationPreferenceWriter._update_account_notification_preferences(account_id, preferences)
-        except AccountNotificationPreferencesNotFoundError:
-            return AccountNotificationPreferenceWriter._create_account_notification_preferences(account_id, preferences)
+    def deactivate_account_notification_preferences(account_id: str) -> int:
+        deactivated_count: int = (
+            AccountNotificationPreferencesRepository.collection()
+            .update_many(
+                {"account_id": account_id, "active": True}, {"$set": {"active": False, "updated_at": datetime.now()}}
+            )
+            .modified_count
+        )
+
+        AccountNotificationPreferenceUtil.get_preferences_cache().invalidate(account_id)
+
+        return deactivated_count
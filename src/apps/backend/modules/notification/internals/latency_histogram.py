@@ -0,0 +1,35 @@
+import bisect
+import threading
+from typing import List
+
+from modules.notification.types import ProviderLatencyStats
+
+
+class LatencyHistogram:
+    def __init__(self, *, provider: str, bucket_bounds_in_ms: List[float]) -> None:
+        self.provider = provider
+        self.bucket_bounds_in_ms = sorted(bucket_bounds_in_ms)
+        self._lock = threading.Lock()
+        # The extra bucket collects everything above the largest bound
+        self._bucket_counts = [0] * (len(self.bucket_bounds_in_ms) + 1)
+        self._errors = 0
+        self._total_latency_in_ms = 0.0
+
+    def record(self, latency_in_ms: float, *, is_error: bool = False) -> None:
+        bucket_index = bisect.bisect_left(self.bucket_bounds_in_ms, latency_in_ms)
+        with self._lock:
+            self._bucket_counts[bucket_index] += 1
+            self._total_latency_in_ms += latency_in_ms
+            if is_error:
+                self._errors += 1
+
+    def get_stats(self) -> ProviderLatencyStats:
+        labels = [f"{bound:g}" for bound in self.bucket_bounds_in_ms] + ["inf"]
+        with self._lock:
+            return ProviderLatencyStats(
+                provider=self.provider,
+                count=sum(self._bucket_counts),
+                errors=self._errors,
+                total_latency_in_ms=self._total_latency_in_ms,
+                buckets=dict(zip(labels, self._bucket_counts)),
+            )
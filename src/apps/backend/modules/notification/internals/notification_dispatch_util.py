@@ -0,0 +1,92 @@
+from dataclasses import asdict
+from typing import Any, Dict, List, Sequence, TypeVar
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.notification.types import (
+    BulkEmailRecipient,
+    BulkSMSRecipient,
+    EmailRecipient,
+    EmailSender,
+    NotificationProvider,
+    SendBulkEmailParams,
+    SendBulkSMSParams,
+    SendEmailParams,
+    SendSMSParams,
+)
+
+NOTIFICATION_PROVIDER = ConfigService[str].bind(key="notification.provider")
+BULK_RECIPIENTS_PER_WORKER = ConfigService[int].bind(key="notification.bulk.recipients_per_worker")
+
+T = TypeVar("T")
+
+
+class NotificationDispatchUtil:
+    """
+    Worker arguments go through Temporal's JSON payload converter, so params are passed as plain dicts
+    """
+
+    @staticmethod
+    def is_stub_provider_enabled() -> bool:
+        return NOTIFICATION_PROVIDER.get() == NotificationProvider.STUB.value
+
+    @staticmethod
+    def split_recipients_per_worker(recipients: Sequence[T]) -> List[Sequence[T]]:
+        # Keeps each worker's arguments well below Temporal's payload size limit
+        recipients_per_worker = BULK_RECIPIENTS_PER_WORKER.get()
+        return [
+            recipients[start : start + recipients_per_worker]
+            for start in range(0, len(recipients), recipients_per_worker)
+        ]
+
+    @staticmethod
+    def convert_send_email_params_to_payload(params: SendEmailParams) -> Dict[str, Any]:
+        return asdict(params)
+
+    @staticmethod
+    def convert_payload_to_send_email_params(payload: Dict[str, Any]) -> SendEmailParams:
+        return SendEmailParams(
+            recipient=EmailRecipient(**payload["recipient"]),
+            sender=EmailSender(**payload["sender"]),
+            template_id=payload["template_id"],
+            template_data=payload.get("template_data"),
+        )
+
+    @staticmethod
+    def convert_send_sms_params_to_payload(params: SendSMSParams) -> Dict[str, Any]:
+        return asdict(params)
+
+    @staticmethod
+    def convert_payload_to_send_sms_params(payload: Dict[str, Any]) -> SendSMSParams:
+        return SendSMSParams(
+            message_body=payload["message_body"], recipient_phone=PhoneNumber(**payload["recipient_phone"])
+        )
+
+    @staticmethod
+    def convert_send_bulk_email_params_to_payload(params: SendBulkEmailParams) -> Dict[str, Any]:
+        return asdict(params)
+
+    @staticmethod
+    def convert_payload_to_send_bulk_email_params(payload: Dict[str, Any]) -> SendBulkEmailParams:
+        return SendBulkEmailParams(
+            recipients=[BulkEmailRecipient(**recipient) for recipient in payload["recipients"]],
+            sender=EmailSender(**payload["sender"]),
+            template_id=payload["template_id"],
+            template_data=payload.get("template_data"),
+        )
+
+    @staticmethod
+    def convert_send_bulk_sms_params_to_payload(params: SendBulkSMSParams) -> Dict[str, Any]:
+        return asdict(params)
+
+    @staticmethod
+    def convert_payload_to_send_bulk_sms_params(payload: Dict[str, Any]) -> SendBulkSMSParams:
+        return SendBulkSMSParams(
+            message_body=payload["message_body"],
+            recipients=[
+                BulkSMSRecipient(
+                    account_id=recipient["account_id"], phone_number=PhoneNumber(**recipient["phone_number"])
+                )
+                for recipient in payload["recipients"]
+            ],
+        )
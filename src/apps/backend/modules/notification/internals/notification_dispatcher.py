@@ -0,0 +1,20 @@
+from typing import Any, Dict
+
+from modules.application.application_service import ApplicationService
+from modules.application.errors import WorkerClientConnectionError, WorkerStartError
+from modules.logger.logger import Logger
+from modules.notification.workers.notification_dispatch_worker import NotificationDispatchWorker
+
+
+class NotificationDispatcher:
+    @staticmethod
+    def dispatch(*, channel: str, payload: Dict[str, Any]) -> None:
+        """
+        Hand the notification to a NotificationDispatchWorker, or send it inline when the worker cannot be started
+        (Temporal down, or the server running with --no-temporal), so that it is never dropped
+        """
+        try:
+            ApplicationService.run_worker_immediately(cls=NotificationDispatchWorker, arguments=(channel, payload))
+        except (WorkerClientConnectionError, WorkerStartError) as err:
+            Logger.warn(message=f"Could not enqueue {channel} notification, sending it inline: {err.message}")
+            NotificationDispatchWorker.send(channel, payload)
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from modules.config.config_service import ConfigService
+from modules.notification.internals.latency_histogram import LatencyHistogram
+from modules.notification.types import NotificationHttpProvider, ProviderLatencyStats
+
+CONNECT_TIMEOUT_IN_SECONDS = ConfigService[float].bind(key="notification.http.connect_timeout_in_seconds")
+READ_TIMEOUT_IN_SECONDS = ConfigService[float].bind(key="notification.http.read_timeout_in_seconds")
+MAX_RETRIES = ConfigService[int].bind(key="notification.http.max_retries")
+RETRY_BACKOFF_FACTOR = ConfigService[float].bind(key="notification.http.retry_backoff_factor")
+RETRY_BACKOFF_JITTER = ConfigService[float].bind(key="notification.http.retry_backoff_jitter")
+POOL_MAX_SIZE = ConfigService[int].bind(key="notification.http.pool_max_size")
+LATENCY_BUCKETS_IN_MS = ConfigService[List[float]].bind(key="notification.http.latency_buckets_in_ms")
+
+# Statuses for which the provider has not accepted the message, so resending cannot deliver it twice
+RETRYABLE_STATUSES = [429, 503]
+
+
+class InstrumentedSession(requests.Session):
+    """
+    Session that applies the default timeouts and records the latency of every request, retries included
+    """
+
+    def __init__(self, *, histogram: LatencyHistogram, timeout: Tuple[float, float]) -> None:
+        super().__init__()
+        self.histogram = histogram
+        self.timeout = timeout
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except requests.RequestException:
+            self.histogram.record((time.perf_counter() - start) * 1000, is_error=True)
+            raise
+
+        self.histogram.record((time.perf_counter() - start) * 1000, is_error=response.status_code >= 400)
+        return response
+
+
+class ProviderHttpSession:
+    _sessions: Dict[str, InstrumentedSession] = {}
+    _sessions_pid: Optional[int] = None
+    _histograms: Dict[str, LatencyHistogram] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_session(provider: NotificationHttpProvider) -> InstrumentedSession:
+        """Return the keep-alive session shared by all threads of this process for the given provider"""
+        with ProviderHttpSession._lock:
+            # Pooled sockets must not be shared with a forked child, so each process builds its own sessions
+            if ProviderHttpSession._sessions_pid != os.getpid():
+                ProviderHttpSession._sessions = {}
+                ProviderHttpSession._sessions_pid = os.getpid()
+
+            session = ProviderHttpSession._sessions.get(provider.value)
+            if session is None:
+                session = ProviderHttpSession._create_session(provider)
+                ProviderHttpSession._sessions[provider.value] = session
+
+            return session
+
+    @staticmethod
+    def get_latency_stats() -> List[ProviderLatencyStats]:
+        with ProviderHttpSession._lock:
+            histograms = list(ProviderHttpSession._histograms.values())
+        return [histogram.get_stats() for histogram in histograms]
+
+    @staticmethod
+    def reset() -> None:
+        with ProviderHttpSession._lock:
+            for session in ProviderHttpSession._sessions.values():
+                session.close()
+            ProviderHttpSession._sessions = {}
+            ProviderHttpSession._sessions_pid = None
+            ProviderHttpSession._histograms = {}
+
+    @staticmethod
+    def _create_session(provider: NotificationHttpProvider) -> InstrumentedSession:
+        histogram = ProviderHttpSession._histograms.get(provider.value)
+        if histogram is None:
+            histogram = LatencyHistogram(provider=provider.value, bucket_bounds_in_ms=LATENCY_BUCKETS_IN_MS.get())
+            ProviderHttpSession._histograms[provider.value] = histogram
+
+        session = InstrumentedSession(
+            histogram=histogram, timeout=(CONNECT_TIMEOUT_IN_SECONDS.get(), READ_TIMEOUT_IN_SECONDS.get())
+        )
+        max_retries = MAX_RETRIES.get()
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            # A read timeout may mean the provider already accepted the message
+            read=0,
+            status=max_retries,
+            status_forcelist=RETRYABLE_STATUSES,
+            allowed_methods=None,
+            backoff_factor=RETRY_BACKOFF_FACTOR.get(),
+            backoff_jitter=RETRY_BACKOFF_JITTER.get(),
+            raise_on_status=False,
+        )
+        pool_max_size = POOL_MAX_SIZE.get()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_max_size, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
@@ -2,7 +2,7 @@ import re
 from typing import List
 
 from modules.notification.errors import ValidationError
-from modules.notification.types import SendEmailParams, ValidationFailure
+from modules.notification.types import EmailSender, SendBulkEmailParams, SendEmailParams, ValidationFailure
 
 
 class EmailParams:
@@ -19,18 +19,37 @@ class EmailParams:
                 )
             )
 
-        if not EmailParams.is_email_valid(params.sender.email):
+        failures.extend(EmailParams._get_sender_failures(params.sender))
+
+        if failures:
+            raise ValidationError("Email cannot be sent, please check the params validity.", failures)
+
+    @staticmethod
+    def validate_bulk(params: SendBulkEmailParams) -> None:
+        # Invalid recipient emails are skipped per recipient when the broadcast runs
+        failures = EmailParams._get_sender_failures(params.sender)
+
+        if not params.template_id:
+            failures.append(ValidationFailure(field="template_id", message="Please specify a non-empty template id."))
+
+        if failures:
+            raise ValidationError("Bulk email cannot be sent, please check the params validity.", failures)
+
+    @staticmethod
+    def _get_sender_failures(sender: EmailSender) -> List[ValidationFailure]:
+        failures: List[ValidationFailure] = []
+
+        if not EmailParams.is_email_valid(sender.email):
             failures.append(
                 ValidationFailure(
                     field="sender.email", message="Please specify valid sender email in format you@example.com."
                 )
             )
 
-        if not params.sender.name:
+        if not sender.name:
             failures.append(ValidationFailure(field="sender.name", message="Please specify a non-empty sender name."))
 
-        if failures:
-            raise ValidationError("Email cannot be sent, please check the params validity.", failures)
+        return failures
 
     @staticmethod
     def is_email_valid(email: str) -> bool:
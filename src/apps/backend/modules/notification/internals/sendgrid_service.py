@@ -1,17 +1,17 @@
-from typing import Optional
-
-import sendgrid
-from sendgrid.helpers.mail import From, Mail, TemplateId, To
+import requests
+from sendgrid.helpers.mail import From, Mail, Personalization, TemplateId, To
 
 from modules.config.config_service import ConfigService
 from modules.notification.errors import ServiceError
+from modules.notification.internals.provider_http_session import ProviderHttpSession
 from modules.notification.internals.sendgrid_email_params import EmailParams
-from modules.notification.types import SendEmailParams
+from modules.notification.types import NotificationHttpProvider, SendEmailBatchParams, SendEmailParams
 
+SENDGRID_API_KEY = ConfigService[str].bind(key="sendgrid.api_key")
+SENDGRID_MAIL_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
 
-class SendGridService:
-    __client: Optional[sendgrid.SendGridAPIClient] = None
 
+class SendGridService:
     @staticmethod
     def send_email(params: SendEmailParams) -> None:
         EmailParams.validate(params)
@@ -20,16 +20,33 @@ class SendGridService:
         message.template_id = TemplateId(params.template_id)
         message.dynamic_template_data = params.template_data
 
-        try:
-            client = SendGridService.get_client()
-            client.send(message)
+        SendGridService._send(message)
 
-        except sendgrid.SendGridException as err:
-            raise ServiceError(err)
+    @staticmethod
+    def send_email_batch(params: SendEmailBatchParams) -> None:
+        """Send one template to all recipients in a single request, with one personalization per recipient"""
+        message = Mail(from_email=From(params.sender.email, params.sender.name))
+        message.template_id = TemplateId(params.template_id)
+
+        for recipient in params.recipients:
+            personalization = Personalization()
+            personalization.add_to(To(recipient.email))
+            personalization.dynamic_template_data = params.template_data
+            message.add_personalization(personalization)
+
+        SendGridService._send(message)
 
     @staticmethod
-    def get_client() -> sendgrid.SendGridAPIClient:
-        if not SendGridService.__client:
-            api_key = ConfigService[str].get_value(key="sendgrid.api_key")
-            SendGridService.__client = sendgrid.SendGridAPIClient(api_key=api_key)
-        return SendGridService.__client
+    def _send(message: Mail) -> None:
+        # The SDK's own client opens a new connection per request, so the mail is posted through the shared session
+        session = ProviderHttpSession.get_session(NotificationHttpProvider.SENDGRID)
+        try:
+            response = session.post(
+                SENDGRID_MAIL_SEND_URL,
+                json=message.get(),
+                headers={"Authorization": f"Bearer {SENDGRID_API_KEY.get()}", "Accept": "application/json"},
+            )
+            response.raise_for_status()
+
+        except requests.RequestException as err:
+            raise ServiceError(err)
@@ -0,0 +1,37 @@
+from typing import List
+
+from modules.logger.logger import Logger
+from modules.notification.types import SendEmailBatchParams, SendEmailParams, SendSMSParams
+
+
+class StubNotificationService:
+    """
+    Local stand-in for SendGrid and Twilio, used when notification.provider is 'stub'
+    """
+
+    sent_emails: List[SendEmailParams] = []
+    sent_email_batches: List[SendEmailBatchParams] = []
+    sent_sms: List[SendSMSParams] = []
+
+    @staticmethod
+    def send_email(params: SendEmailParams) -> None:
+        Logger.info(message=f"Stub email sent to {params.recipient.email} using template {params.template_id}")
+        StubNotificationService.sent_emails.append(params)
+
+    @staticmethod
+    def send_email_batch(params: SendEmailBatchParams) -> None:
+        Logger.info(
+            message=f"Stub email batch sent to {len(params.recipients)} recipients using template {params.template_id}"
+        )
+        StubNotificationService.sent_email_batches.append(params)
+
+    @staticmethod
+    def send_sms(params: SendSMSParams) -> None:
+        Logger.info(message=f"Stub SMS sent to {params.recipient_phone}")
+        StubNotificationService.sent_sms.append(params)
+
+    @staticmethod
+    def clear() -> None:
+        StubNotificationService.sent_emails.clear()
+        StubNotificationService.sent_email_batches.clear()
+        StubNotificationService.sent_sms.clear()
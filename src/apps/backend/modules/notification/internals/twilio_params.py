@@ -3,7 +3,7 @@ from typing import List
 from phonenumbers import NumberParseException, is_valid_number, parse
 
 from modules.notification.errors import ValidationError
-from modules.notification.types import SendSMSParams, ValidationFailure
+from modules.notification.types import SendBulkSMSParams, SendSMSParams, ValidationFailure
 
 
 class SMSParams:
@@ -32,3 +32,12 @@ class SMSParams:
 
         if failures:
             raise ValidationError("SMS cannot be sent, please check the params validity.", failures)
+
+    @staticmethod
+    def validate_bulk(params: SendBulkSMSParams) -> None:
+        # Invalid recipient phone numbers are skipped per recipient when the broadcast runs
+        if not params.message_body:
+            raise ValidationError(
+                "Bulk SMS cannot be sent, please check the params validity.",
+                [ValidationFailure(field="message_body", message="Please specify a non-empty message body.")],
+            )
@@ -1,12 +1,17 @@
 from typing import Optional
 
+import requests
 from twilio.base.exceptions import TwilioException
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
 
 from modules.config.config_service import ConfigService
 from modules.notification.errors import ServiceError
+from modules.notification.internals.provider_http_session import ProviderHttpSession
 from modules.notification.internals.twilio_params import SMSParams
-from modules.notification.types import SendSMSParams
+from modules.notification.types import NotificationHttpProvider, SendSMSParams
+
+TWILIO_MESSAGING_SERVICE_SID = ConfigService[str].bind(key="twilio.messaging_service_sid")
 
 
 class TwilioService:
@@ -22,20 +27,25 @@ class TwilioService:
             # Send SMS
             client.messages.create(
                 to=params.recipient_phone,
-                messaging_service_sid=ConfigService[str].get_value(key="twilio.messaging_service_sid"),
+                messaging_service_sid=TWILIO_MESSAGING_SERVICE_SID.get(),
                 body=params.message_body,
             )
 
-        except TwilioException as err:
+        except (TwilioException, requests.RequestException) as err:
             raise ServiceError(err)
 
     @staticmethod
     def get_client() -> Client:
-        if not TwilioService.__client:
+        session = ProviderHttpSession.get_session(NotificationHttpProvider.TWILIO)
+
+        # The client is rebuilt whenever the shared session is, e.g. after a fork
+        if not TwilioService.__client or TwilioService.__client.http_client.session is not session:
             account_sid = ConfigService[str].get_value(key="twilio.account_sid")
             auth_token = ConfigService[str].get_value(key="twilio.auth_token")
 
-            # Initialize the Twilio client
-            TwilioService.__client = Client(account_sid, auth_token)
+            # Initialize the Twilio client on top of the shared keep-alive session
+            http_client = TwilioHttpClient(pool_connections=True)
+            http_client.session = session
+            TwilioService.__client = Client(account_sid, auth_token, http_client=http_client)
 
         return TwilioService.__client
@@ -1,10 +1,19 @@
+from typing import Dict, List
+
+from modules.application.types import BulkWorkerResult
 from modules.notification.email_service import EmailService
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
 from modules.notification.internals.account_notification_preferences_writer import AccountNotificationPreferenceWriter
+from modules.notification.internals.provider_http_session import ProviderHttpSession
 from modules.notification.sms_service import SMSService
 from modules.notification.types import (
     AccountNotificationPreferences,
+    AccountNotificationPreferencesCacheStats,
     CreateOrUpdateAccountNotificationPreferencesParams,
+    ProviderLatencyStats,
+    SendBulkEmailParams,
+    SendBulkSMSParams,
     SendEmailParams,
     SendSMSParams,
 )
@@ -24,6 +33,16 @@ class NotificationService:
             account_id=account_id, bypass_preferences=bypass_preferences, params=params
         )
 
+    @staticmethod
+    def send_bulk_email(*, params: SendBulkEmailParams) -> List[BulkWorkerResult]:
+        """Broadcast one template to many accounts from background workers; returns the started workers"""
+        return EmailService.send_bulk_email(params=params)
+
+    @staticmethod
+    def send_bulk_sms(*, params: SendBulkSMSParams) -> List[BulkWorkerResult]:
+        """Broadcast one message to many accounts from background workers; returns the started workers"""
+        return SMSService.send_bulk_sms(params=params)
+
     @staticmethod
     def create_or_update_account_notification_preferences(
         *, account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
@@ -35,3 +54,17 @@ class NotificationService:
     @staticmethod
     def get_account_notification_preferences_by_account_id(*, account_id: str) -> AccountNotificationPreferences:
         return AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(account_id)
+
+    @staticmethod
+    def get_account_notification_preferences_by_account_ids(
+        *, account_ids: List[str]
+    ) -> Dict[str, AccountNotificationPreferences]:
+        return AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_ids(account_ids)
+
+    @staticmethod
+    def get_account_notification_preferences_cache_stats() -> AccountNotificationPreferencesCacheStats:
+        return AccountNotificationPreferenceUtil.get_preferences_cache().get_stats()
+
+    @staticmethod
+    def get_provider_latency_stats() -> List[ProviderLatencyStats]:
+        return ProviderHttpSession.get_latency_stats()
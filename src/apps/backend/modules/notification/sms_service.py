@@ -1,20 +1,30 @@
+from dataclasses import replace
+from typing import List
+
+from modules.application.application_service import ApplicationService
+from modules.application.types import BulkWorkerResult
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.internals.twilio_service import TwilioService
-from modules.notification.types import SendSMSParams
+from modules.notification.internals.notification_dispatch_util import NotificationDispatchUtil
+from modules.notification.internals.notification_dispatcher import NotificationDispatcher
+from modules.notification.internals.twilio_params import SMSParams
+from modules.notification.types import NotificationChannel, SendBulkSMSParams, SendSMSParams
+from modules.notification.workers.bulk_notification_worker import BulkNotificationWorker
+
+SMS_ENABLED = ConfigService[bool].bind(key="sms.enabled")
 
 
 class SMSService:
     @staticmethod
     def send_sms_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendSMSParams) -> None:
-        is_sms_enabled = ConfigService[bool].get_value(key="sms.enabled")
+        is_sms_enabled = SMS_ENABLED.get()
         if not is_sms_enabled:
             Logger.warn(message=f"SMS is disabled. Could not send message - {params.message_body}")
             return
 
         if not bypass_preferences:
-            preferences = AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(
+            preferences = AccountNotificationPreferenceReader.get_cached_account_notification_preferences_by_account_id(
                 account_id
             )
             if not preferences.sms_enabled:
@@ -24,4 +34,31 @@ class SMSService:
                 )
                 return
 
-        TwilioService.send_sms(params=params)
+        # Invalid params are rejected here, since the worker would only fail and retry on them
+        SMSParams.validate(params)
+
+        NotificationDispatcher.dispatch(
+            channel=NotificationChannel.SMS.value,
+            payload=NotificationDispatchUtil.convert_send_sms_params_to_payload(params),
+        )
+
+    @staticmethod
+    def send_bulk_sms(*, params: SendBulkSMSParams) -> List[BulkWorkerResult]:
+        if not SMS_ENABLED.get():
+            Logger.warn(message=f"SMS is disabled. Could not send bulk message - {params.message_body}")
+            return []
+
+        SMSParams.validate_bulk(params)
+
+        return ApplicationService.run_workers_in_bulk(
+            cls=BulkNotificationWorker,
+            list_of_arguments=[
+                (
+                    NotificationChannel.SMS.value,
+                    NotificationDispatchUtil.convert_send_bulk_sms_params_to_payload(
+                        replace(params, recipients=list(recipients))
+                    ),
+                )
+                for recipients in NotificationDispatchUtil.split_recipients_per_worker(params.recipients)
+            ],
+        )
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from enum import Enum
+from typing import Any, Dict, List, Optional
 
 from modules.account.types import PhoneNumber
 
@@ -15,6 +16,21 @@ class EmailRecipient:
     email: str
 
 
+class NotificationChannel(Enum):
+    EMAIL = "EMAIL"
+    SMS = "SMS"
+
+
+class NotificationProvider(Enum):
+    LIVE = "live"
+    STUB = "stub"
+
+
+class NotificationHttpProvider(Enum):
+    SENDGRID = "sendgrid"
+    TWILIO = "twilio"
+
+
 @dataclass(frozen=True)
 class CreateOrUpdateAccountNotificationPreferencesParams:
     email_enabled: Optional[bool] = None
@@ -30,6 +46,23 @@ class AccountNotificationPreferences:
     sms_enabled: bool = True
 
 
+@dataclass(frozen=True)
+class AccountNotificationPreferencesCacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+@dataclass(frozen=True)
+class ProviderLatencyStats:
+    provider: str
+    count: int
+    errors: int
+    total_latency_in_ms: float
+    # Request count per latency bucket, keyed by the bucket's upper bound in milliseconds ("inf" for the last one)
+    buckets: Dict[str, int]
+
+
 @dataclass(frozen=True)
 class SendEmailParams:
     recipient: EmailRecipient
@@ -44,6 +77,48 @@ class SendSMSParams:
     recipient_phone: PhoneNumber
 
 
+@dataclass(frozen=True)
+class BulkEmailRecipient:
+    account_id: str
+    email: str
+
+
+@dataclass(frozen=True)
+class SendBulkEmailParams:
+    recipients: List[BulkEmailRecipient]
+    sender: EmailSender
+    template_id: str
+    template_data: Dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class SendEmailBatchParams:
+    recipients: List[EmailRecipient]
+    sender: EmailSender
+    template_id: str
+    template_data: Dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class BulkSMSRecipient:
+    account_id: str
+    phone_number: PhoneNumber
+
+
+@dataclass(frozen=True)
+class SendBulkSMSParams:
+    message_body: str
+    recipients: List[BulkSMSRecipient]
+
+
+@dataclass(frozen=True)
+class BulkNotificationProgress:
+    total: int
+    sent: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+
 @dataclass(frozen=True)
 class NotificationErrorCode:
     PREFERENCES_NOT_FOUND = "NOTIFICATION_ERR_01"
@@ -0,0 +1,171 @@
+from typing import Any, Dict, List, Tuple
+
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.errors import ServiceError, ValidationError
+from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.notification_dispatch_util import NotificationDispatchUtil
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.stub_notification_service import StubNotificationService
+from modules.notification.internals.twilio_params import SMSParams
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.types import (
+    BulkEmailRecipient,
+    BulkNotificationProgress,
+    BulkSMSRecipient,
+    EmailRecipient,
+    NotificationChannel,
+    SendBulkEmailParams,
+    SendBulkSMSParams,
+    SendEmailBatchParams,
+    SendSMSParams,
+)
+
+BULK_EMAIL_BATCH_SIZE = ConfigService[int].bind(key="notification.bulk.email_batch_size")
+BULK_SMS_BATCH_SIZE = ConfigService[int].bind(key="notification.bulk.sms_batch_size")
+
+
+class BulkNotificationWorker(BaseWorker):
+    max_execution_time_in_seconds = 3600
+    # Retrying a partially sent broadcast would notify the recipients it already reached a second time
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        channel: str = args[0]
+        payload: Dict[str, Any] = args[1]
+
+        if channel == NotificationChannel.EMAIL.value:
+            await BulkNotificationWorker._send_bulk_email(
+                NotificationDispatchUtil.convert_payload_to_send_bulk_email_params(payload)
+            )
+
+        elif channel == NotificationChannel.SMS.value:
+            await BulkNotificationWorker._send_bulk_sms(
+                NotificationDispatchUtil.convert_payload_to_send_bulk_sms_params(payload)
+            )
+
+        else:
+            raise ValueError(f"Unsupported notification channel: {channel}")
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
+
+    @staticmethod
+    async def _send_bulk_email(params: SendBulkEmailParams) -> None:
+        batch_size = BULK_EMAIL_BATCH_SIZE.get()
+        progress = BulkNotificationProgress(total=len(params.recipients))
+
+        for start in range(0, len(params.recipients), batch_size):
+            _, progress = await BulkNotificationWorker.run_batch(
+                lambda: BulkNotificationWorker._send_email_batch(params, params.recipients[start : start + batch_size]),
+                progress,
+                BulkNotificationWorker._add_to_progress,
+            )
+            BulkNotificationWorker._log_progress(NotificationChannel.EMAIL, progress)
+
+    @staticmethod
+    def _send_email_batch(params: SendBulkEmailParams, recipients: List[BulkEmailRecipient]) -> Tuple[int, int, int]:
+        enabled_recipients = BulkNotificationWorker._get_enabled_recipients(NotificationChannel.EMAIL, recipients)
+        email_recipients = [
+            EmailRecipient(email=recipient.email)
+            for recipient in enabled_recipients
+            if EmailParams.is_email_valid(recipient.email)
+        ]
+        skipped = len(recipients) - len(enabled_recipients)
+        failed = len(enabled_recipients) - len(email_recipients)
+        if not email_recipients:
+            return 0, skipped, failed
+
+        send_email_batch = (
+            StubNotificationService.send_email_batch
+            if NotificationDispatchUtil.is_stub_provider_enabled()
+            else SendGridService.send_email_batch
+        )
+        try:
+            send_email_batch(
+                SendEmailBatchParams(
+                    recipients=email_recipients,
+                    sender=params.sender,
+                    template_id=params.template_id,
+                    template_data=params.template_data,
+                )
+            )
+        except ServiceError as err:
+            Logger.error(message=f"Bulk email batch to {len(email_recipients)} recipients failed: {err.message}")
+            return 0, skipped, failed + len(email_recipients)
+
+        return len(email_recipients), skipped, failed
+
+    @staticmethod
+    async def _send_bulk_sms(params: SendBulkSMSParams) -> None:
+        batch_size = BULK_SMS_BATCH_SIZE.get()
+        progress = BulkNotificationProgress(total=len(params.recipients))
+
+        for start in range(0, len(params.recipients), batch_size):
+            _, progress = await BulkNotificationWorker.run_batch(
+                lambda: BulkNotificationWorker._send_sms_batch(params, params.recipients[start : start + batch_size]),
+                progress,
+                BulkNotificationWorker._add_to_progress,
+            )
+            BulkNotificationWorker._log_progress(NotificationChannel.SMS, progress)
+
+    @staticmethod
+    def _send_sms_batch(params: SendBulkSMSParams, recipients: List[BulkSMSRecipient]) -> Tuple[int, int, int]:
+        enabled_recipients = BulkNotificationWorker._get_enabled_recipients(NotificationChannel.SMS, recipients)
+        send_sms = (
+            StubNotificationService.send_sms
+            if NotificationDispatchUtil.is_stub_provider_enabled()
+            else TwilioService.send_sms
+        )
+
+        # Twilio has no multi-recipient endpoint, so only the preference lookup is batched
+        sent = 0
+        for recipient in enabled_recipients:
+            sms_params = SendSMSParams(message_body=params.message_body, recipient_phone=recipient.phone_number)
+            try:
+                SMSParams.validate(sms_params)
+                send_sms(sms_params)
+                sent += 1
+            except (ServiceError, ValidationError) as err:
+                Logger.error(message=f"Bulk SMS to account {recipient.account_id} failed: {err.message}")
+
+        return sent, len(recipients) - len(enabled_recipients), len(enabled_recipients) - sent
+
+    @staticmethod
+    def _get_enabled_recipients(channel: NotificationChannel, recipients: List[Any]) -> List[Any]:
+        # Accounts without preferences are skipped rather than failing the whole broadcast
+        preferences_by_account_id = (
+            AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_ids(
+                [recipient.account_id for recipient in recipients]
+            )
+        )
+        enabled_field = "email_enabled" if channel == NotificationChannel.EMAIL else "sms_enabled"
+
+        return [
+            recipient
+            for recipient in recipients
+            if recipient.account_id in preferences_by_account_id
+            and getattr(preferences_by_account_id[recipient.account_id], enabled_field)
+        ]
+
+    @staticmethod
+    def _add_to_progress(
+        progress: BulkNotificationProgress, batch_counts: Tuple[int, int, int]
+    ) -> BulkNotificationProgress:
+        sent, skipped, failed = batch_counts
+        return BulkNotificationProgress(
+            total=progress.total,
+            sent=progress.sent + sent,
+            skipped=progress.skipped + skipped,
+            failed=progress.failed + failed,
+        )
+
+    @staticmethod
+    def _log_progress(channel: NotificationChannel, progress: BulkNotificationProgress) -> None:
+        Logger.info(
+            message=f"Bulk {channel.value} progress: {progress.sent}/{progress.total} sent, "
+            f"{progress.skipped} skipped, {progress.failed} failed"
+        )
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any, Dict
+
+from modules.application.types import BaseWorker, WorkerPriority
+from modules.notification.internals.notification_dispatch_util import NotificationDispatchUtil
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.stub_notification_service import StubNotificationService
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.types import NotificationChannel
+
+
+class NotificationDispatchWorker(BaseWorker):
+    priority = WorkerPriority.CRITICAL
+    max_execution_time_in_seconds = 30
+    max_retries = 5
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        # Provider SDKs are blocking, so they run off the worker's event loop
+        await asyncio.to_thread(NotificationDispatchWorker.send, args[0], args[1])
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
+
+    @staticmethod
+    def send(channel: str, payload: Dict[str, Any]) -> None:
+        """Send one notification through the configured provider; also used inline when the worker cannot start"""
+        use_stub = NotificationDispatchUtil.is_stub_provider_enabled()
+
+        if channel == NotificationChannel.EMAIL.value:
+            email_params = NotificationDispatchUtil.convert_payload_to_send_email_params(payload)
+            send_email = StubNotificationService.send_email if use_stub else SendGridService.send_email
+            send_email(email_params)
+
+        elif channel == NotificationChannel.SMS.value:
+            sms_params = NotificationDispatchUtil.convert_payload_to_send_sms_params(payload)
+            send_sms = StubNotificationService.send_sms if use_stub else TwilioService.send_sms
+            send_sms(sms_params)
+
+        else:
+            raise ValueError(f"Unsupported notification channel: {channel}")
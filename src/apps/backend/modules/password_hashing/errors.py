@@ -0,0 +1,11 @@
+from modules.application.errors import AppError
+from modules.password_hashing.types import PasswordHashingErrorCode
+
+
+class PasswordHashingPoolSaturatedError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=PasswordHashingErrorCode.POOL_SATURATED,
+            http_status_code=503,
+            message="The server is busy processing other sign-in requests. Please try again in a moment.",
+        )
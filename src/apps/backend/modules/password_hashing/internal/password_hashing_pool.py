@@ -0,0 +1,105 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+import bcrypt
+
+from modules.password_hashing.errors import PasswordHashingPoolSaturatedError
+from modules.password_hashing.types import PasswordHashingMetrics
+
+T = TypeVar("T")
+
+
+def timed_hash_password(password: str, rounds: int) -> Tuple[str, float]:
+    start = time.perf_counter()
+    hashed_password = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode()
+    return hashed_password, time.perf_counter() - start
+
+
+def timed_check_password(password: str, hashed_password: str) -> Tuple[bool, float]:
+    start = time.perf_counter()
+    is_match = bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+    return is_match, time.perf_counter() - start
+
+
+class PasswordHashingPool:
+    def __init__(self, *, bcrypt_rounds: int, max_pending_tasks: int, max_workers: int, use_process_pool: bool) -> None:
+        self.bcrypt_rounds = bcrypt_rounds
+        self.max_pending_tasks = max_pending_tasks
+        self.max_workers = max_workers
+        self.use_process_pool = use_process_pool
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+
+        self._pending_operations = 0
+        self._completed_operations = 0
+        self._rejected_operations = 0
+        self._total_wait_time_in_seconds = 0.0
+        self._total_hash_time_in_seconds = 0.0
+
+    def hash_password(self, *, password: str) -> str:
+        return self._run(timed_hash_password, password, self.bcrypt_rounds)
+
+    def check_password(self, *, password: str, hashed_password: str) -> bool:
+        return self._run(timed_check_password, password, hashed_password)
+
+    def get_metrics(self) -> PasswordHashingMetrics:
+        with self._lock:
+            return PasswordHashingMetrics(
+                completed_operations=self._completed_operations,
+                rejected_operations=self._rejected_operations,
+                pending_operations=self._pending_operations,
+                total_wait_time_in_seconds=self._total_wait_time_in_seconds,
+                total_hash_time_in_seconds=self._total_hash_time_in_seconds,
+            )
+
+    def _run(self, fn: Callable[..., Tuple[T, float]], *args: Any) -> T:
+        with self._lock:
+            if self._pending_operations >= self.max_pending_tasks:
+                self._rejected_operations += 1
+                raise PasswordHashingPoolSaturatedError()
+            self._pending_operations += 1
+
+        start = time.perf_counter()
+        try:
+            if self.use_process_pool:
+                result, hash_time_in_seconds = self._submit(fn, *args)
+            else:
+                result, hash_time_in_seconds = fn(*args)
+        finally:
+            with self._lock:
+                self._pending_operations -= 1
+
+        elapsed_time_in_seconds = time.perf_counter() - start
+        with self._lock:
+            self._completed_operations += 1
+            self._total_hash_time_in_seconds += hash_time_in_seconds
+            self._total_wait_time_in_seconds += max(elapsed_time_in_seconds - hash_time_in_seconds, 0.0)
+
+        return result
+
+    def _submit(self, fn: Callable[..., Tuple[T, float]], *args: Any) -> Tuple[T, float]:
+        executor = self._get_executor()
+        try:
+            return executor.submit(fn, *args).result()
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            # A forked gunicorn worker must not reuse its parent's executor, so each process creates its own lazily
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                self._executor_pid = os.getpid()
+            return self._executor
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from modules.config.config_service import ConfigService
+from modules.password_hashing.internal.password_hashing_pool import PasswordHashingPool
+from modules.password_hashing.types import PasswordHashingMetrics
+
+
+class PasswordHashingService:
+    _pool: Optional[PasswordHashingPool] = None
+
+    @staticmethod
+    def hash_password(*, password: str) -> str:
+        return PasswordHashingService._get_pool().hash_password(password=password)
+
+    @staticmethod
+    def compare_password(*, password: str, hashed_password: str) -> bool:
+        return PasswordHashingService._get_pool().check_password(password=password, hashed_password=hashed_password)
+
+    @staticmethod
+    def get_metrics() -> PasswordHashingMetrics:
+        return PasswordHashingService._get_pool().get_metrics()
+
+    @staticmethod
+    def _get_pool() -> PasswordHashingPool:
+        if PasswordHashingService._pool is None:
+            PasswordHashingService._pool = PasswordHashingPool(
+                bcrypt_rounds=ConfigService[int].get_value(key="password_hashing.bcrypt_rounds"),
+                max_pending_tasks=ConfigService[int].get_value(key="password_hashing.max_pending_tasks"),
+                max_workers=ConfigService[int].get_value(key="password_hashing.max_workers"),
+                use_process_pool=ConfigService[bool].get_value(key="password_hashing.use_process_pool"),
+            )
+        return PasswordHashingService._pool
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PasswordHashingMetrics:
+    completed_operations: int
+    rejected_operations: int
+    pending_operations: int
+    total_wait_time_in_seconds: float
+    total_hash_time_in_seconds: float
+
+
+@dataclass(frozen=True)
+class PasswordHashingErrorCode:
+    POOL_SATURATED: str = "PASSWORD_HASHING_ERR_01"
@@ -12,3 +12,8 @@ class TaskNotFoundError(AppError):
 class TaskBadRequestError(AppError):
     def __init__(self, message: str) -> None:
         super().__init__(code=TaskErrorCode.BAD_REQUEST, http_status_code=400, message=message)
+
+
+class TaskWriteFailedError(AppError):
+    def __init__(self, message: str) -> None:
+        super().__init__(code=TaskErrorCode.WRITE_FAILED, http_status_code=500, message=message)
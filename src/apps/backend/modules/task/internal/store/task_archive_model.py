@@ -0,0 +1,18 @@
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Optional
+
+from modules.task.internal.store.task_model import TaskModel
+
+
+@dataclass
+class TaskArchiveModel(TaskModel):
+    archived_at: Optional[datetime] = None
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskArchiveModel":
+        return cls(**asdict(TaskModel.from_bson(bson_data)), archived_at=bson_data.get("archived_at"))
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "tasks_archive"
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskCountModel(BaseModel):
+    account_id: str
+    active_task_count: int = 0
+    id: Optional[ObjectId | str] = None
+    seeded: bool = True
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskCountModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            active_task_count=bson_data.get("active_task_count", 0),
+            id=bson_data.get("_id"),
+            seeded=bson_data.get("seeded", True),
+            updated_at=bson_data.get("updated_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_counts"
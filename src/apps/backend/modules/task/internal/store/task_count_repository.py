@@ -0,0 +1,42 @@
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from modules.application.repository import ApplicationRepository
+from modules.logger.logger import Logger
+from modules.task.internal.store.task_count_model import TaskCountModel
+
+TASK_COUNT_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["account_id", "active_task_count"],
+        "properties": {
+            "account_id": {"bsonType": "string"},
+            "active_task_count": {"bsonType": ["int", "long"]},
+            "seeded": {"bsonType": "bool"},
+            "updated_at": {"bsonType": "date"},
+        },
+    }
+}
+
+
+class TaskCountRepository(ApplicationRepository):
+    collection_name = TaskCountModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        collection.create_index("account_id", name="account_id_unique", unique=True)
+
+        add_validation_command = {
+            "collMod": cls.collection_name,
+            "validator": TASK_COUNT_VALIDATION_SCHEMA,
+            "validationLevel": "strict",
+        }
+
+        try:
+            collection.database.command(add_validation_command)
+        except OperationFailure as e:
+            if e.code == 26:
+                collection.database.create_collection(cls.collection_name, validator=TASK_COUNT_VALIDATION_SCHEMA)
+            else:
+                Logger.error(message=f"OperationFailure occurred for collection task_counts: {e.details}")
+        return True
@@ -13,8 +13,10 @@ class TaskModel(BaseModel):
     description: str
     title: str
     active: bool = True
+    comment_count: int = 0
     created_at: Optional[datetime] = datetime.now()
     id: Optional[ObjectId | str] = None
+    last_commented_at: Optional[datetime] = None
     updated_at: Optional[datetime] = datetime.now()
 
     @classmethod
@@ -22,9 +24,11 @@ class TaskModel(BaseModel):
         return cls(
             account_id=bson_data.get("account_id", ""),
             active=bson_data.get("active", True),
+            comment_count=bson_data.get("comment_count", 0),
             created_at=bson_data.get("created_at"),
             description=bson_data.get("description", ""),
             id=bson_data.get("_id"),
+            last_commented_at=bson_data.get("last_commented_at"),
             title=bson_data.get("title", ""),
             updated_at=bson_data.get("updated_at"),
         )
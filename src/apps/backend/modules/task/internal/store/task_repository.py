@@ -14,7 +14,9 @@ TASK_VALIDATION_SCHEMA = {
             "description": {"bsonType": "string"},
             "title": {"bsonType": "string"},
             "active": {"bsonType": "bool"},
+            "comment_count": {"bsonType": ["int", "long"]},
             "created_at": {"bsonType": "date"},
+            "last_commented_at": {"bsonType": ["date", "null"]},
             "updated_at": {"bsonType": "date"},
         },
     }
@@ -29,6 +31,21 @@ class TaskRepository(ApplicationRepository):
         collection.create_index(
             [("active", 1), ("account_id", 1)], name="active_account_id_index", partialFilterExpression={"active": True}
         )
+        collection.create_index(
+            [("account_id", 1), ("created_at", -1), ("_id", -1)],
+            name="active_account_id_created_at_index",
+            partialFilterExpression={"active": True},
+        )
+        # Serves the archive worker's scan for tasks deleted before the retention cutoff
+        collection.create_index(
+            [("updated_at", 1)], name="inactive_updated_at_index", partialFilterExpression={"active": False}
+        )
+        # Serves the activity-ordered task list; tasks nobody has commented on are left out of the index
+        collection.create_index(
+            [("account_id", 1), ("last_commented_at", -1), ("_id", -1)],
+            name="active_account_id_last_commented_at_index",
+            partialFilterExpression={"active": True, "last_commented_at": {"$type": "date"}},
+        )
 
         add_validation_command = {
             "collMod": cls.collection_name,
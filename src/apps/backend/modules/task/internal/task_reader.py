@@ -1,12 +1,23 @@
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, List, Optional
+
 from bson.objectid import ObjectId
+from pymongo import ReturnDocument
 
 from modules.application.common.base_model import BaseModel
-from modules.application.common.types import PaginationResult
-from modules.task.errors import TaskNotFoundError
+from modules.application.common.types import PaginationResult, SortDirection, SortParams, TotalCountMode
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.task.errors import TaskBadRequestError, TaskNotFoundError
+from modules.task.internal.store.task_count_model import TaskCountModel
+from modules.task.internal.store.task_count_repository import TaskCountRepository
 from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.internal.task_util import TaskUtil
 from modules.task.types import GetPaginatedTasksParams, GetTaskParams, Task
 
+DEFAULT_TASK_SORT_PARAMS = SortParams(sort_by="created_at", sort_direction=SortDirection.DESC)
+TASK_ACTIVITY_SORT_PARAMS = SortParams(sort_by="last_commented_at", sort_direction=SortDirection.DESC)
+
 
 class TaskReader:
     @staticmethod
@@ -20,20 +31,120 @@ class TaskReader:
 
     @staticmethod
     def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
-        filter_query = {"account_id": params.account_id, "active": True}
-        total_count = TaskRepository.collection().count_documents(filter_query)
+        filter_query: dict[str, Any] = {"account_id": params.account_id, "active": True}
+        sort_params = params.sort_params or DEFAULT_TASK_SORT_PARAMS
+        if sort_params.sort_by == TASK_ACTIVITY_SORT_PARAMS.sort_by:
+            # Tasks nobody has commented on have no activity to order by, and leaving them out keeps the keyset
+            # cursor off null values and the query on the partial activity index
+            filter_query["last_commented_at"] = {"$type": "date"}
+
+        total_count = TaskReader._get_total_count(
+            account_id=params.account_id, filter_query=filter_query, mode=params.total_count_mode
+        )
         pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
             params.pagination_params, total_count
         )
+
+        if pagination_params.cursor:
+            try:
+                filter_query = BaseModel.apply_pagination_cursor(filter_query, pagination_params.cursor, sort_params)
+            except ValueError:
+                raise TaskBadRequestError("Invalid pagination cursor")
+            skip = 0
+
         cursor = TaskRepository.collection().find(filter_query)
+        cursor = BaseModel.apply_sort_params(cursor, sort_params)
 
-        if params.sort_params:
-            cursor = BaseModel.apply_sort_params(cursor, params.sort_params)
-        else:
-            cursor = cursor.sort([("created_at", -1), ("_id", -1)])
+        # Fetch one extra document to know whether a next page exists
+        tasks_bson = list(cursor.skip(skip).limit(pagination_params.size + 1))
+        next_cursor = None
+        if len(tasks_bson) > pagination_params.size > 0:
+            tasks_bson = tasks_bson[: pagination_params.size]
+            next_cursor = BaseModel.encode_pagination_cursor(tasks_bson[-1], sort_params)
 
-        tasks_bson = list(cursor.skip(skip).limit(pagination_params.size))
         tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
+        if params.include_comment_stats:
+            tasks = TaskReader._attach_comment_stats(tasks)
+
         return PaginationResult(
-            items=tasks, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
+            items=tasks,
+            pagination_params=pagination_params,
+            total_count=total_count,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
         )
+
+    @staticmethod
+    def _attach_comment_stats(tasks: List[Task]) -> List[Task]:
+        """Compute the comment count and newest comment of every task of a page with a single aggregation"""
+        if not tasks:
+            return tasks
+
+        comment_stats_bson_by_task_id = {
+            comment_stats_bson["_id"]: comment_stats_bson
+            for comment_stats_bson in CommentRepository.collection().aggregate(
+                [
+                    {"$match": {"task_id": {"$in": [task.id for task in tasks]}}},
+                    # Walks the (task_id, created_at, _id) index backwards, so each task's first comment is its newest
+                    {"$sort": {"task_id": -1, "created_at": -1, "_id": -1}},
+                    {
+                        "$group": {
+                            "_id": "$task_id",
+                            "comment_count": {"$sum": 1},
+                            "latest_comment": {"$first": "$$ROOT"},
+                        }
+                    },
+                ]
+            )
+        }
+
+        return [
+            replace(
+                task,
+                comment_stats=TaskUtil.convert_comment_stats_bson_to_task_comment_stats(
+                    comment_stats_bson_by_task_id.get(task.id)
+                ),
+            )
+            for task in tasks
+        ]
+
+    @staticmethod
+    def _get_total_count(*, account_id: str, filter_query: dict[str, Any], mode: TotalCountMode) -> Optional[int]:
+        if mode == TotalCountMode.NONE:
+            return None
+
+        # The per-account counter only tracks all active tasks, so narrower listings are always counted exactly
+        use_task_counter = mode == TotalCountMode.ESTIMATED and filter_query == {
+            "account_id": account_id,
+            "active": True,
+        }
+
+        task_count: Optional[TaskCountModel] = None
+        if use_task_counter:
+            task_count_bson = TaskCountRepository.collection().find_one({"account_id": account_id})
+            if task_count_bson is None:
+                # The counter exists before counting starts, so no create or delete from here on drops its $inc
+                task_count_bson = TaskCountRepository.collection().find_one_and_update(
+                    {"account_id": account_id},
+                    {"$setOnInsert": {"active_task_count": 0, "seeded": False}},
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+            task_count = TaskCountModel.from_bson(task_count_bson)
+            if task_count.seeded:
+                return max(task_count.active_task_count, 0)
+
+        total_count: int = TaskRepository.collection().count_documents(filter_query)
+
+        if task_count is not None:
+            # Only one seeding reader wins; increments made since the counter was snapshotted are kept on top. A write
+            # overlapping the count can be counted twice, which TaskCountRepairWorker corrects
+            TaskCountRepository.collection().update_one(
+                {"account_id": account_id, "seeded": False},
+                {
+                    "$inc": {"active_task_count": total_count - task_count.active_task_count},
+                    "$set": {"seeded": True, "updated_at": datetime.now()},
+                },
+            )
+
+        return total_count
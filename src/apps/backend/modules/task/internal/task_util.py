@@ -1,7 +1,8 @@
-from typing import Any
+from dataclasses import asdict
+from typing import Any, Optional
 
 from modules.task.internal.store.task_model import TaskModel
-from modules.task.types import Task
+from modules.task.types import Task, TaskCommentPreview, TaskCommentStats
 
 
 class TaskUtil:
@@ -10,7 +11,40 @@ class TaskUtil:
         validated_task_data = TaskModel.from_bson(task_bson)
         return Task(
             account_id=validated_task_data.account_id,
+            comment_count=validated_task_data.comment_count,
             description=validated_task_data.description,
             id=str(validated_task_data.id),
+            last_commented_at=validated_task_data.last_commented_at,
             title=validated_task_data.title,
         )
+
+    @staticmethod
+    def convert_comment_stats_bson_to_task_comment_stats(
+        comment_stats_bson: Optional[dict[str, Any]]
+    ) -> TaskCommentStats:
+        if comment_stats_bson is None:
+            return TaskCommentStats(comment_count=0)
+
+        latest_comment_bson = comment_stats_bson["latest_comment"]
+        return TaskCommentStats(
+            comment_count=comment_stats_bson["comment_count"],
+            latest_comment=TaskCommentPreview(
+                account_id=latest_comment_bson["account_id"],
+                created_at=latest_comment_bson["created_at"],
+                id=str(latest_comment_bson["_id"]),
+                text=latest_comment_bson["text"],
+            ),
+        )
+
+    @staticmethod
+    def task_to_dict(task: Task) -> dict:
+        """Convert Task dataclass to JSON-safe dict, leaving out comment stats unless they were requested"""
+        data = asdict(task)
+        if task.last_commented_at is not None:
+            data["last_commented_at"] = task.last_commented_at.isoformat()
+        if task.comment_stats is None:
+            data.pop("comment_stats")
+        elif task.comment_stats.latest_comment is not None:
+            latest_comment = data["comment_stats"]["latest_comment"]
+            latest_comment["created_at"] = task.comment_stats.latest_comment.created_at.isoformat()
+        return data
@@ -1,22 +1,44 @@
+from collections import Counter
+from dataclasses import replace
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ReplaceOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
-from modules.task.errors import TaskNotFoundError
+from modules.application.errors import AppError
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.task.errors import TaskBadRequestError, TaskNotFoundError, TaskWriteFailedError
+from modules.task.internal.store.task_archive_model import TaskArchiveModel
+from modules.task.internal.store.task_archive_repository import TaskArchiveRepository
+from modules.task.internal.store.task_count_repository import TaskCountRepository
 from modules.task.internal.store.task_model import TaskModel
 from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.internal.task_reader import TaskReader
 from modules.task.internal.task_util import TaskUtil
 from modules.task.types import (
+    ActiveTaskCountsRepairResult,
+    ArchiveInactiveTasksParams,
     CreateTaskParams,
     DeleteTaskParams,
     GetTaskParams,
+    RepairActiveTaskCountsParams,
+    RepairTaskCommentCountersParams,
+    RestoreTaskParams,
+    RunTaskBatchParams,
     Task,
+    TaskBatchOperation,
+    TaskBatchOperationError,
+    TaskBatchOperationResult,
+    TaskBatchOperationType,
+    TaskCommentCountersRepairResult,
     TaskDeletionResult,
     UpdateTaskParams,
 )
 
+IndexedTaskBatchOperations = List[Tuple[int, TaskBatchOperation]]
+
 
 class TaskWriter:
     @staticmethod
@@ -25,8 +47,8 @@ class TaskWriter:
             account_id=params.account_id, description=params.description, title=params.title
         ).to_bson()
 
-        query = TaskRepository.collection().insert_one(task_bson)
-        created_task_bson = TaskRepository.collection().find_one({"_id": query.inserted_id})
+        created_task_bson = TaskRepository.insert_one_and_return(task_bson)
+        TaskWriter._increment_active_task_count(account_id=params.account_id, delta=1)
 
         return TaskUtil.convert_task_bson_to_task(created_task_bson)
 
@@ -49,7 +71,7 @@ class TaskWriter:
 
         deletion_time = datetime.now()
         updated_task_bson = TaskRepository.collection().find_one_and_update(
-            {"_id": ObjectId(task.id)},
+            {"_id": ObjectId(task.id), "active": True},
             {"$set": {"active": False, "updated_at": deletion_time}},
             return_document=ReturnDocument.AFTER,
         )
@@ -57,4 +79,496 @@ class TaskWriter:
         if updated_task_bson is None:
             raise TaskNotFoundError(task_id=params.task_id)
 
+        TaskWriter._increment_active_task_count(account_id=params.account_id, delta=-1)
+
         return TaskDeletionResult(task_id=params.task_id, deleted_at=deletion_time, success=True)
+
+    @staticmethod
+    def restore_task(*, params: RestoreTaskParams) -> Task:
+        """Make a deleted task active again, moving it back from the archive if it has been archived"""
+        restored_at = datetime.now()
+        restored_task_bson = TaskRepository.collection().find_one_and_update(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": False},
+            {"$set": {"active": True, "updated_at": restored_at}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if restored_task_bson is None:
+            restored_task_bson = TaskWriter._restore_archived_task(params=params, restored_at=restored_at)
+
+        TaskWriter._increment_active_task_count(account_id=params.account_id, delta=1)
+
+        return TaskUtil.convert_task_bson_to_task(restored_task_bson)
+
+    @staticmethod
+    def archive_inactive_tasks(*, params: ArchiveInactiveTasksParams) -> int:
+        """
+        Move up to batch_size tasks deleted before deleted_before into the archive collection and return how many
+        were moved
+        """
+        filter_query = {"active": False, "updated_at": {"$lt": params.deleted_before}}
+        tasks_bson = list(TaskRepository.collection().find(filter_query).limit(params.batch_size))
+        if not tasks_bson:
+            return 0
+
+        archived_at = datetime.now()
+        # Copied before they are deleted and upserted by _id, so a batch interrupted in between is simply redone
+        TaskArchiveRepository.collection().bulk_write(
+            [
+                ReplaceOne(
+                    {"_id": task_bson["_id"]},
+                    TaskArchiveModel.from_bson({**task_bson, "archived_at": archived_at}).to_bson(),
+                    upsert=True,
+                )
+                for task_bson in tasks_bson
+            ],
+            ordered=False,
+        )
+
+        archived_count: int = (
+            TaskRepository.collection()
+            .delete_many({**filter_query, "_id": {"$in": [task_bson["_id"] for task_bson in tasks_bson]}})
+            .deleted_count
+        )
+
+        return archived_count
+
+    @staticmethod
+    def run_task_batch(*, params: RunTaskBatchParams) -> List[TaskBatchOperationResult]:
+        """
+        Apply all creates, then all updates, then all deletes, each as one unordered bulk write, and report the
+        outcome of every operation by its index in the batch. A task can be named by only one operation, so the
+        grouping never changes what a batch does
+        """
+        results: Dict[int, TaskBatchOperationResult] = {}
+        operations_by_type: Dict[str, IndexedTaskBatchOperations] = {
+            operation_type.value: [] for operation_type in TaskBatchOperationType
+        }
+
+        for index, operation in enumerate(params.operations):
+            error = TaskWriter._validate_task_batch_operation(operation)
+            if error is not None:
+                results[index] = TaskWriter._get_failed_task_batch_operation_result(index, operation, error)
+            else:
+                operations_by_type[operation.operation].append((index, operation))
+
+        TaskWriter._validate_task_ids_are_unique_in_batch(operations_by_type)
+
+        batch_time = datetime.now()
+
+        created_count = TaskWriter._create_tasks_in_batch(
+            account_id=params.account_id,
+            operations=operations_by_type[TaskBatchOperationType.CREATE.value],
+            batch_time=batch_time,
+            results=results,
+        )
+        TaskWriter._update_tasks_in_batch(
+            account_id=params.account_id,
+            operations=operations_by_type[TaskBatchOperationType.UPDATE.value],
+            batch_time=batch_time,
+            results=results,
+        )
+        deleted_count = TaskWriter._delete_tasks_in_batch(
+            account_id=params.account_id,
+            operations=operations_by_type[TaskBatchOperationType.DELETE.value],
+            batch_time=batch_time,
+            results=results,
+        )
+
+        if created_count != deleted_count:
+            TaskWriter._increment_active_task_count(account_id=params.account_id, delta=created_count - deleted_count)
+
+        return [results[index] for index in range(len(params.operations))]
+
+    @staticmethod
+    def repair_comment_counters(*, params: RepairTaskCommentCountersParams) -> TaskCommentCountersRepairResult:
+        """
+        Recompute comment_count and last_commented_at for the next batch of tasks after after_task_id, in _id order,
+        from the comments collection, and rewrite only the counters that have drifted
+        """
+        filter_query: Dict[str, Any] = {}
+        if params.account_id:
+            filter_query["account_id"] = params.account_id
+        if params.after_task_id:
+            filter_query["_id"] = {"$gt": ObjectId(params.after_task_id)}
+
+        tasks_bson = list(
+            TaskRepository.collection()
+            .find(filter_query, {"comment_count": 1, "last_commented_at": 1})
+            .sort("_id", 1)
+            .limit(params.batch_size)
+        )
+        if not tasks_bson:
+            return TaskCommentCountersRepairResult(tasks_checked=0, tasks_repaired=0)
+
+        comment_counters_by_task_id = {
+            comment_counters_bson["_id"]: comment_counters_bson
+            for comment_counters_bson in CommentRepository.collection().aggregate(
+                [
+                    {"$match": {"task_id": {"$in": [str(task_bson["_id"]) for task_bson in tasks_bson]}}},
+                    {
+                        "$group": {
+                            "_id": "$task_id",
+                            "comment_count": {"$sum": 1},
+                            "last_commented_at": {"$max": "$created_at"},
+                        }
+                    },
+                ]
+            )
+        }
+
+        requests = []
+        for task_bson in tasks_bson:
+            comment_counters_bson = comment_counters_by_task_id.get(str(task_bson["_id"]), {})
+            comment_count = comment_counters_bson.get("comment_count", 0)
+            last_commented_at = comment_counters_bson.get("last_commented_at")
+            if (
+                task_bson.get("comment_count") == comment_count
+                and task_bson.get("last_commented_at") == last_commented_at
+            ):
+                continue
+
+            requests.append(
+                UpdateOne(
+                    # Matching on the counters that were read skips tasks a comment write has touched in between;
+                    # the next run picks them up
+                    {
+                        "_id": task_bson["_id"],
+                        "comment_count": task_bson.get("comment_count"),
+                        "last_commented_at": task_bson.get("last_commented_at"),
+                    },
+                    {"$set": {"comment_count": comment_count, "last_commented_at": last_commented_at}},
+                )
+            )
+
+        tasks_repaired = 0
+        if requests:
+            tasks_repaired, _ = TaskWriter._bulk_write_tasks(requests)
+
+        return TaskCommentCountersRepairResult(
+            tasks_checked=len(tasks_bson), tasks_repaired=tasks_repaired, last_task_id=str(tasks_bson[-1]["_id"])
+        )
+
+    @staticmethod
+    def repair_active_task_counts(*, params: RepairActiveTaskCountsParams) -> ActiveTaskCountsRepairResult:
+        """
+        Recount the active tasks of the accounts behind the next batch of seeded task counters after
+        after_task_count_id, in _id order, and rewrite only the counters that have drifted
+        """
+        filter_query: Dict[str, Any] = {"seeded": {"$ne": False}}
+        if params.after_task_count_id:
+            filter_query["_id"] = {"$gt": ObjectId(params.after_task_count_id)}
+
+        task_counts_bson = list(
+            TaskCountRepository.collection()
+            .find(filter_query, {"account_id": 1, "active_task_count": 1})
+            .sort("_id", 1)
+            .limit(params.batch_size)
+        )
+        if not task_counts_bson:
+            return ActiveTaskCountsRepairResult(task_counts_checked=0, task_counts_repaired=0)
+
+        # Read after the counters, so a create or delete in between moves its counter off the value matched below
+        active_task_count_by_account_id = {
+            active_task_count_bson["_id"]: active_task_count_bson["active_task_count"]
+            for active_task_count_bson in TaskRepository.collection().aggregate(
+                [
+                    {
+                        "$match": {
+                            "account_id": {
+                                "$in": [task_count_bson["account_id"] for task_count_bson in task_counts_bson]
+                            },
+                            "active": True,
+                        }
+                    },
+                    {"$group": {"_id": "$account_id", "active_task_count": {"$sum": 1}}},
+                ]
+            )
+        }
+
+        requests = [
+            UpdateOne(
+                # Matching on the counter that was read skips accounts written to in between; the next run picks
+                # them up
+                {"_id": task_count_bson["_id"], "active_task_count": task_count_bson["active_task_count"]},
+                {
+                    "$set": {
+                        "active_task_count": active_task_count_by_account_id.get(task_count_bson["account_id"], 0),
+                        "updated_at": datetime.now(),
+                    }
+                },
+            )
+            for task_count_bson in task_counts_bson
+            if task_count_bson["active_task_count"]
+            != active_task_count_by_account_id.get(task_count_bson["account_id"], 0)
+        ]
+
+        task_counts_repaired = 0
+        if requests:
+            result = TaskCountRepository.collection().bulk_write(requests, ordered=False)
+            task_counts_repaired = result.modified_count
+
+        return ActiveTaskCountsRepairResult(
+            task_counts_checked=len(task_counts_bson),
+            task_counts_repaired=task_counts_repaired,
+            last_task_count_id=str(task_counts_bson[-1]["_id"]),
+        )
+
+    @staticmethod
+    def _restore_archived_task(*, params: RestoreTaskParams, restored_at: datetime) -> Dict[str, Any]:
+        archived_task_bson = TaskArchiveRepository.collection().find_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id}
+        )
+        if archived_task_bson is None:
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        task_bson = replace(TaskModel.from_bson(archived_task_bson), active=True, updated_at=restored_at).to_bson()
+        try:
+            TaskRepository.collection().insert_one(task_bson)
+        except DuplicateKeyError:
+            # The task is live again and this copy was left behind by an interrupted archive batch
+            TaskArchiveRepository.collection().delete_one({"_id": archived_task_bson["_id"]})
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        TaskArchiveRepository.collection().delete_one({"_id": archived_task_bson["_id"]})
+
+        return task_bson
+
+    @staticmethod
+    def _create_tasks_in_batch(
+        *,
+        account_id: str,
+        operations: IndexedTaskBatchOperations,
+        batch_time: datetime,
+        results: Dict[int, TaskBatchOperationResult],
+    ) -> int:
+        if not operations:
+            return 0
+
+        # Ids are assigned here so that every created task can be returned without reading it back
+        task_bsons = [
+            TaskModel(
+                account_id=account_id,
+                created_at=batch_time,
+                description=operation.description or "",
+                id=ObjectId(),
+                title=operation.title or "",
+                updated_at=batch_time,
+            ).to_bson()
+            for _, operation in operations
+        ]
+
+        write_errors: Dict[int, str] = {}
+        try:
+            TaskRepository.collection().insert_many(task_bsons, ordered=False)
+        except BulkWriteError as err:
+            write_errors = {write_error["index"]: write_error["errmsg"] for write_error in err.details["writeErrors"]}
+
+        for position, (index, operation) in enumerate(operations):
+            if position in write_errors:
+                results[index] = TaskWriter._get_failed_task_batch_operation_result(
+                    index, operation, TaskWriteFailedError(message=write_errors[position])
+                )
+            else:
+                task = TaskUtil.convert_task_bson_to_task(task_bsons[position])
+                results[index] = TaskBatchOperationResult(
+                    index=index, operation=operation.operation, success=True, task=task, task_id=task.id
+                )
+
+        return len(operations) - len(write_errors)
+
+    @staticmethod
+    def _update_tasks_in_batch(
+        *,
+        account_id: str,
+        operations: IndexedTaskBatchOperations,
+        batch_time: datetime,
+        results: Dict[int, TaskBatchOperationResult],
+    ) -> None:
+        if not operations:
+            return
+
+        active_task_bsons = TaskWriter._get_active_task_bsons_in_batch(account_id=account_id, operations=operations)
+        _, write_errors = TaskWriter._bulk_write_tasks(
+            [
+                UpdateOne(
+                    {"_id": ObjectId(operation.task_id), "account_id": account_id, "active": True},
+                    {
+                        "$set": {
+                            "description": operation.description,
+                            "title": operation.title,
+                            "updated_at": batch_time,
+                        }
+                    },
+                )
+                for _, operation in operations
+            ]
+        )
+
+        for position, (index, operation) in enumerate(operations):
+            task_id = str(operation.task_id)
+            if position in write_errors:
+                results[index] = TaskWriter._get_failed_task_batch_operation_result(
+                    index, operation, TaskWriteFailedError(message=write_errors[position])
+                )
+            elif task_id not in active_task_bsons:
+                results[index] = TaskWriter._get_failed_task_batch_operation_result(
+                    index, operation, TaskNotFoundError(task_id=task_id)
+                )
+            else:
+                task_bson = {
+                    **active_task_bsons[task_id],
+                    "description": operation.description,
+                    "title": operation.title,
+                    "updated_at": batch_time,
+                }
+                results[index] = TaskBatchOperationResult(
+                    index=index,
+                    operation=operation.operation,
+                    success=True,
+                    task=TaskUtil.convert_task_bson_to_task(task_bson),
+                    task_id=task_id,
+                )
+
+    @staticmethod
+    def _delete_tasks_in_batch(
+        *,
+        account_id: str,
+        operations: IndexedTaskBatchOperations,
+        batch_time: datetime,
+        results: Dict[int, TaskBatchOperationResult],
+    ) -> int:
+        if not operations:
+            return 0
+
+        active_task_bsons = TaskWriter._get_active_task_bsons_in_batch(account_id=account_id, operations=operations)
+        deleted_count, write_errors = TaskWriter._bulk_write_tasks(
+            [
+                UpdateOne(
+                    {"_id": ObjectId(operation.task_id), "account_id": account_id, "active": True},
+                    {"$set": {"active": False, "updated_at": batch_time}},
+                )
+                for _, operation in operations
+            ]
+        )
+
+        for position, (index, operation) in enumerate(operations):
+            task_id = str(operation.task_id)
+            if position in write_errors:
+                results[index] = TaskWriter._get_failed_task_batch_operation_result(
+                    index, operation, TaskWriteFailedError(message=write_errors[position])
+                )
+            elif task_id not in active_task_bsons:
+                results[index] = TaskWriter._get_failed_task_batch_operation_result(
+                    index, operation, TaskNotFoundError(task_id=task_id)
+                )
+            else:
+                results[index] = TaskBatchOperationResult(
+                    index=index, operation=operation.operation, success=True, task_id=task_id
+                )
+
+        # The modified count, rather than the tasks read before the write, keeps the counter exact under concurrent
+        # deletes
+        return deleted_count
+
+    @staticmethod
+    def _get_active_task_bsons_in_batch(*, account_id: str, operations: IndexedTaskBatchOperations) -> Dict[str, Any]:
+        # Read once before the write, since an unordered bulk write only reports totals and per-item errors
+        return {
+            str(task_bson["_id"]): task_bson
+            for task_bson in TaskRepository.collection().find(
+                {
+                    "_id": {"$in": [ObjectId(operation.task_id) for _, operation in operations]},
+                    "account_id": account_id,
+                    "active": True,
+                }
+            )
+        }
+
+    @staticmethod
+    def _bulk_write_tasks(requests: List[UpdateOne]) -> Tuple[int, Dict[int, str]]:
+        try:
+            result = TaskRepository.collection().bulk_write(requests, ordered=False)
+        except BulkWriteError as err:
+            write_errors = {write_error["index"]: write_error["errmsg"] for write_error in err.details["writeErrors"]}
+            return err.details["nModified"], write_errors
+
+        return result.modified_count, {}
+
+    @staticmethod
+    def _validate_task_ids_are_unique_in_batch(operations_by_type: Dict[str, IndexedTaskBatchOperations]) -> None:
+        task_id_counts = Counter(
+            str(operation.task_id)
+            for operation_type in (TaskBatchOperationType.UPDATE.value, TaskBatchOperationType.DELETE.value)
+            for _, operation in operations_by_type[operation_type]
+        )
+        repeated_task_ids = sorted(task_id for task_id, count in task_id_counts.items() if count > 1)
+        if repeated_task_ids:
+            raise TaskBadRequestError(
+                f"Each task can appear in only one operation of a batch, repeated: {', '.join(repeated_task_ids)}"
+            )
+
+    @staticmethod
+    def _validate_task_batch_operation(operation: TaskBatchOperation) -> Optional[AppError]:
+        operation_types = [operation_type.value for operation_type in TaskBatchOperationType]
+        if operation.operation not in operation_types:
+            return TaskBadRequestError(f"Operation must be one of: {', '.join(operation_types)}")
+
+        if operation.operation != TaskBatchOperationType.CREATE.value:
+            if not operation.task_id:
+                return TaskBadRequestError("Task id is required")
+
+            if not ObjectId.is_valid(operation.task_id):
+                return TaskNotFoundError(task_id=operation.task_id)
+
+        if operation.operation != TaskBatchOperationType.DELETE.value:
+            if not operation.title:
+                return TaskBadRequestError("Title is required")
+
+            if not operation.description:
+                return TaskBadRequestError("Description is required")
+
+        return None
+
+    @staticmethod
+    def _get_failed_task_batch_operation_result(
+        index: int, operation: TaskBatchOperation, error: AppError
+    ) -> TaskBatchOperationResult:
+        return TaskBatchOperationResult(
+            index=index,
+            operation=operation.operation,
+            success=False,
+            error=TaskBatchOperationError(code=error.code, message=error.message),
+            task_id=operation.task_id,
+        )
+
+    @staticmethod
+    def _increment_active_task_count(*, account_id: str, delta: int) -> None:
+        # Counters are created by TaskReader before it counts, so accounts without one are left untouched
+        TaskCountRepository.collection().update_one(
+            {"account_id": account_id}, {"$inc": {"active_task_count": delta}, "$set": {"updated_at": datetime.now()}}
+        )
+
+    @staticmethod
+    def deactivate_tasks_for_account(*, account_id: str, batch_size: int) -> int:
+        """Soft delete up to batch_size of the account's active tasks and return how many were deactivated"""
+        task_ids = [
+            task_bson["_id"]
+            for task_bson in TaskRepository.collection()
+            .find({"account_id": account_id, "active": True}, {"_id": 1})
+            .limit(batch_size)
+        ]
+        if not task_ids:
+            return 0
+
+        now = datetime.now()
+        deactivated_count, _ = TaskWriter._bulk_write_tasks(
+            [
+                UpdateOne({"_id": task_id, "active": True}, {"$set": {"active": False, "updated_at": now}})
+                for task_id in task_ids
+            ]
+        )
+        if deactivated_count:
+            TaskWriter._increment_active_task_count(account_id=account_id, delta=-deactivated_count)
+
+        return deactivated_count
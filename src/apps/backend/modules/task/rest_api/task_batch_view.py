@@ -0,0 +1,65 @@
+from dataclasses import asdict
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.config.config_service import ConfigService
+from modules.task.errors import TaskBadRequestError
+from modules.task.internal.task_util import TaskUtil
+from modules.task.task_service import TaskService
+from modules.task.types import RunTaskBatchParams, TaskBatchOperation
+
+TASK_BATCH_MAX_OPERATIONS = ConfigService[int].bind(key="tasks.batch_max_operations")
+
+
+class TaskBatchView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        """
+        Run the operations grouped by type, all creates first, then all updates, then all deletes. A task can be named
+        by only one operation, so the grouping never changes the outcome; see docs/task-batch-api.md
+        """
+        request_data = request.get_json()
+
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        operations = request_data.get("operations")
+        if not isinstance(operations, list) or not operations:
+            raise TaskBadRequestError("Operations must be a non-empty list")
+
+        max_operations = TASK_BATCH_MAX_OPERATIONS.get()
+        if len(operations) > max_operations:
+            raise TaskBadRequestError(f"A batch can contain at most {max_operations} operations")
+
+        if not all(isinstance(operation, dict) for operation in operations):
+            raise TaskBadRequestError("Each operation must be an object")
+
+        run_task_batch_params = RunTaskBatchParams(
+            account_id=account_id,
+            operations=[
+                TaskBatchOperation(
+                    operation=str(operation.get("operation", "")),
+                    description=operation.get("description"),
+                    task_id=operation.get("task_id"),
+                    title=operation.get("title"),
+                )
+                for operation in operations
+            ],
+        )
+
+        results = TaskService.run_task_batch(params=run_task_batch_params)
+
+        return (
+            jsonify(
+                {
+                    "results": [
+                        {**asdict(result), "task": TaskUtil.task_to_dict(result.task) if result.task else None}
+                        for result in results
+                    ]
+                }
+            ),
+            200,
+        )
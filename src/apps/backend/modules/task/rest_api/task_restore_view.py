@@ -0,0 +1,16 @@
+from flask import jsonify
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.task.internal.task_util import TaskUtil
+from modules.task.task_service import TaskService
+from modules.task.types import RestoreTaskParams
+
+
+class TaskRestoreView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        restored_task = TaskService.restore_task(params=RestoreTaskParams(account_id=account_id, task_id=task_id))
+
+        return jsonify(TaskUtil.task_to_dict(restored_task)), 200
@@ -1,5 +1,7 @@
 from flask import Blueprint
 
+from modules.task.rest_api.task_batch_view import TaskBatchView
+from modules.task.rest_api.task_restore_view import TaskRestoreView
 from modules.task.rest_api.task_view import TaskView
 
 
@@ -9,10 +11,18 @@ class TaskRouter:
         blueprint.add_url_rule(
             "/accounts/<account_id>/tasks", view_func=TaskView.as_view("task_view"), methods=["POST", "GET"]
         )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:batch", view_func=TaskBatchView.as_view("task_batch_view"), methods=["POST"]
+        )
         blueprint.add_url_rule(
             "/accounts/<account_id>/tasks/<task_id>",
             view_func=TaskView.as_view("task_view_by_id"),
             methods=["GET", "PATCH", "DELETE"],
         )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>:restore",
+            view_func=TaskRestoreView.as_view("task_restore_view"),
+            methods=["POST"],
+        )
 
         return blueprint
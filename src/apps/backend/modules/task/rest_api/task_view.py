@@ -6,9 +6,10 @@ from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
 from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
-from modules.application.common.types import PaginationParams
+from modules.application.common.types import PaginationParams, SortDirection, SortParams, TotalCountMode
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
 from modules.task.errors import TaskBadRequestError
+from modules.task.internal.task_util import TaskUtil
 from modules.task.task_service import TaskService
 from modules.task.types import (
     CreateTaskParams,
@@ -18,6 +19,11 @@ from modules.task.types import (
     UpdateTaskParams,
 )
 
+TASK_LIST_INCLUDE_COMMENT_STATS = "comment_stats"
+TASK_LIST_INCLUDE_OPTIONS = [TASK_LIST_INCLUDE_COMMENT_STATS]
+# Both are listed newest first; last_commented_at only lists tasks that have been commented on
+TASK_LIST_SORT_FIELDS = ["created_at", "last_commented_at"]
+
 
 class TaskView(MethodView):
     @access_auth_middleware
@@ -38,7 +44,7 @@ class TaskView(MethodView):
         )
 
         created_task = TaskService.create_task(params=create_task_params)
-        task_dict = asdict(created_task)
+        task_dict = TaskUtil.task_to_dict(created_task)
 
         return jsonify(task_dict), 201
 
@@ -47,11 +53,15 @@ class TaskView(MethodView):
         if task_id:
             task_params = GetTaskParams(account_id=account_id, task_id=task_id)
             task = TaskService.get_task(params=task_params)
-            task_dict = asdict(task)
+            task_dict = TaskUtil.task_to_dict(task)
             return jsonify(task_dict), 200
         else:
             page = request.args.get("page", type=int)
             size = request.args.get("size", type=int)
+            cursor = request.args.get("cursor")
+            include_total = request.args.get("include_total", TotalCountMode.EXACT.value)
+            include = [value for value in request.args.get("include", "").split(",") if value]
+            sort_by = request.args.get("sort_by", TASK_LIST_SORT_FIELDS[0])
 
             if page is not None and page < 1:
                 raise TaskBadRequestError("Page must be greater than 0")
@@ -59,17 +69,35 @@ class TaskView(MethodView):
             if size is not None and size < 1:
                 raise TaskBadRequestError("Size must be greater than 0")
 
+            try:
+                total_count_mode = TotalCountMode.from_string(include_total.lower())
+            except ValueError:
+                raise TaskBadRequestError("include_total must be one of: exact, estimated, false")
+
+            if any(value not in TASK_LIST_INCLUDE_OPTIONS for value in include):
+                raise TaskBadRequestError(f"include must be one of: {', '.join(TASK_LIST_INCLUDE_OPTIONS)}")
+
+            if sort_by not in TASK_LIST_SORT_FIELDS:
+                raise TaskBadRequestError(f"sort_by must be one of: {', '.join(TASK_LIST_SORT_FIELDS)}")
+
             if page is None:
                 page = DEFAULT_PAGINATION_PARAMS.page
             if size is None:
                 size = DEFAULT_PAGINATION_PARAMS.size
 
-            pagination_params = PaginationParams(page=page, size=size, offset=0)
-            tasks_params = GetPaginatedTasksParams(account_id=account_id, pagination_params=pagination_params)
+            pagination_params = PaginationParams(page=page, size=size, offset=0, cursor=cursor or None)
+            tasks_params = GetPaginatedTasksParams(
+                account_id=account_id,
+                pagination_params=pagination_params,
+                sort_params=SortParams(sort_by=sort_by, sort_direction=SortDirection.DESC),
+                total_count_mode=total_count_mode,
+                include_comment_stats=TASK_LIST_INCLUDE_COMMENT_STATS in include,
+            )
 
             pagination_result = TaskService.get_paginated_tasks(params=tasks_params)
 
             response_data = asdict(pagination_result)
+            response_data["items"] = [TaskUtil.task_to_dict(task) for task in pagination_result.items]
 
             return jsonify(response_data), 200
 
@@ -91,7 +119,7 @@ class TaskView(MethodView):
         )
 
         updated_task = TaskService.update_task(params=update_task_params)
-        task_dict = asdict(updated_task)
+        task_dict = TaskUtil.task_to_dict(updated_task)
 
         return jsonify(task_dict), 200
 
@@ -1,12 +1,22 @@
+from typing import List
+
 from modules.application.common.types import PaginationResult
 from modules.task.internal.task_reader import TaskReader
 from modules.task.internal.task_writer import TaskWriter
 from modules.task.types import (
+    ActiveTaskCountsRepairResult,
+    ArchiveInactiveTasksParams,
     CreateTaskParams,
     DeleteTaskParams,
     GetPaginatedTasksParams,
     GetTaskParams,
+    RepairActiveTaskCountsParams,
+    RepairTaskCommentCountersParams,
+    RestoreTaskParams,
+    RunTaskBatchParams,
     Task,
+    TaskBatchOperationResult,
+    TaskCommentCountersRepairResult,
     TaskDeletionResult,
     UpdateTaskParams,
 )
@@ -32,3 +42,27 @@ class TaskService:
     @staticmethod
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
         return TaskWriter.delete_task(params=params)
+
+    @staticmethod
+    def restore_task(*, params: RestoreTaskParams) -> Task:
+        return TaskWriter.restore_task(params=params)
+
+    @staticmethod
+    def run_task_batch(*, params: RunTaskBatchParams) -> List[TaskBatchOperationResult]:
+        return TaskWriter.run_task_batch(params=params)
+
+    @staticmethod
+    def repair_comment_counters(*, params: RepairTaskCommentCountersParams) -> TaskCommentCountersRepairResult:
+        return TaskWriter.repair_comment_counters(params=params)
+
+    @staticmethod
+    def repair_active_task_counts(*, params: RepairActiveTaskCountsParams) -> ActiveTaskCountsRepairResult:
+        return TaskWriter.repair_active_task_counts(params=params)
+
+    @staticmethod
+    def deactivate_tasks_for_account(*, account_id: str, batch_size: int) -> int:
+        return TaskWriter.deactivate_tasks_for_account(account_id=account_id, batch_size=batch_size)
+
+    @staticmethod
+    def archive_inactive_tasks(*, params: ArchiveInactiveTasksParams) -> int:
+        return TaskWriter.archive_inactive_tasks(params=params)
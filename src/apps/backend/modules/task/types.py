@@ -1,8 +1,23 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 
-from modules.application.common.types import PaginationParams, SortParams
+from modules.application.common.types import PaginationParams, SortParams, TotalCountMode
+
+
+@dataclass(frozen=True)
+class TaskCommentPreview:
+    id: str
+    account_id: str
+    text: str
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class TaskCommentStats:
+    comment_count: int
+    latest_comment: Optional[TaskCommentPreview] = None
 
 
 @dataclass(frozen=True)
@@ -11,6 +26,9 @@ class Task:
     account_id: str
     description: str
     title: str
+    comment_count: int = 0
+    last_commented_at: Optional[datetime] = None
+    comment_stats: Optional[TaskCommentStats] = None
 
 
 @dataclass(frozen=True)
@@ -24,6 +42,8 @@ class GetPaginatedTasksParams:
     account_id: str
     pagination_params: PaginationParams
     sort_params: Optional[SortParams] = None
+    total_count_mode: TotalCountMode = TotalCountMode.EXACT
+    include_comment_stats: bool = False
 
 
 @dataclass(frozen=True)
@@ -54,7 +74,83 @@ class TaskDeletionResult:
     success: bool
 
 
+class TaskBatchOperationType(Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class TaskBatchOperation:
+    operation: str
+    description: Optional[str] = None
+    task_id: Optional[str] = None
+    title: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RunTaskBatchParams:
+    account_id: str
+    operations: List[TaskBatchOperation]
+
+
+@dataclass(frozen=True)
+class TaskBatchOperationError:
+    code: str
+    message: str
+
+
+@dataclass(frozen=True)
+class TaskBatchOperationResult:
+    index: int
+    operation: str
+    success: bool
+    error: Optional[TaskBatchOperationError] = None
+    task: Optional[Task] = None
+    task_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RestoreTaskParams:
+    account_id: str
+    task_id: str
+
+
+@dataclass(frozen=True)
+class ArchiveInactiveTasksParams:
+    batch_size: int
+    deleted_before: datetime
+
+
+@dataclass(frozen=True)
+class RepairTaskCommentCountersParams:
+    batch_size: int
+    account_id: Optional[str] = None
+    after_task_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TaskCommentCountersRepairResult:
+    tasks_checked: int
+    tasks_repaired: int
+    last_task_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RepairActiveTaskCountsParams:
+    batch_size: int
+    after_task_count_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ActiveTaskCountsRepairResult:
+    task_counts_checked: int
+    task_counts_repaired: int
+    last_task_count_id: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class TaskErrorCode:
     NOT_FOUND: str = "TASK_ERR_01"
     BAD_REQUEST: str = "TASK_ERR_02"
+    WRITE_FAILED: str = "TASK_ERR_03"
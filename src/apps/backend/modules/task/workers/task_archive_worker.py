@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+from modules.task.types import ArchiveInactiveTasksParams
+
+TASK_ARCHIVE_BATCH_SIZE = ConfigService[int].bind(key="tasks.archive.batch_size")
+TASK_ARCHIVE_RETENTION_IN_DAYS = ConfigService[int].bind(key="tasks.archive.retention_in_days")
+
+
+class TaskArchiveWorker(BaseWorker):
+    max_execution_time_in_seconds = 3600
+    # Batches are copied to the archive before they are deleted, so a retried run redoes at most one batch
+    max_retries = 3
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        params = ArchiveInactiveTasksParams(
+            batch_size=TASK_ARCHIVE_BATCH_SIZE.get(),
+            deleted_before=datetime.now() - timedelta(days=TASK_ARCHIVE_RETENTION_IN_DAYS.get()),
+        )
+        progress = {"tasks_archived": 0}
+
+        while True:
+            archived_count, progress = await TaskArchiveWorker.run_batch(
+                lambda: TaskService.archive_inactive_tasks(params=params), progress, TaskArchiveWorker._add_to_progress
+            )
+            if archived_count == 0:
+                break
+
+        Logger.info(message=f"Task archive finished: {progress['tasks_archived']} tasks archived")
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
+
+    @staticmethod
+    def _add_to_progress(progress: Dict[str, int], archived_count: int) -> Dict[str, int]:
+        return {"tasks_archived": progress["tasks_archived"] + archived_count}
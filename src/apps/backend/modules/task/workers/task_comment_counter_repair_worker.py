@@ -0,0 +1,52 @@
+from typing import Any, Dict, Optional
+
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+from modules.task.types import RepairTaskCommentCountersParams, TaskCommentCountersRepairResult
+
+TASK_COMMENT_COUNTER_REPAIR_BATCH_SIZE = ConfigService[int].bind(key="tasks.comment_counter_repair.batch_size")
+
+
+class TaskCommentCounterRepairWorker(BaseWorker):
+    max_execution_time_in_seconds = 3600
+    # Every batch recomputes counters from the comments, so a retried run just starts the scan over
+    max_retries = 3
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        account_id: Optional[str] = args[0] if args else None
+        batch_size = TASK_COMMENT_COUNTER_REPAIR_BATCH_SIZE.get()
+        after_task_id: Optional[str] = None
+        progress = {"tasks_checked": 0, "tasks_repaired": 0}
+
+        while True:
+            result, progress = await TaskCommentCounterRepairWorker.run_batch(
+                lambda: TaskService.repair_comment_counters(
+                    params=RepairTaskCommentCountersParams(
+                        account_id=account_id, after_task_id=after_task_id, batch_size=batch_size
+                    )
+                ),
+                progress,
+                TaskCommentCounterRepairWorker._add_to_progress,
+            )
+            if result.last_task_id is None:
+                break
+
+            after_task_id = result.last_task_id
+
+        Logger.info(
+            message=f"Task comment counter repair finished: {progress['tasks_checked']} tasks checked, "
+            f"{progress['tasks_repaired']} repaired"
+        )
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
+
+    @staticmethod
+    def _add_to_progress(progress: Dict[str, int], result: TaskCommentCountersRepairResult) -> Dict[str, int]:
+        return {
+            "tasks_checked": progress["tasks_checked"] + result.tasks_checked,
+            "tasks_repaired": progress["tasks_repaired"] + result.tasks_repaired,
+        }
@@ -0,0 +1,49 @@
+from typing import Any, Dict, Optional
+
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+from modules.task.types import ActiveTaskCountsRepairResult, RepairActiveTaskCountsParams
+
+TASK_COUNT_REPAIR_BATCH_SIZE = ConfigService[int].bind(key="tasks.count_repair.batch_size")
+
+
+class TaskCountRepairWorker(BaseWorker):
+    max_execution_time_in_seconds = 3600
+    # Every batch recounts the accounts' tasks, so a retried run just starts the scan over
+    max_retries = 3
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        batch_size = TASK_COUNT_REPAIR_BATCH_SIZE.get()
+        after_task_count_id: Optional[str] = None
+        progress = {"task_counts_checked": 0, "task_counts_repaired": 0}
+
+        while True:
+            result, progress = await TaskCountRepairWorker.run_batch(
+                lambda: TaskService.repair_active_task_counts(
+                    params=RepairActiveTaskCountsParams(batch_size=batch_size, after_task_count_id=after_task_count_id)
+                ),
+                progress,
+                TaskCountRepairWorker._add_to_progress,
+            )
+            if result.last_task_count_id is None:
+                break
+
+            after_task_count_id = result.last_task_count_id
+
+        Logger.info(
+            message=f"Task count repair finished: {progress['task_counts_checked']} counters checked, "
+            f"{progress['task_counts_repaired']} repaired"
+        )
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
+
+    @staticmethod
+    def _add_to_progress(progress: Dict[str, int], result: ActiveTaskCountsRepairResult) -> Dict[str, int]:
+        return {
+            "task_counts_checked": progress["task_counts_checked"] + result.task_counts_checked,
+            "task_counts_repaired": progress["task_counts_repaired"] + result.task_counts_repaired,
+        }
@@ -0,0 +1,47 @@
+import importlib
+from pathlib import Path
+from typing import List, Type
+
+import modules
+from modules.application.repository import ApplicationRepository
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+
+REPOSITORY_MODULE_SUFFIX = "_repository"
+
+
+class SyncCollections:
+    """
+    Applies the indexes and validators of every repository. Run once per deploy, before the app servers start:
+    make run-script file=sync_collections
+    """
+
+    @staticmethod
+    def get_repositories() -> List[Type[ApplicationRepository]]:
+        # Repositories register themselves by subclassing, so their modules only need to be imported
+        # Several module packages are namespace packages, which pkgutil.walk_packages does not descend into
+        for modules_path in modules.__path__:
+            for module_file in sorted(Path(modules_path).rglob(f"*{REPOSITORY_MODULE_SUFFIX}.py")):
+                module_parts = module_file.relative_to(modules_path).with_suffix("").parts
+                importlib.import_module(".".join([modules.__name__, *module_parts]))
+
+        repositories: List[Type[ApplicationRepository]] = []
+        pending: List[Type[ApplicationRepository]] = list(ApplicationRepository.__subclasses__())
+        while pending:
+            repository = pending.pop(0)
+            pending.extend(repository.__subclasses__())
+            if isinstance(repository.__dict__.get("collection_name"), str):
+                repositories.append(repository)
+
+        return sorted(repositories, key=lambda repository: repository.__name__)
+
+    @staticmethod
+    def run() -> None:
+        for repository in SyncCollections.get_repositories():
+            repository.sync_collection()
+            Logger.info(message=f"Synced indexes and validator for collection {repository.collection_name}")
+
+
+if __name__ == "__main__":
+    LoggerManager.mount_logger()
+    SyncCollections.run()
@@ -15,6 +15,9 @@ from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.logger.logger_manager import LoggerManager
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
+from modules.task.workers.task_archive_worker import TaskArchiveWorker
+from modules.task.workers.task_comment_counter_repair_worker import TaskCommentCounterRepairWorker
+from modules.task.workers.task_count_repair_worker import TaskCountRepairWorker
 from scripts.bootstrap_app import BootstrapApp
 
 load_dotenv()
@@ -36,6 +39,22 @@ try:
     # In production, it is optional to run this worker
     ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/10 * * * *")
 
+    # Corrects comment counters on task documents that drifted from the comments collection
+    ApplicationService.schedule_worker_as_cron(
+        cls=TaskCommentCounterRepairWorker,
+        cron_schedule=ConfigService[str].get_value(key="tasks.comment_counter_repair.cron_schedule"),
+    )
+
+    # Moves tasks deleted longer ago than the retention period out of the tasks collection
+    ApplicationService.schedule_worker_as_cron(
+        cls=TaskArchiveWorker, cron_schedule=ConfigService[str].get_value(key="tasks.archive.cron_schedule")
+    )
+
+    # Corrects per-account active task counters that drifted from the tasks collection
+    ApplicationService.schedule_worker_as_cron(
+        cls=TaskCountRepairWorker, cron_schedule=ConfigService[str].get_value(key="tasks.count_repair.cron_schedule")
+    )
+
 except WorkerClientConnectionError as e:
     Logger.critical(message=e.message)
 
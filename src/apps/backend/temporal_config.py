@@ -2,12 +2,26 @@ from typing import List, Type
 
 from temporalio import activity, workflow
 
+from modules.account.workers.account_deletion_cleanup_worker import AccountDeletionCleanupWorker
 from modules.application.types import BaseWorker, RegisteredWorker
 from modules.application.workers.health_check_worker import HealthCheckWorker
+from modules.notification.workers.bulk_notification_worker import BulkNotificationWorker
+from modules.notification.workers.notification_dispatch_worker import NotificationDispatchWorker
+from modules.task.workers.task_archive_worker import TaskArchiveWorker
+from modules.task.workers.task_comment_counter_repair_worker import TaskCommentCounterRepairWorker
+from modules.task.workers.task_count_repair_worker import TaskCountRepairWorker
 
 
 class TemporalConfig:
-    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker]
+    WORKERS: List[Type[BaseWorker]] = [
+        HealthCheckWorker,
+        NotificationDispatchWorker,
+        BulkNotificationWorker,
+        TaskCommentCounterRepairWorker,
+        AccountDeletionCleanupWorker,
+        TaskArchiveWorker,
+        TaskCountRepairWorker,
+    ]
 
     REGISTERED_WORKERS: List[RegisteredWorker] = []
 
@@ -5,6 +5,7 @@ from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
 from modules.logger.logger_manager import LoggerManager
+from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
@@ -21,3 +22,4 @@ class BaseTestAccount(unittest.TestCase):
         AccountRepository.collection().delete_many({})
         OTPRepository.collection().delete_many({})
         AccountNotificationPreferencesRepository.collection().delete_many({})
+        AccountNotificationPreferenceUtil.get_preferences_cache().clear()
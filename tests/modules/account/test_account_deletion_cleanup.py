@@ -0,0 +1,154 @@
+import asyncio
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from unittest import mock
+
+from bson.objectid import ObjectId
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByUsernameAndPasswordParams, PhoneNumber
+from modules.account.workers.account_deletion_cleanup_worker import (
+    ACCOUNT_DELETION_CLEANUP_BATCH_INTERVAL_IN_SECONDS,
+    ACCOUNT_DELETION_CLEANUP_BATCH_SIZE,
+    AccountDeletionCleanupWorker,
+)
+from modules.application.application_service import ApplicationService
+from modules.application.errors import WorkerStartError
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.authentication.types import OTPStatus
+from modules.comment.comment_service import CommentService
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.comment.types import CreateCommentParams
+from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.notification.notification_service import NotificationService
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import CreateTaskParams
+from tests.modules.account.base_test_account import BaseTestAccount
+
+
+class TestAccountDeletionCleanup(BaseTestAccount):
+    PHONE_NUMBER = PhoneNumber(country_code="+91", phone_number="9999999999")
+
+    def teardown_method(self, method) -> None:
+        super().teardown_method(method)
+        TaskRepository.collection().delete_many({})
+        TaskCountRepository.collection().delete_many({})
+        CommentRepository.collection().delete_many({})
+        PasswordResetTokenRepository.collection().delete_many({})
+
+    def _create_account_with_dependent_documents(self) -> str:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        for i in range(5):
+            task = TaskService.create_task(
+                params=CreateTaskParams(account_id=account.id, title=f"Task {i}", description=f"Description {i}")
+            )
+            CommentService.create_comment(
+                params=CreateCommentParams(account_id=account.id, task_id=task.id, text=f"Comment {i}")
+            )
+        OTPRepository.collection().insert_many(
+            [
+                {
+                    "active": True,
+                    "otp_code": "1234",
+                    "phone_number": asdict(self.PHONE_NUMBER),
+                    "status": OTPStatus.PENDING,
+                    "created_at": datetime.now(),
+                    "updated_at": datetime.now(),
+                }
+                for _ in range(3)
+            ]
+        )
+        PasswordResetTokenRepository.collection().insert_one(
+            {
+                "account": ObjectId(account.id),
+                "expires_at": datetime.now() + timedelta(hours=1),
+                "token": "token-hash",
+                "is_used": False,
+            }
+        )
+        return account.id
+
+    def test_cleanup_worker_removes_dependent_documents_in_batches(self) -> None:
+        account_id = self._create_account_with_dependent_documents()
+        # Warm the preferences cache so that the cleanup has to invalidate it
+        AccountNotificationPreferenceReader.get_cached_account_notification_preferences_by_account_id(account_id)
+
+        with (
+            mock.patch.object(ACCOUNT_DELETION_CLEANUP_BATCH_SIZE, "get", return_value=2),
+            mock.patch.object(ACCOUNT_DELETION_CLEANUP_BATCH_INTERVAL_IN_SECONDS, "get", return_value=0),
+        ):
+            asyncio.run(AccountDeletionCleanupWorker.execute(account_id, asdict(self.PHONE_NUMBER)))
+
+        assert TaskRepository.collection().count_documents({"account_id": account_id, "active": True}) == 0
+        assert TaskRepository.collection().count_documents({"account_id": account_id, "active": False}) == 5
+        assert CommentRepository.collection().count_documents({"account_id": account_id}) == 0
+        assert TaskRepository.collection().count_documents({"account_id": account_id, "comment_count": {"$ne": 0}}) == 0
+        assert (
+            OTPRepository.collection().count_documents({"phone_number": asdict(self.PHONE_NUMBER), "active": True}) == 0
+        )
+        assert PasswordResetTokenRepository.collection().count_documents({"is_used": False}) == 0
+        assert (
+            AccountNotificationPreferencesRepository.collection().count_documents(
+                {"account_id": account_id, "active": True}
+            )
+            == 0
+        )
+        assert AccountNotificationPreferenceUtil.get_preferences_cache().get(account_id) is None
+        assert NotificationService.get_account_notification_preferences_by_account_ids(account_ids=[account_id]) == {}
+
+    def test_cleanup_worker_is_idempotent(self) -> None:
+        account_id = self._create_account_with_dependent_documents()
+
+        with mock.patch.object(ACCOUNT_DELETION_CLEANUP_BATCH_INTERVAL_IN_SECONDS, "get", return_value=0):
+            asyncio.run(AccountDeletionCleanupWorker.execute(account_id, None))
+            asyncio.run(AccountDeletionCleanupWorker.execute(account_id, None))
+
+        assert TaskRepository.collection().count_documents({"account_id": account_id, "active": False}) == 5
+        # Without a phone number the account's OTPs are left alone
+        assert OTPRepository.collection().count_documents({"active": True}) == 3
+
+    @mock.patch.object(ApplicationService, "run_worker_immediately", return_value="cleanup-worker-id")
+    def test_delete_account_starts_cleanup_worker(self, mock_run_worker_immediately: mock.MagicMock) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        deletion_result = AccountService.delete_account(account_id=account.id)
+
+        assert deletion_result.success is True
+        assert deletion_result.cleanup_worker_id == "cleanup-worker-id"
+        mock_run_worker_immediately.assert_called_once_with(
+            cls=AccountDeletionCleanupWorker, arguments=(account.id, None)
+        )
+
+    @mock.patch.object(
+        ApplicationService,
+        "run_worker_immediately",
+        side_effect=WorkerStartError(worker_name=AccountDeletionCleanupWorker.__name__),
+    )
+    def test_delete_account_succeeds_when_cleanup_cannot_start(self, _: mock.MagicMock) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        deletion_result = AccountService.delete_account(account_id=account.id)
+
+        assert deletion_result.success is True
+        assert deletion_result.cleanup_worker_id is None
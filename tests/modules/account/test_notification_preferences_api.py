@@ -1,9 +1,13 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from server import app
 
 from modules.account.account_service import AccountService
 from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
 from tests.modules.account.base_test_account import BaseTestAccount
@@ -378,3 +382,45 @@ class TestNotificationPreferencesApi(BaseTestAccount):
             assert response.json["sms_enabled"] is False
             assert "account_id" in response.json
             assert response.json["account_id"] == account2.id
+
+    def test_update_notification_preferences_concurrently_creates_single_document(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        with app.test_client() as client:
+            access_token_response = client.post(
+                "http://127.0.0.1:8080/api/access-tokens",
+                headers=HEADERS,
+                data=json.dumps({"username": account.username, "password": "password"}),
+            )
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {access_token_response.json.get('token')}",
+        }
+
+        def update_preferences(i: int) -> int:
+            with app.test_client() as thread_client:
+                response = thread_client.patch(
+                    f"{ACCOUNT_URL}/{account.id}/notification-preferences",
+                    headers=headers,
+                    data=json.dumps({"email_enabled": i % 2 == 0}),
+                )
+                return response.status_code
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            status_codes = list(executor.map(update_preferences, range(64)))
+
+        assert status_codes == [200] * 64
+        assert (
+            AccountNotificationPreferencesRepository.collection().count_documents(
+                {"account_id": account.id, "active": True}
+            )
+            == 1
+        )
+
+        preferences = NotificationService.get_account_notification_preferences_by_account_id(account_id=account.id)
+        assert preferences.push_enabled is True
+        assert preferences.sms_enabled is True
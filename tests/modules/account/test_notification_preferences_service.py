@@ -4,9 +4,14 @@ from modules.account.types import (
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
 )
+from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
 from tests.modules.account.base_test_account import BaseTestAccount
+from tests.modules.application.command_counter import count_commands
 
 
 class TestNotificationPreferencesService(BaseTestAccount):
@@ -209,3 +214,56 @@ class TestNotificationPreferencesService(BaseTestAccount):
         assert preferences.email_enabled is True
         assert preferences.push_enabled is True
         assert preferences.sms_enabled is True
+
+    def test_cached_preferences_are_invalidated_on_update(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="Test", last_name="User", password="password123", username="testuser@example.com"
+            )
+        )
+
+        for _ in range(3):
+            preferences = AccountNotificationPreferenceReader.get_cached_account_notification_preferences_by_account_id(
+                account.id
+            )
+            assert preferences.email_enabled is True
+
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=account.id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False)
+        )
+        preferences = AccountNotificationPreferenceReader.get_cached_account_notification_preferences_by_account_id(
+            account.id
+        )
+
+        assert preferences.email_enabled is False
+        stats = NotificationService.get_account_notification_preferences_cache_stats()
+        assert stats.hits == 2
+        assert stats.misses == 2
+
+    def test_bulk_preferences_lookup_uses_a_single_query(self) -> None:
+        account_ids = []
+        for i in range(50):
+            account = AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="Test", last_name="User", password="password123", username=f"user{i}@example.com"
+                )
+            )
+            account_ids.append(account.id)
+
+        result = {}
+        operations = count_commands(
+            [AccountNotificationPreferencesRepository],
+            lambda: result.update(
+                NotificationService.get_account_notification_preferences_by_account_ids(
+                    account_ids=account_ids + ["missing_account_id"]
+                )
+            ),
+        )
+        assert operations == {"find": 1}
+        assert set(result.keys()) == set(account_ids)
+
+        operations = count_commands(
+            [AccountNotificationPreferencesRepository],
+            lambda: NotificationService.get_account_notification_preferences_by_account_ids(account_ids=account_ids),
+        )
+        assert operations == {}
@@ -0,0 +1,45 @@
+from collections import Counter
+from typing import Any, Callable, Dict, Sequence, Type
+
+from pymongo import MongoClient, monitoring
+
+from modules.application.repository import ApplicationRepository
+from modules.config.config_service import ConfigService
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self) -> None:
+        self.commands: Counter = Counter()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self.commands[event.command_name] += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+def count_commands(repositories: Sequence[Type[ApplicationRepository]], operation: Callable[[], Any]) -> Dict[str, int]:
+    # Route the repositories through a client that records the commands sent to the server
+    command_counter = CommandCounter()
+    client: MongoClient = MongoClient(
+        ConfigService[str].get_value(key="mongodb.uri"), event_listeners=[command_counter]
+    )
+    original_collections = {}
+    for repository in repositories:
+        # Initialise the collection first so that index/validator commands are not part of the measurement
+        original_collections[repository] = repository.collection()
+        repository._collection = client.get_database()[original_collections[repository].name]
+
+    try:
+        operation()
+        # Snapshot before closing the client, which sends endSessions
+        commands = dict(command_counter.commands)
+    finally:
+        for repository, collection in original_collections.items():
+            repository._collection = collection
+        client.close()
+
+    return commands
@@ -46,6 +46,23 @@ class TestApplicationService(BaseTestApplication):
         with pytest.raises(WorkerNotRegisteredError):
             ApplicationService.run_worker_immediately(cls=UnRegisteredWorker)
 
+    def test_run_workers_in_bulk(self) -> None:
+        list_of_arguments = [() for _ in range(5)]
+        results = ApplicationService.run_workers_in_bulk(
+            cls=HealthCheckWorker, list_of_arguments=list_of_arguments, max_concurrency=2
+        )
+
+        assert len(results) == len(list_of_arguments)
+        assert all(result.worker_id and result.error is None for result in results)
+        assert len({result.worker_id for result in results}) == len(list_of_arguments)
+
+    def test_run_workers_in_bulk_with_unregistered_worker(self) -> None:
+        class UnRegisteredWorker(BaseWorker):
+            def run(self) -> None: ...
+
+        with pytest.raises(WorkerNotRegisteredError):
+            ApplicationService.run_workers_in_bulk(cls=UnRegisteredWorker, list_of_arguments=[()])
+
     def test_get_details_with_invalid_worker_id(self) -> None:
         with pytest.raises(WorkerIdNotFoundError):
             ApplicationService.get_worker_by_id(worker_id="invalid_id")
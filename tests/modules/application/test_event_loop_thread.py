@@ -0,0 +1,66 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from modules.application.internal.event_loop_thread import EventLoopThread
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestEventLoopThread(BaseTestApplication):
+    def test_coroutines_from_many_threads_share_one_loop(self) -> None:
+        event_loop_thread = EventLoopThread(name="test-event-loop")
+
+        async def get_loop_and_thread() -> tuple:
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop(), threading.current_thread().name
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: event_loop_thread.run(get_loop_and_thread()), range(32)))
+
+        assert {loop for loop, _ in results} == {event_loop_thread.get_loop()}
+        assert {thread_name for _, thread_name in results} == {"test-event-loop"}
+
+    def test_exceptions_are_raised_in_calling_thread(self) -> None:
+        event_loop_thread = EventLoopThread(name="test-event-loop")
+
+        async def fail() -> None:
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError):
+            event_loop_thread.run(fail())
+
+    def test_new_loop_is_started_after_fork(self) -> None:
+        event_loop_thread = EventLoopThread(name="test-event-loop")
+        loop = event_loop_thread.get_loop()
+
+        with mock.patch.object(os, "getpid", return_value=os.getpid() + 1):
+            assert event_loop_thread.get_loop() is not loop
+
+    def test_dispatch_latency_against_asyncio_run_per_call(self) -> None:
+        calls = 500
+        event_loop_thread = EventLoopThread(name="test-event-loop")
+
+        async def dispatch() -> None:
+            await asyncio.sleep(0)
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            asyncio.run(dispatch())
+        asyncio_run_elapsed = time.perf_counter() - start
+
+        event_loop_thread.get_loop()
+        start = time.perf_counter()
+        for _ in range(calls):
+            event_loop_thread.run(dispatch())
+        event_loop_thread_elapsed = time.perf_counter() - start
+
+        print(
+            f"{calls} dispatches: asyncio.run per call {asyncio_run_elapsed * 1000 / calls:.3f}ms each, "
+            f"persistent loop {event_loop_thread_elapsed * 1000 / calls:.3f}ms each"
+        )
+        assert event_loop_thread_elapsed < asyncio_run_elapsed
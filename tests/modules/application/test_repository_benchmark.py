@@ -0,0 +1,138 @@
+from dataclasses import replace
+from typing import Any, Callable, Dict, Optional, Type
+from unittest import mock
+
+from modules.account.internal.account_writer import AccountWriter
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import CreateAccountByUsernameAndPasswordParams, PhoneNumber
+from modules.application.repository import ApplicationRepository
+from modules.authentication.internals.otp.otp_writer import OTPWriter
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.authentication.types import CreateOTPParams
+from modules.comment.comment_service import CommentService
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.comment.types import CreateCommentParams
+from modules.notification.internals.account_notification_preferences_writer import AccountNotificationPreferenceWriter
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import CreateTaskParams
+from tests.modules.application.base_test_application import BaseTestApplication
+from tests.modules.application.command_counter import count_commands
+
+REPOSITORIES = [
+    AccountRepository,
+    AccountNotificationPreferencesRepository,
+    CommentRepository,
+    OTPRepository,
+    PasswordResetTokenRepository,
+    TaskCountRepository,
+    TaskRepository,
+]
+
+
+def _insert_one_and_read_back(cls: Type[ApplicationRepository], document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    # How the create paths returned the inserted document before insert_one_and_return
+    query = cls.collection().insert_one(document)
+    return cls.collection().find_one({"_id": query.inserted_id})
+
+
+class TestRepositoryBenchmark(BaseTestApplication):
+    def tearDown(self) -> None:
+        for repository in REPOSITORIES:
+            repository.collection().delete_many({})
+
+    def _assert_operations(
+        self,
+        name: str,
+        operation: Callable[[], Any],
+        expected: Dict[str, int],
+        baseline_operation: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        with mock.patch.object(ApplicationRepository, "insert_one_and_return", classmethod(_insert_one_and_read_back)):
+            baseline = count_commands(REPOSITORIES, baseline_operation or operation)
+        operations = count_commands(REPOSITORIES, operation)
+        print(f"{name}: {operations}, reading the inserted document back: {baseline}")
+        assert operations == expected
+        # The only difference from the baseline is the find_one that read the inserted document back
+        assert baseline == {**operations, "find": operations.get("find", 0) + 1}
+
+    def test_notification_preferences_upsert_in_one_command(self) -> None:
+        account = AccountWriter.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                username="benchmark@example.com", password="password", first_name="Bench", last_name="Mark"
+            )
+        )
+
+        operations = count_commands(
+            REPOSITORIES,
+            lambda: AccountNotificationPreferenceWriter.create_or_update_account_notification_preferences(
+                account.id, CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=True)
+            ),
+        )
+
+        print(f"AccountNotificationPreferenceWriter.create_or_update_account_notification_preferences: {operations}")
+        # A single atomic upsert, with no lookup of existing preferences
+        assert operations == {"findAndModify": 1}
+
+    def test_create_paths_do_not_read_back_inserted_documents(self) -> None:
+        account_params = CreateAccountByUsernameAndPasswordParams(
+            username="benchmark@example.com", password="password", first_name="Bench", last_name="Mark"
+        )
+        self._assert_operations(
+            "AccountWriter.create_account_by_username_and_password",
+            lambda: AccountWriter.create_account_by_username_and_password(params=account_params),
+            # The only read left is the username uniqueness check
+            {"find": 1, "insert": 1},
+            lambda: AccountWriter.create_account_by_username_and_password(
+                params=replace(account_params, username="baseline@example.com")
+            ),
+        )
+
+        account = AccountRepository.collection().find_one({"username": "benchmark@example.com"})
+        account_id = str(account["_id"])
+
+        task = TaskService.create_task(
+            params=CreateTaskParams(account_id=account_id, title="Benchmark", description="Benchmark task")
+        )
+        self._assert_operations(
+            "TaskWriter.create_task",
+            lambda: TaskService.create_task(
+                params=CreateTaskParams(account_id=account_id, title="Benchmark", description="Benchmark task")
+            ),
+            # The update is the per-account task counter
+            {"insert": 1, "update": 1},
+        )
+
+        self._assert_operations(
+            "CommentWriter.create_comment",
+            lambda: CommentService.create_comment(
+                params=CreateCommentParams(account_id=account_id, task_id=task.id, text="Benchmark comment")
+            ),
+            # The task's comment counter update doubles as its existence check
+            {"insert": 1, "update": 1},
+        )
+
+        self._assert_operations(
+            "OTPWriter.create_new_otp",
+            lambda: OTPWriter.create_new_otp(
+                params=CreateOTPParams(phone_number=PhoneNumber(country_code="+91", phone_number="9999999999"))
+            ),
+            # Previous OTPs are expired with a single update_many
+            {"insert": 1, "update": 1},
+        )
+
+        self._assert_operations(
+            "PasswordResetTokenWriter.create_password_reset_token",
+            lambda: PasswordResetTokenWriter.create_password_reset_token(account_id, "benchmark-token"),
+            # Earlier tokens of the account are used up with a single update_many
+            {"insert": 1, "update": 1},
+        )
@@ -0,0 +1,37 @@
+import os
+from unittest import mock
+
+from modules.application.application_service import ApplicationService
+from modules.application.repository import ApplicationRepositoryClient
+from modules.config.config_service import ConfigService
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestApplicationRepositoryClient(BaseTestApplication):
+    def test_client_uses_configured_pool_options(self) -> None:
+        client = ApplicationRepositoryClient.get_client()
+
+        assert client.max_pool_size == ConfigService[int].get_value(key="mongodb.pool.max_pool_size")
+        assert client.min_pool_size == ConfigService[int].get_value(key="mongodb.pool.min_pool_size")
+        assert client.max_idle_time_ms == ConfigService[int].get_value(key="mongodb.pool.max_idle_time_ms")
+
+    def test_client_is_cached_per_process(self) -> None:
+        client = ApplicationRepositoryClient.get_client()
+        assert ApplicationRepositoryClient.get_client() is client
+
+        with mock.patch.object(os, "getpid", return_value=os.getpid() + 1):
+            forked_client = ApplicationRepositoryClient.get_client()
+            assert forked_client is not client
+            assert ApplicationRepositoryClient.get_client() is forked_client
+
+        ApplicationRepositoryClient.reset_client()
+
+    def test_reset_client_creates_new_client_and_pool_stats(self) -> None:
+        client = ApplicationRepositoryClient.get_client()
+
+        ApplicationRepositoryClient.reset_client()
+
+        assert ApplicationRepositoryClient.get_client() is not client
+        stats = ApplicationService.get_database_connection_pool_stats()
+        assert stats.connections_created == 0
+        assert stats.connections_checked_out == 0
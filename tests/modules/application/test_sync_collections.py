@@ -0,0 +1,59 @@
+from unittest import mock
+
+from scripts.sync_collections import SyncCollections
+
+from modules.application.repository import ApplicationRepositoryClient
+from modules.config.config_service import ConfigService
+from modules.task.internal.store.task_repository import TaskRepository
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestSyncCollections(BaseTestApplication):
+    def test_every_repository_is_discovered(self) -> None:
+        collection_names = {repository.collection_name for repository in SyncCollections.get_repositories()}
+
+        assert {
+            "accounts",
+            "account_notification_preferences",
+            "comments",
+            "otps",
+            "password_reset_tokens",
+            "task_counts",
+            "tasks",
+            "tasks_archive",
+        } <= collection_names
+
+    def test_sync_is_idempotent(self) -> None:
+        SyncCollections.run()
+        database = ApplicationRepositoryClient.get_client().get_database()
+        indexes_after_first_sync = {
+            repository.collection_name: database[repository.collection_name].index_information()
+            for repository in SyncCollections.get_repositories()
+        }
+
+        SyncCollections.run()
+
+        for repository in SyncCollections.get_repositories():
+            assert database[repository.collection_name].index_information() == (
+                indexes_after_first_sync[repository.collection_name]
+            )
+        assert "active_account_id_created_at_index" in indexes_after_first_sync["tasks"]
+
+    def test_collection_skips_init_when_disabled(self) -> None:
+        original_collection = TaskRepository._collection
+        TaskRepository._collection = None
+        original_get_value = ConfigService.get_value
+
+        def get_value(key: str, default=None):
+            if key == "mongodb.init_collections_on_first_use":
+                return False
+            return original_get_value(key, default)
+
+        try:
+            with mock.patch.object(ConfigService, "get_value", side_effect=get_value):
+                with mock.patch.object(TaskRepository, "on_init_collection") as mock_on_init_collection:
+                    TaskRepository.collection()
+
+            mock_on_init_collection.assert_not_called()
+        finally:
+            TaskRepository._collection = original_collection
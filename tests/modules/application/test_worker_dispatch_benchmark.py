@@ -0,0 +1,56 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+from modules.application.application_service import ApplicationService
+from modules.application.workers.health_check_worker import HealthCheckWorker
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestWorkerDispatchBenchmark(BaseTestApplication):
+    DISPATCHES = 50
+
+    def test_concurrent_dispatch_latency(self) -> None:
+        # Warm up the connection so that only dispatch latency is measured
+        ApplicationService.run_worker_immediately(cls=HealthCheckWorker)
+
+        def dispatch(_: int) -> Tuple[str, float]:
+            start = time.perf_counter()
+            worker_id = ApplicationService.run_worker_immediately(cls=HealthCheckWorker)
+            return worker_id, time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            worker_ids, latencies = zip(*executor.map(dispatch, range(self.DISPATCHES)))
+        latencies = sorted(latencies)
+
+        print(
+            f"{self.DISPATCHES} dispatches from 8 threads: "
+            f"p50 {latencies[len(latencies) // 2] * 1000:.2f}ms, max {latencies[-1] * 1000:.2f}ms"
+        )
+        assert len(set(worker_ids)) == self.DISPATCHES
+
+    def test_bulk_dispatch_throughput(self) -> None:
+        ApplicationService.run_worker_immediately(cls=HealthCheckWorker)
+        list_of_arguments = [(i,) for i in range(self.DISPATCHES)]
+
+        start = time.perf_counter()
+        worker_ids = [
+            ApplicationService.run_worker_immediately(cls=HealthCheckWorker, arguments=arguments)
+            for arguments in list_of_arguments
+        ]
+        sequential_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = ApplicationService.run_workers_in_bulk(cls=HealthCheckWorker, list_of_arguments=list_of_arguments)
+        bulk_elapsed = time.perf_counter() - start
+
+        # Timings depend on the machine, so they are only reported
+        print(
+            f"{self.DISPATCHES} dispatches: sequential {self.DISPATCHES / sequential_elapsed:.1f}/s, "
+            f"bulk {self.DISPATCHES / bulk_elapsed:.1f}/s"
+        )
+        assert all(worker_ids)
+        assert [result.arguments for result in results] == list_of_arguments
+        assert all(result.error is None for result in results)
+        assert all(result.worker_id for result in results)
+        assert len(set(worker_ids) | {result.worker_id for result in results}) == 2 * self.DISPATCHES
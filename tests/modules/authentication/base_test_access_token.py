@@ -2,6 +2,7 @@ import unittest
 from typing import Callable
 
 from modules.account.internal.store.account_repository import AccountRepository
+from modules.authentication.internals.access_token.access_token_util import AccessTokenUtil
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
 
@@ -15,3 +16,13 @@ class BaseTestAccessToken(unittest.TestCase):
         print(f"Executed:: {method.__name__}")
         AccountRepository.collection().delete_many({})
         OTPRepository.collection().delete_many({})
+
+
+class BaseTestAccessTokenCache(unittest.TestCase):
+    def setup_method(self, method: Callable) -> None:
+        print(f"Executing:: {method.__name__}")
+        AccessTokenUtil._get_verified_token_cache().clear()
+
+    def teardown_method(self, method: Callable) -> None:
+        print(f"Executed:: {method.__name__}")
+        AccessTokenUtil._get_verified_token_cache().clear()
@@ -0,0 +1,66 @@
+import time
+from datetime import datetime, timedelta
+from unittest import mock
+
+import jwt
+import pytest
+
+from modules.authentication.errors import AccessTokenExpiredError, AccessTokenInvalidError
+from modules.authentication.internals.access_token.access_token_cache import AccessTokenCache
+from modules.authentication.internals.access_token.access_token_util import AccessTokenUtil
+from modules.authentication.types import AccessTokenPayload
+from modules.config.config_service import ConfigService
+from tests.modules.authentication.base_test_access_token import BaseTestAccessTokenCache
+
+
+class TestAccessTokenCache(BaseTestAccessTokenCache):
+    @staticmethod
+    def _encode_token(account_id: str, expires_at: datetime) -> str:
+        signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
+        return jwt.encode({"account_id": account_id, "exp": expires_at.timestamp()}, signing_key, algorithm="HS256")
+
+    def test_signature_is_verified_only_on_first_sight(self) -> None:
+        token = self._encode_token("account_id", datetime.now() + timedelta(hours=1))
+
+        with mock.patch.object(jwt, "decode", wraps=jwt.decode) as mock_decode:
+            for _ in range(3):
+                assert AccessTokenUtil.verify_access_token(token=token).account_id == "account_id"
+
+        assert mock_decode.call_count == 1
+        stats = AccessTokenUtil.get_verified_token_cache_stats()
+        assert stats.hits == 2
+        assert stats.misses == 1
+        assert stats.size == 1
+
+    def test_cached_token_expires_at_token_expiry(self) -> None:
+        token = self._encode_token("account_id", datetime.now() + timedelta(seconds=1))
+        AccessTokenUtil.verify_access_token(token=token)
+
+        time.sleep(1.1)
+
+        with pytest.raises(AccessTokenExpiredError):
+            AccessTokenUtil.verify_access_token(token=token)
+        assert AccessTokenUtil.get_verified_token_cache_stats().size == 0
+
+    def test_invalid_token_is_not_cached(self) -> None:
+        for _ in range(2):
+            with pytest.raises(AccessTokenInvalidError):
+                AccessTokenUtil.verify_access_token(token="invalid_token")
+
+        stats = AccessTokenUtil.get_verified_token_cache_stats()
+        assert stats.misses == 2
+        assert stats.size == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = AccessTokenCache(max_size=2)
+        expires_at = time.time() + 60
+        cache.set("first", AccessTokenPayload(account_id="first"), expires_at)
+        cache.set("second", AccessTokenPayload(account_id="second"), expires_at)
+        assert cache.get("first") is not None
+
+        cache.set("third", AccessTokenPayload(account_id="third"), expires_at)
+
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+        assert cache.get_stats().size == 2
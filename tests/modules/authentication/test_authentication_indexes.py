@@ -0,0 +1,53 @@
+from typing import Any
+
+from bson.objectid import ObjectId
+
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.config.config_service import ConfigService
+from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
+
+
+class TestAuthenticationIndexes(BaseTestAccessToken):
+    @staticmethod
+    def _get_index_names(plan: dict[str, Any]) -> set[str]:
+        index_names = {plan["indexName"]} if "indexName" in plan else set()
+        for child in [plan.get("inputStage"), *plan.get("inputStages", [])]:
+            if child:
+                index_names |= TestAuthenticationIndexes._get_index_names(child)
+        return index_names
+
+    def test_otp_ttl_and_verify_index(self) -> None:
+        indexes = OTPRepository.collection().index_information()
+
+        assert "phone_number_1" not in indexes
+        assert indexes["created_at_ttl_index"]["expireAfterSeconds"] == ConfigService[int].get_value(
+            key="accounts.otp_ttl_in_seconds"
+        )
+
+        explain = (
+            OTPRepository.collection()
+            .find({"otp_code": "1234", "phone_number": {"country_code": "+91", "phone_number": "9999999999"}})
+            .sort([("_id", -1)])
+            .limit(1)
+            .explain()
+        )
+        assert "phone_number_otp_code_id_index" in self._get_index_names(explain["queryPlanner"]["winningPlan"])
+
+    def test_password_reset_token_ttl_and_account_index(self) -> None:
+        indexes = PasswordResetTokenRepository.collection().index_information()
+
+        assert indexes["expires_at_ttl_index"]["expireAfterSeconds"] == ConfigService[int].get_value(
+            key="accounts.password_reset_token_retention_after_expiry_in_seconds"
+        )
+
+        explain = (
+            PasswordResetTokenRepository.collection()
+            .find({"account": ObjectId()})
+            .sort([("expires_at", -1)])
+            .limit(1)
+            .explain()
+        )
+        assert "account_expires_at_index" in self._get_index_names(explain["queryPlanner"]["winningPlan"])
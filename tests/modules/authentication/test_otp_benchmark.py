@@ -0,0 +1,41 @@
+from dataclasses import asdict
+
+from modules.account.types import PhoneNumber
+from modules.authentication.internals.otp.otp_writer import OTPWriter
+from modules.authentication.internals.otp.store.otp_model import OTPModel
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.types import CreateOTPParams, OTPStatus
+from tests.modules.application.command_counter import count_commands
+from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
+
+
+class TestOTPBenchmark(BaseTestAccessToken):
+    BACKLOG_SIZES = [0, 10, 100, 1000]
+
+    def _create_active_otp_backlog(self, phone_number: PhoneNumber, size: int) -> None:
+        if size == 0:
+            return
+        OTPRepository.collection().insert_many(
+            [
+                OTPModel(
+                    active=True, id=None, otp_code="1234", phone_number=phone_number, status=OTPStatus.PENDING
+                ).to_bson()
+                for _ in range(size)
+            ]
+        )
+
+    def test_expire_previous_otps_round_trips_are_constant(self) -> None:
+        for i, backlog_size in enumerate(self.BACKLOG_SIZES):
+            phone_number = PhoneNumber(country_code="+91", phone_number=f"999999{i:04d}")
+            self._create_active_otp_backlog(phone_number, backlog_size)
+
+            commands = count_commands(
+                [OTPRepository], lambda: OTPWriter.create_new_otp(params=CreateOTPParams(phone_number=phone_number))
+            )
+
+            # Expiring the backlog one document at a time used to cost a find plus one update per active OTP
+            print(f"backlog {backlog_size}: {commands} (before: find=1, update={backlog_size}, insert=1)")
+            assert commands == {"insert": 1, "update": 1}
+            assert (
+                OTPRepository.collection().count_documents({"phone_number": asdict(phone_number), "active": True}) == 1
+            )
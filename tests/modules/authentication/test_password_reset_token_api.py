@@ -1,6 +1,7 @@
 import json
 from unittest import mock
 
+from bson.objectid import ObjectId
 from server import app
 
 from modules.account.account_service import AccountService
@@ -10,6 +11,9 @@ from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.errors import PasswordResetTokenNotFoundError
 from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
 from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
 from modules.notification.email_service import EmailService
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
@@ -97,6 +101,50 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             self.assertTrue(updated_password_reset_token.is_used)
             self.assertTrue(mock_send_email.called)
 
+    @mock.patch.object(EmailService, "send_email_for_account")
+    def test_reset_account_password_stores_keyed_token_digest(self, mock_send_email):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+        password_reset_token = PasswordResetTokenWriter.create_password_reset_token(account.id, token)
+
+        self.assertEqual(password_reset_token.token, PasswordResetTokenUtil.hash_password_reset_token(token))
+        self.assertFalse(PasswordResetTokenUtil.is_legacy_password_reset_token_hash(password_reset_token.token))
+
+    @mock.patch.object(EmailService, "send_email_for_account")
+    def test_reset_account_password_with_legacy_bcrypt_token(self, mock_send_email):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenRepository.collection().insert_one(
+            {
+                "account": ObjectId(account.id),
+                "expires_at": PasswordResetTokenUtil.get_token_expires_at(),
+                "token": PasswordResetTokenUtil.hash_password(token),
+                "is_used": False,
+            }
+        )
+
+        reset_password_params = {"new_password": "new_password", "token": token}
+
+        with app.test_client() as client:
+            response = client.patch(
+                f"{ACCOUNT_API_URL}/{account.id}", headers=HEADERS, data=json.dumps(reset_password_params)
+            )
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json["id"], account.id)
+            updated_password_reset_token = AuthenticationService.get_password_reset_token_by_account_id(account.id)
+            self.assertTrue(updated_password_reset_token.is_used)
+
     @mock.patch.object(EmailService, "send_email_for_account")
     def test_reset_account_password_account_not_found(self, mock_send_email):
         account_id = "661e42ec98423703a299a899"
@@ -174,6 +222,35 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             )
             self.assertTrue(mock_send_email.called)
 
+    @mock.patch.object(EmailService, "send_email_for_account")
+    def test_reset_account_password_with_superseded_token(self, mock_send_email):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        old_token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenWriter.create_password_reset_token(account.id, old_token)
+        PasswordResetTokenWriter.create_password_reset_token(
+            account.id, PasswordResetTokenUtil.generate_password_reset_token()
+        )
+
+        reset_password_params = {"new_password": "new_password", "token": old_token}
+
+        with app.test_client() as client:
+            response = client.patch(
+                f"{ACCOUNT_API_URL}/{account.id}", headers=HEADERS, data=json.dumps(reset_password_params)
+            )
+
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(
+                response.json["message"],
+                AccountBadRequestError(
+                    f"Password reset is already used for accountId {account.id}. Please retry with new link"
+                ).message,
+            )
+
     @mock.patch.object(EmailService, "send_email_for_account")
     def test_reset_account_password_invalid_token(self, mock_send_email):
         account = AccountService.create_account_by_username_and_password(
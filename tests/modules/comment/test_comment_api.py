@@ -1,5 +1,11 @@
+import base64
+
+from bson import json_util
+from server import app
+
 from modules.authentication.types import AccessTokenErrorCode
 from modules.comment.errors import CommentBadRequestError
+from modules.comment.internal.store.comment_repository import CommentRepository
 from modules.comment.types import CommentErrorCode
 from tests.modules.comment.base_test_comment import BaseTestComment
 
@@ -53,6 +59,7 @@ class TestCommentApi(BaseTestComment):
         response = self.make_authenticated_request("POST", account.id, fake_task_id, token, data=comment_data)
 
         self.assert_error_response(response, 404, CommentErrorCode.NOT_FOUND)
+        assert CommentRepository.collection().count_documents({"task_id": fake_task_id}) == 0
 
     def test_get_comment_success(self) -> None:
         account, token = self.create_account_and_get_token()
@@ -141,3 +148,50 @@ class TestCommentApi(BaseTestComment):
             AccessTokenErrorCode.ACCESS_TOKEN_INVALID,
             AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND,
         ], f"Expected a valid error code, got {response.json.get('code')}"
+
+    def test_list_comments_paginates_with_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account.id)
+        created_comments = [self.create_test_comment(account.id, task.id, text=f"Comment {i}") for i in range(5)]
+
+        texts = []
+        cursor = None
+        for _ in range(3):
+            url = f"{self.get_comment_api_url(account.id, task.id)}?size=2" + (f"&cursor={cursor}" if cursor else "")
+            with app.test_client() as client:
+                response = client.get(url, headers={"Authorization": f"Bearer {token}"})
+
+            assert response.status_code == 200
+            assert response.json["total_count"] == 5
+            texts.extend(comment["text"] for comment in response.json["items"])
+            cursor = response.json["next_cursor"]
+
+        assert texts == [comment.text for comment in created_comments]
+        assert cursor is None
+
+    def test_list_comments_with_invalid_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account.id)
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_comment_api_url(account.id, task.id)}?cursor=invalid",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        self.assert_error_response(response, 400, CommentErrorCode.BAD_REQUEST)
+
+    def test_list_comments_with_operator_in_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account.id)
+        cursor = base64.urlsafe_b64encode(
+            json_util.dumps({"sort_by": "created_at", "value": {"$ne": None}, "id": {"$ne": None}}).encode()
+        ).decode()
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_comment_api_url(account.id, task.id)}?cursor={cursor}",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        self.assert_error_response(response, 400, CommentErrorCode.BAD_REQUEST)
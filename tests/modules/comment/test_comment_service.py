@@ -1,12 +1,17 @@
 from datetime import datetime
 
+from modules.application.common.base_model import BaseModel
+from modules.application.common.types import PaginationParams, TotalCountMode
 from modules.comment.comment_service import CommentService
 from modules.comment.errors import CommentNotFoundError
+from modules.comment.internal.comment_reader import DEFAULT_COMMENT_SORT_PARAMS
+from modules.comment.internal.store.comment_repository import CommentRepository
 from modules.comment.types import (
     CommentErrorCode,
     CreateCommentParams,
     DeleteCommentParams,
     GetCommentParams,
+    GetPaginatedCommentsParams,
     UpdateCommentParams,
 )
 from tests.modules.comment.base_test_comment import BaseTestComment
@@ -90,3 +95,50 @@ class TestCommentService(BaseTestComment):
             CommentService.delete_comment(params=params)
         except CommentNotFoundError as e:
             assert e.code == CommentErrorCode.NOT_FOUND
+
+    def test_get_paginated_comments(self) -> None:
+        for i in range(3):
+            self.create_test_comment(self.account.id, self.task.id, text=f"Comment {i}")
+        other_task = self.create_test_task(self.account.id, title="Other task")
+        self.create_test_comment(self.account.id, other_task.id)
+
+        result = CommentService.get_paginated_comments(
+            params=GetPaginatedCommentsParams(
+                account_id=self.account.id,
+                task_id=self.task.id,
+                pagination_params=PaginationParams(page=1, size=2),
+                total_count_mode=TotalCountMode.NONE,
+            )
+        )
+
+        assert [comment.text for comment in result.items] == ["Comment 0", "Comment 1"]
+        assert result.total_count is None
+        assert result.next_cursor is not None
+
+    def test_get_paginated_comments_of_other_accounts_task(self) -> None:
+        self.create_test_comment(self.account.id, self.task.id)
+        other_account = self.create_test_account(username="other@example.com")
+
+        with self.assertRaises(CommentNotFoundError):
+            CommentService.get_paginated_comments(
+                params=GetPaginatedCommentsParams(
+                    account_id=other_account.id,
+                    task_id=self.task.id,
+                    pagination_params=PaginationParams(page=1, size=2),
+                )
+            )
+
+    def test_paginated_comments_are_served_by_compound_index(self) -> None:
+        for i in range(10):
+            self.create_test_comment(self.account.id, self.task.id, text=f"Comment {i}")
+
+        cursor = BaseModel.apply_sort_params(
+            CommentRepository.collection().find({"task_id": self.task.id}), DEFAULT_COMMENT_SORT_PARAMS
+        )
+        explain = cursor.limit(3).explain()
+
+        winning_plan = str(explain["queryPlanner"]["winningPlan"])
+        assert "task_id_created_at_id_index" in winning_plan
+        assert "'SORT'" not in winning_plan
+        assert explain["executionStats"]["totalKeysExamined"] <= 3
+        assert "task_id_index" not in CommentRepository.collection().index_information()
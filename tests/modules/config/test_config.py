@@ -1,8 +1,12 @@
 import os
 from typing import List
+from unittest import mock
+
+import pytest
 
 from modules.config.config_service import ConfigService
 from modules.config.errors import MissingKeyError
+from modules.config.internals.config_manager import ConfigManager
 from modules.config.types import ErrorCode
 from tests.modules.config.base_test_config import BaseTestConfig
 
@@ -26,3 +30,36 @@ class TestConfig(BaseTestConfig):
 
         populated_env = os.environ.get("APP_ENV")
         assert populated_env == "testing" or populated_env == "docker-test"
+
+    def test_nested_config_section_is_loaded(self) -> None:
+        logger_config = ConfigService[dict].get_value(key="logger")
+        assert logger_config["transports"] == ConfigService[List[str]].get_value(key="logger.transports")
+        assert not ConfigService.has_value(key="logger.transports.console")
+
+    def test_bound_config_value_is_read_without_lookup(self) -> None:
+        transports = ConfigService[List[str]].bind(key="logger.transports")
+        assert transports.get() == ConfigService[List[str]].get_value(key="logger.transports")
+
+        with mock.patch.object(ConfigService.config_manager, "get", wraps=ConfigService.config_manager.get) as mock_get:
+            for _ in range(3):
+                transports.get()
+
+        mock_get.assert_not_called()
+
+    def test_bound_config_value_follows_replaced_config_manager(self) -> None:
+        original_config_manager = ConfigService.config_manager
+        web_app_host = ConfigService[str].bind(key="web_app_host")
+        assert web_app_host.get() == ConfigService[str].get_value(key="web_app_host")
+
+        try:
+            with mock.patch.dict(os.environ, {"WEB_APP_HOST": "http://bound.example.com"}):
+                ConfigService.config_manager = ConfigManager()
+            assert web_app_host.get() == "http://bound.example.com"
+        finally:
+            ConfigService.config_manager = original_config_manager
+
+        assert web_app_host.get() == ConfigService[str].get_value(key="web_app_host")
+
+    def test_bound_config_value_missing_key(self) -> None:
+        with pytest.raises(MissingKeyError):
+            ConfigService[str].bind(key="missing.config.key").get()
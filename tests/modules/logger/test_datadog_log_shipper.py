@@ -0,0 +1,103 @@
+import logging
+import threading
+import time
+from unittest import mock
+
+from datadog_api_client.v2.api.logs_api import LogsApi
+from datadog_api_client.v2.models import HTTPLogItem
+
+from modules.logger.internal.datadog_handler import DATADOG_APP_NAME, DatadogHandler
+from modules.logger.internal.datadog_log_shipper import DatadogLogShipper
+from tests.modules.logger.base_test_logger import BaseTestLogger
+
+
+class TestDatadogLogShipper(BaseTestLogger):
+    @staticmethod
+    def _create_shipper(**kwargs: float) -> DatadogLogShipper:
+        params = {"max_queue_size": 100, "max_batch_size": 10, "flush_interval_in_seconds": 0.2, **kwargs}
+        return DatadogLogShipper(
+            api_key="api_key",
+            site_name="datadoghq.com",
+            max_queue_size=int(params["max_queue_size"]),
+            max_batch_size=int(params["max_batch_size"]),
+            flush_interval_in_seconds=params["flush_interval_in_seconds"],
+        )
+
+    @staticmethod
+    def _create_item(message: str) -> HTTPLogItem:
+        return HTTPLogItem(ddsource="test", message=message, service="test", status="info")
+
+    @mock.patch.object(LogsApi, "submit_log")
+    def test_items_are_shipped_in_batches(self, mock_submit_log) -> None:
+        shipper = self._create_shipper(max_batch_size=10, flush_interval_in_seconds=5)
+
+        for i in range(25):
+            assert shipper.enqueue(self._create_item(f"message {i}"))
+        shipper.shutdown()
+
+        batch_sizes = [len(call.args[0].value) for call in mock_submit_log.call_args_list]
+        assert sum(batch_sizes) == 25
+        assert max(batch_sizes) <= 10
+        assert len(batch_sizes) >= 3
+        assert shipper.get_stats().shipped_items == 25
+
+    @mock.patch.object(LogsApi, "submit_log")
+    def test_partial_batch_is_shipped_after_flush_interval(self, mock_submit_log) -> None:
+        shipper = self._create_shipper(max_batch_size=10, flush_interval_in_seconds=0.2)
+
+        shipper.enqueue(self._create_item("message"))
+        time.sleep(0.6)
+
+        assert mock_submit_log.call_count == 1
+        shipper.shutdown()
+
+    @mock.patch.object(LogsApi, "submit_log")
+    def test_full_queue_drops_items_without_blocking(self, mock_submit_log) -> None:
+        release = threading.Event()
+        mock_submit_log.side_effect = lambda *args, **kwargs: release.wait()
+        shipper = self._create_shipper(max_queue_size=5, max_batch_size=1, flush_interval_in_seconds=0.1)
+
+        shipper.enqueue(self._create_item("in flight"))
+        while mock_submit_log.call_count == 0:
+            time.sleep(0.01)
+
+        start = time.perf_counter()
+        accepted = [shipper.enqueue(self._create_item(f"message {i}")) for i in range(10)]
+        elapsed = time.perf_counter() - start
+
+        assert accepted.count(True) == 5
+        assert shipper.get_stats().dropped_items == 5
+        assert elapsed < 0.1
+
+        release.set()
+        shipper.shutdown()
+        assert shipper.get_stats().shipped_items == 6
+
+    @mock.patch.object(LogsApi, "submit_log")
+    def test_failed_batch_is_counted(self, mock_submit_log) -> None:
+        mock_submit_log.side_effect = Exception("Datadog is unavailable")
+        shipper = self._create_shipper()
+
+        shipper.enqueue(self._create_item("message"))
+        shipper.shutdown()
+
+        stats = shipper.get_stats()
+        assert stats.failed_items == 1
+        assert stats.shipped_items == 0
+
+    @mock.patch.object(LogsApi, "submit_log")
+    @mock.patch.object(DATADOG_APP_NAME, "get", return_value="test")
+    def test_handler_emit_does_not_call_datadog_on_logging_thread(self, mock_app_name, mock_submit_log) -> None:
+        handler = DatadogHandler("test")
+        handler.shipper = self._create_shipper(flush_interval_in_seconds=5)
+        logger = logging.getLogger("test_datadog_handler")
+        logger.addHandler(handler)
+
+        logger.error("message")
+        assert mock_submit_log.call_count == 0
+
+        logger.removeHandler(handler)
+        handler.close()
+
+        assert mock_submit_log.call_count == 1
+        assert mock_submit_log.call_args.args[0].value[0].message.endswith("message")
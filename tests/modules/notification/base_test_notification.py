@@ -0,0 +1,19 @@
+import unittest
+from typing import Callable
+
+from modules.logger.logger_manager import LoggerManager
+from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
+from modules.notification.internals.provider_http_session import ProviderHttpSession
+from modules.notification.internals.stub_notification_service import StubNotificationService
+
+
+class BaseTestNotification(unittest.TestCase):
+    def setup_method(self, method: Callable) -> None:
+        print(f"Executing:: {method.__name__}")
+        LoggerManager.mount_logger()
+        StubNotificationService.clear()
+        AccountNotificationPreferenceUtil.get_preferences_cache().clear()
+        ProviderHttpSession.reset()
+
+    def teardown_method(self, method: Callable) -> None:
+        print(f"Executed:: {method.__name__}")
@@ -0,0 +1,43 @@
+import time
+
+from modules.notification.internals.account_notification_preferences_cache import AccountNotificationPreferencesCache
+from modules.notification.types import AccountNotificationPreferences
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+
+class TestAccountNotificationPreferencesCache(BaseTestNotification):
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = AccountNotificationPreferencesCache(max_size=2, ttl_in_seconds=60)
+        cache.set(AccountNotificationPreferences(account_id="first"))
+        cache.set(AccountNotificationPreferences(account_id="second"))
+
+        assert cache.get("first") is not None
+        cache.set(AccountNotificationPreferences(account_id="third"))
+
+        assert cache.get("second") is None
+        assert set(cache.get_many(["first", "second", "third"]).keys()) == {"first", "third"}
+
+    def test_entry_expires_after_ttl(self) -> None:
+        cache = AccountNotificationPreferencesCache(max_size=10, ttl_in_seconds=0.1)
+        cache.set(AccountNotificationPreferences(account_id="account_id", email_enabled=False))
+        assert cache.get("account_id") == AccountNotificationPreferences(account_id="account_id", email_enabled=False)
+
+        time.sleep(0.15)
+
+        assert cache.get("account_id") is None
+        assert cache.get_stats().size == 0
+
+    def test_invalidate_removes_entry(self) -> None:
+        cache = AccountNotificationPreferencesCache(max_size=10, ttl_in_seconds=60)
+        cache.set_many(
+            [AccountNotificationPreferences(account_id="first"), AccountNotificationPreferences(account_id="second")]
+        )
+
+        cache.invalidate("first")
+
+        assert cache.get("first") is None
+        assert cache.get("second") is not None
+        stats = cache.get_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
@@ -0,0 +1,143 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from modules.account.types import PhoneNumber
+from modules.application.application_service import ApplicationService
+from modules.notification.errors import ValidationError
+from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.notification_dispatch_util import (
+    BULK_RECIPIENTS_PER_WORKER,
+    NotificationDispatchUtil,
+)
+from modules.notification.internals.stub_notification_service import StubNotificationService
+from modules.notification.notification_service import NotificationService
+from modules.notification.sms_service import SMS_ENABLED
+from modules.notification.types import (
+    AccountNotificationPreferences,
+    BulkEmailRecipient,
+    BulkSMSRecipient,
+    EmailRecipient,
+    EmailSender,
+    NotificationChannel,
+    SendBulkEmailParams,
+    SendBulkSMSParams,
+)
+from modules.notification.workers.bulk_notification_worker import BULK_EMAIL_BATCH_SIZE, BulkNotificationWorker
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+SENDER = EmailSender(email="sender@example.com", name="Sender")
+PREFERENCES_BY_ACCOUNT_ID = {
+    "enabled_1": AccountNotificationPreferences(account_id="enabled_1"),
+    "enabled_2": AccountNotificationPreferences(account_id="enabled_2"),
+    "enabled_3": AccountNotificationPreferences(account_id="enabled_3"),
+    "invalid_email": AccountNotificationPreferences(account_id="invalid_email"),
+    "disabled": AccountNotificationPreferences(account_id="disabled", email_enabled=False, sms_enabled=False),
+}
+
+
+def get_preferences_by_account_ids(account_ids):
+    return {
+        account_id: PREFERENCES_BY_ACCOUNT_ID[account_id]
+        for account_id in account_ids
+        if account_id in PREFERENCES_BY_ACCOUNT_ID
+    }
+
+
+class TestBulkNotification(BaseTestNotification):
+    @mock.patch.object(BULK_RECIPIENTS_PER_WORKER, "get", return_value=2)
+    @mock.patch.object(ApplicationService, "run_workers_in_bulk")
+    def test_send_bulk_email_splits_recipients_across_workers(self, mock_run_workers_in_bulk, _) -> None:
+        recipients = [BulkEmailRecipient(account_id=f"account_{i}", email=f"user{i}@example.com") for i in range(5)]
+        params = SendBulkEmailParams(recipients=recipients, sender=SENDER, template_id="TEMPLATE_ID")
+
+        NotificationService.send_bulk_email(params=params)
+
+        mock_run_workers_in_bulk.assert_called_once()
+        list_of_arguments = mock_run_workers_in_bulk.call_args.kwargs["list_of_arguments"]
+        assert [len(payload["recipients"]) for _, payload in list_of_arguments] == [2, 2, 1]
+        assert all(channel == NotificationChannel.EMAIL.value for channel, _ in list_of_arguments)
+
+    @mock.patch.object(ApplicationService, "run_workers_in_bulk")
+    def test_send_bulk_email_with_invalid_sender_is_not_enqueued(self, mock_run_workers_in_bulk) -> None:
+        params = SendBulkEmailParams(
+            recipients=[BulkEmailRecipient(account_id="enabled_1", email="user@example.com")],
+            sender=EmailSender(email="invalid", name=""),
+            template_id="TEMPLATE_ID",
+        )
+
+        with pytest.raises(ValidationError):
+            NotificationService.send_bulk_email(params=params)
+
+        mock_run_workers_in_bulk.assert_not_called()
+
+    @mock.patch.object(BULK_EMAIL_BATCH_SIZE, "get", return_value=2)
+    @mock.patch.object(
+        AccountNotificationPreferenceReader,
+        "get_account_notification_preferences_by_account_ids",
+        side_effect=get_preferences_by_account_ids,
+    )
+    def test_bulk_email_worker_sends_batches_to_enabled_recipients(self, mock_get_preferences, _) -> None:
+        params = SendBulkEmailParams(
+            recipients=[
+                BulkEmailRecipient(account_id="enabled_1", email="user1@example.com"),
+                BulkEmailRecipient(account_id="disabled", email="disabled@example.com"),
+                BulkEmailRecipient(account_id="enabled_2", email="user2@example.com"),
+                BulkEmailRecipient(account_id="missing", email="missing@example.com"),
+                BulkEmailRecipient(account_id="invalid_email", email="invalid"),
+                BulkEmailRecipient(account_id="enabled_3", email="user3@example.com"),
+            ],
+            sender=SENDER,
+            template_id="TEMPLATE_ID",
+        )
+
+        asyncio.run(
+            BulkNotificationWorker.execute(
+                NotificationChannel.EMAIL.value,
+                NotificationDispatchUtil.convert_send_bulk_email_params_to_payload(params),
+            )
+        )
+
+        # One preferences lookup and at most one provider request per batch
+        assert mock_get_preferences.call_count == 3
+        assert [batch.recipients for batch in StubNotificationService.sent_email_batches] == [
+            [EmailRecipient(email="user1@example.com")],
+            [EmailRecipient(email="user2@example.com")],
+            [EmailRecipient(email="user3@example.com")],
+        ]
+
+    @mock.patch.object(
+        AccountNotificationPreferenceReader,
+        "get_account_notification_preferences_by_account_ids",
+        side_effect=get_preferences_by_account_ids,
+    )
+    def test_bulk_sms_worker_sends_to_enabled_recipients(self, _) -> None:
+        params = SendBulkSMSParams(
+            message_body="Scheduled maintenance tonight",
+            recipients=[
+                BulkSMSRecipient(
+                    account_id="enabled_1", phone_number=PhoneNumber(country_code="+1", phone_number="2124567890")
+                ),
+                BulkSMSRecipient(
+                    account_id="disabled", phone_number=PhoneNumber(country_code="+1", phone_number="2124567891")
+                ),
+                BulkSMSRecipient(account_id="enabled_2", phone_number=PhoneNumber(country_code="+1", phone_number="1")),
+            ],
+        )
+
+        asyncio.run(
+            BulkNotificationWorker.execute(
+                NotificationChannel.SMS.value, NotificationDispatchUtil.convert_send_bulk_sms_params_to_payload(params)
+            )
+        )
+
+        assert [sms.recipient_phone.phone_number for sms in StubNotificationService.sent_sms] == ["2124567890"]
+
+    @mock.patch.object(SMS_ENABLED, "get", return_value=False)
+    @mock.patch.object(ApplicationService, "run_workers_in_bulk")
+    def test_send_bulk_sms_is_skipped_when_sms_is_disabled(self, mock_run_workers_in_bulk, _) -> None:
+        params = SendBulkSMSParams(message_body="Message", recipients=[])
+
+        assert NotificationService.send_bulk_sms(params=params) == []
+        mock_run_workers_in_bulk.assert_not_called()
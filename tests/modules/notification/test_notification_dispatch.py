@@ -0,0 +1,101 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from modules.account.types import PhoneNumber
+from modules.application.application_service import ApplicationService
+from modules.application.errors import WorkerClientConnectionError, WorkerStartError
+from modules.notification.email_service import EmailService
+from modules.notification.errors import ValidationError
+from modules.notification.internals.notification_dispatch_util import NotificationDispatchUtil
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.stub_notification_service import StubNotificationService
+from modules.notification.sms_service import SMS_ENABLED, SMSService
+from modules.notification.types import EmailRecipient, EmailSender, NotificationChannel, SendEmailParams, SendSMSParams
+from modules.notification.workers.notification_dispatch_worker import NotificationDispatchWorker
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+EMAIL_PARAMS = SendEmailParams(
+    recipient=EmailRecipient(email="recipient@example.com"),
+    sender=EmailSender(email="sender@example.com", name="Sender"),
+    template_id="TEMPLATE_ID",
+    template_data={"first_name": "Test"},
+)
+SMS_PARAMS = SendSMSParams(
+    message_body="1234 is your One Time Password (OTP) for verification.",
+    recipient_phone=PhoneNumber(country_code="+1", phone_number="2124567890"),
+)
+
+
+class TestNotificationDispatch(BaseTestNotification):
+    @mock.patch.object(SendGridService, "send_email")
+    @mock.patch.object(ApplicationService, "run_worker_immediately")
+    def test_send_email_enqueues_dispatch_worker(self, mock_run_worker, mock_send_email) -> None:
+        EmailService.send_email_for_account(account_id="account_id", bypass_preferences=True, params=EMAIL_PARAMS)
+
+        mock_send_email.assert_not_called()
+        mock_run_worker.assert_called_once_with(
+            cls=NotificationDispatchWorker,
+            arguments=(
+                NotificationChannel.EMAIL.value,
+                NotificationDispatchUtil.convert_send_email_params_to_payload(EMAIL_PARAMS),
+            ),
+        )
+
+    @mock.patch.object(ApplicationService, "run_worker_immediately")
+    def test_send_email_with_invalid_params_is_not_enqueued(self, mock_run_worker) -> None:
+        invalid_params = SendEmailParams(
+            recipient=EmailRecipient(email="invalid"), sender=EMAIL_PARAMS.sender, template_id="TEMPLATE_ID"
+        )
+
+        with pytest.raises(ValidationError):
+            EmailService.send_email_for_account(account_id="account_id", bypass_preferences=True, params=invalid_params)
+
+        mock_run_worker.assert_not_called()
+
+    @mock.patch.object(SMS_ENABLED, "get", return_value=True)
+    @mock.patch.object(ApplicationService, "run_worker_immediately")
+    def test_send_sms_enqueues_dispatch_worker(self, mock_run_worker, _) -> None:
+        SMSService.send_sms_for_account(account_id="account_id", bypass_preferences=True, params=SMS_PARAMS)
+
+        mock_run_worker.assert_called_once_with(
+            cls=NotificationDispatchWorker,
+            arguments=(
+                NotificationChannel.SMS.value,
+                NotificationDispatchUtil.convert_send_sms_params_to_payload(SMS_PARAMS),
+            ),
+        )
+
+    @mock.patch.object(
+        ApplicationService, "run_worker_immediately", side_effect=WorkerClientConnectionError("localhost:7233")
+    )
+    def test_send_email_is_sent_inline_without_temporal(self, _) -> None:
+        EmailService.send_email_for_account(account_id="account_id", bypass_preferences=True, params=EMAIL_PARAMS)
+
+        assert StubNotificationService.sent_emails == [EMAIL_PARAMS]
+
+    @mock.patch.object(SMS_ENABLED, "get", return_value=True)
+    @mock.patch.object(
+        ApplicationService, "run_worker_immediately", side_effect=WorkerStartError("NotificationDispatchWorker")
+    )
+    def test_send_sms_is_sent_inline_when_worker_cannot_start(self, *_) -> None:
+        SMSService.send_sms_for_account(account_id="account_id", bypass_preferences=True, params=SMS_PARAMS)
+
+        assert StubNotificationService.sent_sms == [SMS_PARAMS]
+
+    def test_dispatch_worker_sends_through_stub_provider(self) -> None:
+        asyncio.run(
+            NotificationDispatchWorker.execute(
+                NotificationChannel.EMAIL.value,
+                NotificationDispatchUtil.convert_send_email_params_to_payload(EMAIL_PARAMS),
+            )
+        )
+        asyncio.run(
+            NotificationDispatchWorker.execute(
+                NotificationChannel.SMS.value, NotificationDispatchUtil.convert_send_sms_params_to_payload(SMS_PARAMS)
+            )
+        )
+
+        assert StubNotificationService.sent_emails == [EMAIL_PARAMS]
+        assert StubNotificationService.sent_sms == [SMS_PARAMS]
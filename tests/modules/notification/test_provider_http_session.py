@@ -0,0 +1,120 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List
+from unittest import mock
+
+import pytest
+import requests
+
+from modules.notification.errors import ServiceError
+from modules.notification.internals import sendgrid_service
+from modules.notification.internals.latency_histogram import LatencyHistogram
+from modules.notification.internals.provider_http_session import READ_TIMEOUT_IN_SECONDS, ProviderHttpSession
+from modules.notification.internals.sendgrid_service import SENDGRID_API_KEY, SendGridService
+from modules.notification.types import EmailRecipient, EmailSender, NotificationHttpProvider, SendEmailBatchParams
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+
+class ProviderStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Statuses returned for the next requests, 202 once exhausted
+    statuses: List[int] = []
+    delay_in_seconds = 0.0
+    connections: set = set()
+    bodies: List[Any] = []
+
+    def do_POST(self) -> None:
+        ProviderStubHandler.connections.add(self.client_address)
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        ProviderStubHandler.bodies.append(json.loads(body))
+        time.sleep(ProviderStubHandler.delay_in_seconds)
+
+        status = ProviderStubHandler.statuses.pop(0) if ProviderStubHandler.statuses else 202
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class TestProviderHttpSession(BaseTestNotification):
+    def setUp(self) -> None:
+        ProviderStubHandler.statuses = []
+        ProviderStubHandler.delay_in_seconds = 0.0
+        ProviderStubHandler.connections = set()
+        ProviderStubHandler.bodies = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ProviderStubHandler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v3/mail/send"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_requests_reuse_pooled_connection(self) -> None:
+        session = ProviderHttpSession.get_session(NotificationHttpProvider.SENDGRID)
+
+        for _ in range(5):
+            assert session.post(self.url, json={}).status_code == 202
+
+        assert len(ProviderStubHandler.connections) == 1
+        assert ProviderHttpSession.get_session(NotificationHttpProvider.SENDGRID) is session
+
+    def test_retryable_status_is_retried(self) -> None:
+        ProviderStubHandler.statuses = [503, 429]
+        session = ProviderHttpSession.get_session(NotificationHttpProvider.SENDGRID)
+
+        assert session.post(self.url, json={}).status_code == 202
+        assert len(ProviderStubHandler.bodies) == 3
+
+    def test_slow_provider_is_bounded_by_read_timeout(self) -> None:
+        ProviderStubHandler.delay_in_seconds = 1.0
+
+        with mock.patch.object(READ_TIMEOUT_IN_SECONDS, "get", return_value=0.2):
+            session = ProviderHttpSession.get_session(NotificationHttpProvider.TWILIO)
+            start = time.perf_counter()
+            with pytest.raises(requests.RequestException):
+                session.post(self.url, json={})
+            elapsed = time.perf_counter() - start
+
+        # Read timeouts are not retried, since the provider may already have accepted the message
+        assert elapsed < 0.9
+        assert len(ProviderStubHandler.bodies) == 1
+        [stats] = ProviderHttpSession.get_latency_stats()
+        assert stats.provider == NotificationHttpProvider.TWILIO.value
+        assert stats.count == 1
+        assert stats.errors == 1
+
+    @mock.patch.object(SENDGRID_API_KEY, "get", return_value="SG.test")
+    def test_sendgrid_batch_is_sent_as_one_request(self, _) -> None:
+        params = SendEmailBatchParams(
+            recipients=[EmailRecipient(email=f"user{i}@example.com") for i in range(3)],
+            sender=EmailSender(email="sender@example.com", name="Sender"),
+            template_id="TEMPLATE_ID",
+            template_data={"first_name": "Test"},
+        )
+
+        with mock.patch.object(sendgrid_service, "SENDGRID_MAIL_SEND_URL", self.url):
+            SendGridService.send_email_batch(params)
+
+            ProviderStubHandler.statuses = [400]
+            with pytest.raises(ServiceError):
+                SendGridService.send_email_batch(params)
+
+        assert len(ProviderStubHandler.bodies[0]["personalizations"]) == 3
+        [stats] = ProviderHttpSession.get_latency_stats()
+        assert stats.count == 2
+        assert stats.errors == 1
+
+    def test_latency_histogram_buckets(self) -> None:
+        histogram = LatencyHistogram(provider="provider", bucket_bounds_in_ms=[10, 100])
+        for latency_in_ms in [5, 10, 50, 500]:
+            histogram.record(latency_in_ms)
+
+        stats = histogram.get_stats()
+        assert stats.buckets == {"10": 2, "100": 1, "inf": 1}
+        assert stats.count == 4
+        assert stats.total_latency_in_ms == 565
@@ -0,0 +1,50 @@
+import threading
+
+import pytest
+
+from modules.password_hashing.errors import PasswordHashingPoolSaturatedError
+from modules.password_hashing.internal.password_hashing_pool import PasswordHashingPool
+from modules.password_hashing.password_hashing_service import PasswordHashingService
+from tests.modules.password_hashing.base_test_password_hashing import BaseTestPasswordHashing
+
+
+class TestPasswordHashingService(BaseTestPasswordHashing):
+    def test_hash_and_compare_password(self) -> None:
+        hashed_password = PasswordHashingService.hash_password(password="password")
+
+        assert hashed_password != "password"
+        assert PasswordHashingService.compare_password(password="password", hashed_password=hashed_password)
+        assert not PasswordHashingService.compare_password(password="wrong", hashed_password=hashed_password)
+
+    def test_metrics_track_wait_and_hash_time(self) -> None:
+        before = PasswordHashingService.get_metrics()
+
+        PasswordHashingService.hash_password(password="password")
+
+        after = PasswordHashingService.get_metrics()
+        assert after.completed_operations == before.completed_operations + 1
+        assert after.total_hash_time_in_seconds > before.total_hash_time_in_seconds
+        assert after.total_wait_time_in_seconds >= before.total_wait_time_in_seconds
+        assert after.pending_operations == 0
+
+    def test_saturated_pool_rejects_fast(self) -> None:
+        pool = PasswordHashingPool(bcrypt_rounds=14, max_pending_tasks=1, max_workers=1, use_process_pool=True)
+        started = threading.Event()
+
+        def slow_hash() -> None:
+            started.set()
+            pool.hash_password(password="password")
+
+        thread = threading.Thread(target=slow_hash)
+        thread.start()
+        started.wait()
+        while pool.get_metrics().pending_operations == 0:
+            pass
+
+        with pytest.raises(PasswordHashingPoolSaturatedError):
+            pool.hash_password(password="password")
+
+        thread.join()
+        metrics = pool.get_metrics()
+        assert metrics.rejected_operations == 1
+        assert metrics.completed_operations == 1
@@ -7,7 +7,10 @@ from server import app
 from modules.account.account_service import AccountService
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import Account, CreateAccountByUsernameAndPasswordParams
+from modules.comment.internal.store.comment_repository import CommentRepository
 from modules.logger.logger_manager import LoggerManager
+from modules.task.internal.store.task_archive_repository import TaskArchiveRepository
+from modules.task.internal.store.task_count_repository import TaskCountRepository
 from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
 from modules.task.task_service import TaskService
@@ -31,6 +34,9 @@ class BaseTestTask(unittest.TestCase):
 
     def tearDown(self) -> None:
         TaskRepository.collection().delete_many({})
+        TaskArchiveRepository.collection().delete_many({})
+        CommentRepository.collection().delete_many({})
+        TaskCountRepository.collection().delete_many({})
         AccountRepository.collection().delete_many({})
 
     # URL HELPER METHODS
@@ -41,6 +47,12 @@ class BaseTestTask(unittest.TestCase):
     def get_task_by_id_api_url(self, account_id: str, task_id: str) -> str:
         return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks/{task_id}"
 
+    def get_task_batch_api_url(self, account_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks:batch"
+
+    def get_task_restore_api_url(self, account_id: str, task_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks/{task_id}:restore"
+
     # ACCOUNT AND TOKEN HELPER METHODS
 
     def create_test_account(
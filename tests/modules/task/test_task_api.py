@@ -1,6 +1,8 @@
 from server import app
 
 from modules.authentication.types import AccessTokenErrorCode
+from modules.comment.comment_service import CommentService
+from modules.comment.types import CreateCommentParams
 from modules.task.types import TaskErrorCode
 from tests.modules.task.base_test_task import BaseTestTask
 
@@ -106,6 +108,74 @@ class TestTaskApi(BaseTestTask):
 
         assert response1.json["items"][0]["id"] != response2.json["items"][0]["id"]
 
+    def test_get_all_tasks_with_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        response1 = self.make_authenticated_request("GET", account.id, token, query_params="size=2")
+        next_cursor = response1.json.get("next_cursor")
+        assert next_cursor is not None
+
+        response2 = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"size=2&cursor={next_cursor}"
+        )
+
+        assert response2.status_code == 200
+        self.assert_pagination_response(response2.json, expected_items_count=1, expected_total_count=3)
+        assert response2.json["items"][0]["title"] == "Task 1"
+        assert response2.json["next_cursor"] is None
+
+    def test_get_all_tasks_without_total_count(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="include_total=false")
+
+        assert response.status_code == 200
+        assert len(response.json["items"]) == 3
+        assert response.json["total_count"] is None
+        assert response.json["total_pages"] is None
+
+    def test_get_all_tasks_invalid_include_total(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="include_total=maybe")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_all_tasks_with_comment_stats(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        CommentService.create_comment(
+            params=CreateCommentParams(account_id=account.id, task_id=tasks[0].id, text="Latest comment")
+        )
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="include=comment_stats")
+
+        assert response.status_code == 200
+        items_by_id = {item["id"]: item for item in response.json["items"]}
+        commented_task_stats = items_by_id[tasks[0].id]["comment_stats"]
+        assert commented_task_stats["comment_count"] == 1
+        assert commented_task_stats["latest_comment"]["text"] == "Latest comment"
+        assert isinstance(commented_task_stats["latest_comment"]["created_at"], str)
+        assert items_by_id[tasks[1].id]["comment_stats"] == {"comment_count": 0, "latest_comment": None}
+
+    def test_get_all_tasks_omits_comment_stats_by_default(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_test_task(account_id=account.id)
+
+        response = self.make_authenticated_request("GET", account.id, token)
+
+        assert response.status_code == 200
+        assert "comment_stats" not in response.json["items"][0]
+
+    def test_get_all_tasks_invalid_include(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="include=attachments")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
     def test_get_all_tasks_no_auth(self) -> None:
         account, _ = self.create_account_and_get_token()
 
@@ -0,0 +1,104 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest import mock
+
+from bson.objectid import ObjectId
+from server import app
+
+from modules.application.common.types import PaginationParams, TotalCountMode
+from modules.task.internal.store.task_archive_repository import TaskArchiveRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import DeleteTaskParams, GetPaginatedTasksParams, TaskErrorCode
+from modules.task.workers.task_archive_worker import (
+    TASK_ARCHIVE_BATCH_SIZE,
+    TASK_ARCHIVE_RETENTION_IN_DAYS,
+    TaskArchiveWorker,
+)
+from tests.modules.task.base_test_task import BaseTestTask
+
+
+class TestTaskArchive(BaseTestTask):
+    def _delete_task(self, account_id: str, task_id: str, days_ago: int = 0) -> None:
+        TaskService.delete_task(params=DeleteTaskParams(account_id=account_id, task_id=task_id))
+        TaskRepository.collection().update_one(
+            {"_id": ObjectId(task_id)}, {"$set": {"updated_at": datetime.now() - timedelta(days=days_ago)}}
+        )
+
+    def _run_archive_worker(self) -> None:
+        with (
+            mock.patch.object(TASK_ARCHIVE_BATCH_SIZE, "get", return_value=2),
+            mock.patch.object(TASK_ARCHIVE_RETENTION_IN_DAYS, "get", return_value=30),
+        ):
+            asyncio.run(TaskArchiveWorker.execute())
+
+    def _restore_task(self, account_id: str, token: str, task_id: str):
+        with app.test_client() as client:
+            return client.post(
+                self.get_task_restore_api_url(account_id, task_id), headers={"Authorization": f"Bearer {token}"}
+            )
+
+    def test_archive_worker_moves_only_tasks_deleted_before_retention(self) -> None:
+        account = self.create_test_account()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=5)
+        for task in tasks[:3]:
+            self._delete_task(account.id, task.id, days_ago=31)
+        self._delete_task(account.id, tasks[3].id, days_ago=1)
+
+        self._run_archive_worker()
+
+        assert {str(task_bson["_id"]) for task_bson in TaskRepository.collection().find()} == {tasks[3].id, tasks[4].id}
+        archived_tasks_bson = list(TaskArchiveRepository.collection().find())
+        assert {str(task_bson["_id"]) for task_bson in archived_tasks_bson} == {task.id for task in tasks[:3]}
+        assert all(task_bson["archived_at"] is not None for task_bson in archived_tasks_bson)
+        assert all(task_bson["active"] is False for task_bson in archived_tasks_bson)
+
+    def test_restore_archived_task(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id, title="Archived Task")
+        self._delete_task(account.id, task.id, days_ago=31)
+        self._run_archive_worker()
+
+        response = self._restore_task(account.id, token, task.id)
+
+        assert response.status_code == 200
+        assert response.json["id"] == task.id
+        assert response.json["title"] == "Archived Task"
+        assert TaskArchiveRepository.collection().count_documents({}) == 0
+        get_response = self.make_authenticated_request("GET", account.id, token, task_id=task.id)
+        assert get_response.status_code == 200
+
+    def test_restore_deleted_task_that_is_not_archived(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        get_params = GetPaginatedTasksParams(
+            account_id=account.id,
+            pagination_params=PaginationParams(page=1, size=10, offset=0),
+            total_count_mode=TotalCountMode.ESTIMATED,
+        )
+        TaskService.get_paginated_tasks(params=get_params)
+        self._delete_task(account.id, tasks[0].id)
+
+        response = self._restore_task(account.id, token, tasks[0].id)
+
+        assert response.status_code == 200
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 2
+
+    def test_restore_active_task_not_found(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        response = self._restore_task(account.id, token, task.id)
+
+        self.assert_error_response(response, 404, TaskErrorCode.NOT_FOUND)
+
+    def test_restore_task_of_other_account_not_found(self) -> None:
+        account, _ = self.create_account_and_get_token()
+        other_account, other_token = self.create_account_and_get_token(username="other@example.com")
+        task = self.create_test_task(account_id=account.id)
+        self._delete_task(account.id, task.id, days_ago=31)
+        self._run_archive_worker()
+
+        response = self._restore_task(other_account.id, other_token, task.id)
+
+        self.assert_error_response(response, 404, TaskErrorCode.NOT_FOUND)
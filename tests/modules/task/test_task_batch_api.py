@@ -0,0 +1,163 @@
+import json
+
+from server import app
+
+from modules.application.common.types import PaginationParams
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import GetPaginatedTasksParams, RunTaskBatchParams, TaskBatchOperation, TaskErrorCode
+from tests.modules.application.command_counter import count_commands
+from tests.modules.task.base_test_task import BaseTestTask
+
+
+class TestTaskBatchApi(BaseTestTask):
+    def _post_batch(self, account_id: str, token: str, data: dict):
+        with app.test_client() as client:
+            return client.post(
+                self.get_task_batch_api_url(account_id),
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps(data),
+            )
+
+    def _get_total_count(self, account_id: str) -> int:
+        result = TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(account_id=account_id, pagination_params=PaginationParams(page=1, size=1))
+        )
+        return result.total_count
+
+    def test_batch_returns_per_operation_results(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task_to_update, task_to_delete = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        # Seeds the active task counter, which the batch must keep in sync
+        assert self._get_total_count(account.id) == 2
+
+        response = self._post_batch(
+            account.id,
+            token,
+            {
+                "operations": [
+                    {"operation": "create", "title": "New task", "description": "New description"},
+                    {
+                        "operation": "update",
+                        "task_id": task_to_update.id,
+                        "title": "Updated title",
+                        "description": "Updated description",
+                    },
+                    {"operation": "delete", "task_id": task_to_delete.id},
+                    {"operation": "delete", "task_id": "5f5f5f5f5f5f5f5f5f5f5f5f"},
+                    {"operation": "create", "description": "Missing title"},
+                    {"operation": "archive", "task_id": task_to_update.id},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json["results"]
+        assert [result["index"] for result in results] == [0, 1, 2, 3, 4, 5]
+        assert [result["success"] for result in results] == [True, True, True, False, False, False]
+        assert results[0]["task"]["title"] == "New task"
+        assert results[1]["task"]["title"] == "Updated title"
+        assert results[2]["task_id"] == task_to_delete.id
+        assert results[3]["error"]["code"] == TaskErrorCode.NOT_FOUND
+        assert results[4]["error"]["code"] == TaskErrorCode.BAD_REQUEST
+        assert results[5]["error"]["code"] == TaskErrorCode.BAD_REQUEST
+
+        assert TaskRepository.collection().count_documents({"account_id": account.id, "active": True}) == 2
+        assert self._get_total_count(account.id) == 2
+
+    def test_batch_cannot_modify_other_accounts_tasks(self) -> None:
+        account, token = self.create_account_and_get_token()
+        other_account = self.create_test_account(username="other@example.com")
+        other_task = self.create_test_task(account_id=other_account.id)
+
+        response = self._post_batch(
+            account.id,
+            token,
+            {
+                "operations": [
+                    {"operation": "update", "task_id": other_task.id, "title": "Title", "description": "Description"},
+                    {"operation": "delete", "task_id": other_task.id},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert [result["error"]["code"] for result in response.json["results"]] == [
+            TaskErrorCode.NOT_FOUND,
+            TaskErrorCode.NOT_FOUND,
+        ]
+        assert TaskRepository.collection().count_documents({"account_id": other_account.id, "active": True}) == 1
+
+    def test_batch_rejects_task_named_by_more_than_one_operation(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+
+        response = self._post_batch(
+            account.id,
+            token,
+            {
+                "operations": [
+                    {"operation": "delete", "task_id": task.id},
+                    {"operation": "update", "task_id": task.id, "title": "Title", "description": "Description"},
+                ]
+            },
+        )
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+        assert TaskRepository.collection().count_documents({"account_id": account.id, "active": True}) == 1
+
+    def test_batch_updates_and_deletes_use_one_bulk_write_each(self) -> None:
+        account = self.create_test_account()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=20)
+        params = RunTaskBatchParams(
+            account_id=account.id,
+            operations=[
+                TaskBatchOperation(operation="update", task_id=task.id, title="Title", description="Description")
+                for task in tasks[:10]
+            ]
+            + [TaskBatchOperation(operation="delete", task_id=task.id) for task in tasks[10:]],
+        )
+
+        results = []
+        operations = count_commands(
+            [TaskRepository, TaskCountRepository], lambda: results.extend(TaskService.run_task_batch(params=params))
+        )
+
+        print(f"TaskService.run_task_batch with 10 updates and 10 deletes: {operations}")
+        # One read of the targeted tasks and one bulk write per operation type, plus the active task counter update
+        assert operations == {"find": 2, "update": 3}
+        assert all(result.success for result in results)
+        assert results[0].task.title == "Title"
+
+    def test_batch_rejects_invalid_body(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self._post_batch(account.id, token, {"operations": []})
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+        response = self._post_batch(
+            account.id, token, {"operations": [{"operation": "delete", "task_id": "id"}] * 1001}
+        )
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_batch_import_uses_a_handful_of_round_trips(self) -> None:
+        account = self.create_test_account()
+        params = RunTaskBatchParams(
+            account_id=account.id,
+            operations=[
+                TaskBatchOperation(operation="create", title=f"Task {i}", description=f"Description {i}")
+                for i in range(1000)
+            ],
+        )
+
+        results = []
+        operations = count_commands(
+            [TaskRepository, TaskCountRepository], lambda: results.extend(TaskService.run_task_batch(params=params))
+        )
+
+        print(f"TaskService.run_task_batch with 1000 creates: {operations}")
+        # One insert for the tasks and one update for the active task counter
+        assert operations == {"insert": 1, "update": 1}
+        assert all(result.success for result in results)
+        assert TaskRepository.collection().count_documents({"account_id": account.id}) == 1000
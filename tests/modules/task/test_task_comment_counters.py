@@ -0,0 +1,154 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest import mock
+
+from bson.objectid import ObjectId
+from pymongo.errors import WriteError
+
+from modules.application.common.types import PaginationParams, SortDirection, SortParams, TotalCountMode
+from modules.comment.comment_service import CommentService
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.comment.types import CreateCommentParams, DeleteCommentParams
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import GetPaginatedTasksParams, GetTaskParams, RepairTaskCommentCountersParams, TaskErrorCode
+from modules.task.workers.task_comment_counter_repair_worker import (
+    TASK_COMMENT_COUNTER_REPAIR_BATCH_SIZE,
+    TaskCommentCounterRepairWorker,
+)
+from tests.modules.task.base_test_task import BaseTestTask
+
+
+class TestTaskCommentCounters(BaseTestTask):
+    def setUp(self) -> None:
+        self.account = self.create_test_account()
+
+    def _create_comment(self, task_id: str, text: str = "Comment") -> str:
+        return CommentService.create_comment(
+            params=CreateCommentParams(account_id=self.account.id, task_id=task_id, text=text)
+        ).id
+
+    def _get_task(self, task_id: str):
+        return TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=task_id))
+
+    def test_new_task_has_no_comment_activity(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+
+        assert task.comment_count == 0
+        assert task.last_commented_at is None
+
+    def test_create_and_delete_comment_maintain_counters(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        first_comment_id = self._create_comment(task.id)
+        self._create_comment(task.id)
+
+        task_with_comments = self._get_task(task.id)
+        assert task_with_comments.comment_count == 2
+        assert task_with_comments.last_commented_at is not None
+
+        CommentService.delete_comment(
+            params=DeleteCommentParams(account_id=self.account.id, task_id=task.id, comment_id=first_comment_id)
+        )
+
+        task_after_delete = self._get_task(task.id)
+        assert task_after_delete.comment_count == 1
+        assert task_after_delete.last_commented_at == task_with_comments.last_commented_at
+
+    def test_failed_comment_insert_does_not_count(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+
+        with mock.patch.object(CommentRepository, "insert_one_and_return", side_effect=WriteError("insert failed")):
+            with self.assertRaises(WriteError):
+                self._create_comment(task.id)
+
+        assert self._get_task(task.id).comment_count == 0
+
+    def test_repair_comment_counters(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        self._create_comment(tasks[0].id)
+        self._create_comment(tasks[0].id)
+        TaskRepository.collection().update_one({"_id": ObjectId(tasks[0].id)}, {"$set": {"comment_count": 7}})
+        TaskRepository.collection().update_one(
+            {"_id": ObjectId(tasks[1].id)}, {"$set": {"comment_count": 3, "last_commented_at": datetime.now()}}
+        )
+        # Tasks created before the counters existed have neither field
+        TaskRepository.collection().update_one(
+            {"_id": ObjectId(tasks[2].id)}, {"$unset": {"comment_count": "", "last_commented_at": ""}}
+        )
+
+        result = TaskService.repair_comment_counters(params=RepairTaskCommentCountersParams(batch_size=10))
+
+        assert result.tasks_checked == 3
+        assert result.tasks_repaired == 3
+        assert result.last_task_id == tasks[2].id
+        assert self._get_task(tasks[0].id).comment_count == 2
+        assert self._get_task(tasks[1].id).comment_count == 0
+        assert self._get_task(tasks[1].id).last_commented_at is None
+        assert TaskRepository.collection().find_one({"_id": ObjectId(tasks[2].id)})["comment_count"] == 0
+
+        result = TaskService.repair_comment_counters(
+            params=RepairTaskCommentCountersParams(batch_size=10, after_task_id=result.last_task_id)
+        )
+        assert result.tasks_checked == 0
+        assert result.last_task_id is None
+
+    def test_repair_worker_scans_all_tasks_in_batches(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=5)
+        for task in tasks:
+            self._create_comment(task.id)
+        TaskRepository.collection().update_many({}, {"$set": {"comment_count": 0}})
+
+        with mock.patch.object(TASK_COMMENT_COUNTER_REPAIR_BATCH_SIZE, "get", return_value=2):
+            asyncio.run(TaskCommentCounterRepairWorker.execute())
+
+        assert all(self._get_task(task.id).comment_count == 1 for task in tasks)
+
+    def test_get_paginated_tasks_sorted_by_comment_activity(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=4)
+        base_time = datetime.now()
+        for minutes, task in enumerate([tasks[2], tasks[0], tasks[3]]):
+            self._create_comment(task.id)
+            # Spaced out explicitly so that the order does not depend on comments sharing a millisecond
+            TaskRepository.collection().update_one(
+                {"_id": ObjectId(task.id)}, {"$set": {"last_commented_at": base_time + timedelta(minutes=minutes)}}
+            )
+        sort_params = SortParams(sort_by="last_commented_at", sort_direction=SortDirection.DESC)
+
+        first_page = TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(
+                account_id=self.account.id,
+                pagination_params=PaginationParams(page=1, size=2, offset=0),
+                sort_params=sort_params,
+                total_count_mode=TotalCountMode.ESTIMATED,
+            )
+        )
+        second_page = TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(
+                account_id=self.account.id,
+                pagination_params=PaginationParams(page=1, size=2, offset=0, cursor=first_page.next_cursor),
+                sort_params=sort_params,
+            )
+        )
+
+        assert [task.id for task in first_page.items + second_page.items] == [tasks[3].id, tasks[0].id, tasks[2].id]
+        assert first_page.total_count == 3
+        assert second_page.next_cursor is None
+
+    def test_get_all_tasks_sorted_by_comment_activity_via_api(self) -> None:
+        account, token = self.create_account_and_get_token()
+        tasks = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        CommentService.create_comment(params=CreateCommentParams(account_id=account.id, task_id=tasks[0].id, text="Hi"))
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="sort_by=last_commented_at")
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json["items"]] == [tasks[0].id]
+        assert response.json["items"][0]["comment_count"] == 1
+        assert isinstance(response.json["items"][0]["last_commented_at"], str)
+
+    def test_get_all_tasks_invalid_sort_by(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="sort_by=title")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
@@ -0,0 +1,72 @@
+import time
+from datetime import datetime, timedelta
+
+from modules.application.common.base_model import BaseModel
+from modules.application.common.types import PaginationParams
+from modules.task.internal.store.task_model import TaskModel
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_reader import DEFAULT_TASK_SORT_PARAMS
+from modules.task.task_service import TaskService
+from modules.task.types import GetPaginatedTasksParams
+from tests.modules.task.base_test_task import BaseTestTask
+
+
+class TestTaskPaginationBenchmark(BaseTestTask):
+    TASKS_COUNT = 2000
+    PAGE_SIZE = 20
+
+    def setUp(self) -> None:
+        self.account = self.create_test_account()
+        base_time = datetime.now()
+        TaskRepository.collection().insert_many(
+            [
+                TaskModel(
+                    account_id=self.account.id,
+                    description=f"Description {i}",
+                    title=f"Task {i}",
+                    created_at=base_time + timedelta(seconds=i),
+                    updated_at=base_time,
+                ).to_bson()
+                for i in range(self.TASKS_COUNT)
+            ]
+        )
+
+    def _get_page(self, pagination_params: PaginationParams) -> tuple:
+        get_params = GetPaginatedTasksParams(account_id=self.account.id, pagination_params=pagination_params)
+        start = time.perf_counter()
+        result = TaskService.get_paginated_tasks(params=get_params)
+        return result, time.perf_counter() - start
+
+    def _keys_examined(self, filter_query: dict, skip: int) -> int:
+        cursor = BaseModel.apply_sort_params(TaskRepository.collection().find(filter_query), DEFAULT_TASK_SORT_PARAMS)
+        explain = cursor.skip(skip).limit(self.PAGE_SIZE + 1).explain()
+        return explain["executionStats"]["totalKeysExamined"]
+
+    def test_deep_page_keyset_vs_skip_limit(self) -> None:
+        last_page = self.TASKS_COUNT // self.PAGE_SIZE
+        skip = (last_page - 1) * self.PAGE_SIZE
+
+        offset_result, offset_elapsed = self._get_page(PaginationParams(page=last_page, size=self.PAGE_SIZE))
+
+        cursor = None
+        for _ in range(last_page - 1):
+            result, _ = self._get_page(PaginationParams(page=1, size=self.PAGE_SIZE, cursor=cursor))
+            cursor = result.next_cursor
+        assert cursor is not None
+        keyset_result, keyset_elapsed = self._get_page(PaginationParams(page=1, size=self.PAGE_SIZE, cursor=cursor))
+
+        assert [task.id for task in keyset_result.items] == [task.id for task in offset_result.items]
+
+        filter_query = {"account_id": self.account.id, "active": True}
+        offset_keys_examined = self._keys_examined(filter_query, skip)
+        keyset_keys_examined = self._keys_examined(
+            BaseModel.apply_pagination_cursor(filter_query, cursor, DEFAULT_TASK_SORT_PARAMS), 0
+        )
+
+        print(
+            f"page {last_page}: skip/limit {offset_elapsed * 1000:.2f}ms ({offset_keys_examined} keys), "
+            f"keyset {keyset_elapsed * 1000:.2f}ms ({keyset_keys_examined} keys)"
+        )
+
+        assert offset_keys_examined >= skip
+        assert keyset_keys_examined <= 3 * (self.PAGE_SIZE + 1)
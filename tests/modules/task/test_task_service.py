@@ -1,7 +1,20 @@
+import asyncio
+import base64
 from datetime import datetime
-
-from modules.application.common.types import PaginationParams
-from modules.task.errors import TaskNotFoundError
+from typing import Any
+from unittest import mock
+
+from bson import json_util
+from bson.objectid import ObjectId
+from pymongo.collection import Collection
+
+from modules.application.common.types import PaginationParams, TotalCountMode
+from modules.comment.comment_service import CommentService
+from modules.comment.internal.store.comment_repository import CommentRepository
+from modules.comment.types import CreateCommentParams
+from modules.task.errors import TaskBadRequestError, TaskNotFoundError
+from modules.task.internal.store.task_count_repository import TaskCountRepository
+from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.task_service import TaskService
 from modules.task.types import (
     CreateTaskParams,
@@ -11,6 +24,8 @@ from modules.task.types import (
     TaskErrorCode,
     UpdateTaskParams,
 )
+from modules.task.workers.task_count_repair_worker import TASK_COUNT_REPAIR_BATCH_SIZE, TaskCountRepairWorker
+from tests.modules.application.command_counter import count_commands
 from tests.modules.task.base_test_task import BaseTestTask
 
 
@@ -95,6 +110,189 @@ class TestTaskService(BaseTestTask):
         assert result.pagination_params.page == 1
         assert result.pagination_params.size == 1
 
+    def test_get_paginated_tasks_with_cursor(self) -> None:
+        created_tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=5)
+        expected_ids = [task.id for task in reversed(created_tasks)]
+
+        seen_ids = []
+        cursor = None
+        for _ in range(3):
+            pagination_params = PaginationParams(page=1, size=2, offset=0, cursor=cursor)
+            get_params = GetPaginatedTasksParams(account_id=self.account.id, pagination_params=pagination_params)
+            result = TaskService.get_paginated_tasks(params=get_params)
+            seen_ids.extend(task.id for task in result.items)
+            cursor = result.next_cursor
+
+        assert seen_ids == expected_ids
+        assert cursor is None
+
+    def test_get_paginated_tasks_with_invalid_cursor(self) -> None:
+        self.create_test_task(account_id=self.account.id)
+        pagination_params = PaginationParams(page=1, size=2, offset=0, cursor="not-a-cursor")
+        get_params = GetPaginatedTasksParams(account_id=self.account.id, pagination_params=pagination_params)
+
+        with self.assertRaises(TaskBadRequestError) as context:
+            TaskService.get_paginated_tasks(params=get_params)
+
+        assert context.exception.code == TaskErrorCode.BAD_REQUEST
+
+    def test_get_paginated_tasks_with_operator_in_cursor(self) -> None:
+        self.create_test_task(account_id=self.account.id)
+        cursors = [
+            {"sort_by": "created_at", "value": {"$ne": None}, "id": ObjectId()},
+            {"sort_by": "created_at", "value": datetime.now(), "id": {"$ne": None}},
+            {"sort_by": "created_at", "value": "2024-01-01", "id": ObjectId()},
+        ]
+
+        for cursor in cursors:
+            pagination_params = PaginationParams(
+                page=1, size=2, offset=0, cursor=base64.urlsafe_b64encode(json_util.dumps(cursor).encode()).decode()
+            )
+            get_params = GetPaginatedTasksParams(account_id=self.account.id, pagination_params=pagination_params)
+
+            with self.assertRaises(TaskBadRequestError):
+                TaskService.get_paginated_tasks(params=get_params)
+
+    def test_get_paginated_tasks_without_total_count(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        pagination_params = PaginationParams(page=1, size=2, offset=0)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=pagination_params, total_count_mode=TotalCountMode.NONE
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert len(result.items) == 2
+        assert result.total_count is None
+        assert result.total_pages is None
+        assert result.next_cursor is not None
+
+    def test_get_paginated_tasks_with_estimated_total_count(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        pagination_params = PaginationParams(page=1, size=2, offset=0)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=pagination_params, total_count_mode=TotalCountMode.ESTIMATED
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+        assert result.total_count == 3
+        assert result.total_pages == 2
+
+        self.create_test_task(account_id=self.account.id)
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=tasks[0].id))
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=tasks[1].id))
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+        assert result.total_count == 2
+        assert result.total_pages == 1
+
+    def test_estimated_total_count_keeps_tasks_created_while_seeding(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=2, offset=0),
+            total_count_mode=TotalCountMode.ESTIMATED,
+        )
+        count_documents = Collection.count_documents
+
+        def count_documents_then_create_task(collection: Collection, *args: Any, **kwargs: Any) -> int:
+            total_count: int = count_documents(collection, *args, **kwargs)
+            self.create_test_task(account_id=self.account.id)
+            return total_count
+
+        with mock.patch.object(
+            Collection, "count_documents", autospec=True, side_effect=count_documents_then_create_task
+        ):
+            assert TaskService.get_paginated_tasks(params=get_params).total_count == 3
+
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 4
+
+    def test_estimated_total_count_reads_seeded_counter_without_writing(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=2, offset=0),
+            total_count_mode=TotalCountMode.ESTIMATED,
+        )
+        TaskService.get_paginated_tasks(params=get_params)
+
+        operations = count_commands(
+            [TaskRepository, TaskCountRepository], lambda: TaskService.get_paginated_tasks(params=get_params)
+        )
+
+        assert operations == {"find": 2}
+
+    def test_task_count_repair_worker_corrects_drifted_counters(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=2, offset=0),
+            total_count_mode=TotalCountMode.ESTIMATED,
+        )
+        TaskService.get_paginated_tasks(params=get_params)
+        TaskCountRepository.collection().update_one({"account_id": self.account.id}, {"$inc": {"active_task_count": 2}})
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 5
+
+        with mock.patch.object(TASK_COUNT_REPAIR_BATCH_SIZE, "get", return_value=1):
+            asyncio.run(TaskCountRepairWorker.execute())
+
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 3
+
+    def test_get_paginated_tasks_with_comment_stats(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        for i in range(3):
+            CommentService.create_comment(
+                params=CreateCommentParams(account_id=self.account.id, task_id=tasks[0].id, text=f"Comment {i}")
+            )
+        CommentService.create_comment(
+            params=CreateCommentParams(account_id=self.account.id, task_id=tasks[1].id, text="Only comment")
+        )
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=3, offset=0),
+            total_count_mode=TotalCountMode.NONE,
+            include_comment_stats=True,
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        stats_by_task_id = {task.id: task.comment_stats for task in result.items}
+        assert stats_by_task_id[tasks[0].id].comment_count == 3
+        assert stats_by_task_id[tasks[0].id].latest_comment.text == "Comment 2"
+        assert stats_by_task_id[tasks[1].id].comment_count == 1
+        assert stats_by_task_id[tasks[1].id].latest_comment.text == "Only comment"
+        assert stats_by_task_id[tasks[2].id].comment_count == 0
+        assert stats_by_task_id[tasks[2].id].latest_comment is None
+
+    def test_get_paginated_tasks_comment_stats_use_one_aggregation(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=10)
+        for task in tasks:
+            CommentService.create_comment(
+                params=CreateCommentParams(account_id=self.account.id, task_id=task.id, text="Comment")
+            )
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=10, offset=0),
+            total_count_mode=TotalCountMode.NONE,
+            include_comment_stats=True,
+        )
+
+        operations = count_commands(
+            [CommentRepository, TaskRepository], lambda: TaskService.get_paginated_tasks(params=get_params)
+        )
+
+        assert operations == {"find": 1, "aggregate": 1}
+
+    def test_get_paginated_tasks_without_comment_stats(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=PaginationParams(page=1, size=2, offset=0)
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert all(task.comment_stats is None for task in result.items)
+
     def test_update_task(self) -> None:
         created_task = self.create_test_task(
             account_id=self.account.id, title="Original Title", description="Original Description"